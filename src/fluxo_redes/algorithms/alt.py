@@ -0,0 +1,172 @@
+"""ALT: A* com landmarks e desigualdade triangular para consultas repetidas.
+
+Pré-processamento (uma vez por grafo da simulação 2):
+- escolhe k landmarks L;
+- guarda d(L, v) (Dijkstra sobre sucessores a partir de L) e d(v, L)
+  (Dijkstra sobre antecessores a partir de L), ambos via `dijkstra_heap`.
+
+Consulta s -> t: A* com o limite inferior
+    h(v) = max_L max( d(L,t) - d(L,v), d(v,L) - d(t,L) ) <= d(v,t)
+que é consistente, então cada vértice é fechado no máximo uma vez e a busca
+para quando t é fechado. Pares com distância infinita também podam: se L
+alcança v mas não alcança t, v não alcança t (h(v) = inf, v nem entra na fila).
+
+h é calculado só para os vértices que a busca toca (O(k) cada, sobre as
+distâncias de v e de t), então a consulta não paga Θ(kn) antes de começar.
+
+O resultado é um `QueryResult`, com o número de vértices fechados para comparar
+com `dijkstra_query`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import heapq
+
+import numpy as np
+
+from ..representations import Adjacency, neighbors_of
+from .dijkstra_heap import dijkstra_heap
+from .point_to_point import QueryResult, _walk
+
+
+LANDMARK_STRATEGIES = ["farthest", "random"]
+
+
+@dataclass
+class ALTIndex:
+    landmarks: List[int]
+    forward: np.ndarray   # forward[i, v] = d(L_i, v)
+    backward: np.ndarray  # backward[i, v] = d(v, L_i)
+    # as mesmas distâncias com uma linha contígua por vértice, para h(v) em O(k)
+    forward_by_vertex: np.ndarray = field(init=False, repr=False, compare=False)
+    backward_by_vertex: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.forward_by_vertex = np.ascontiguousarray(self.forward.T)
+        self.backward_by_vertex = np.ascontiguousarray(self.backward.T)
+
+    def lower_bound(self, v: int, target: int) -> float:
+        """h(v) em relação a target, em O(k): só as distâncias de v e de target."""
+        return _lower_bound(
+            self.forward_by_vertex[target].tolist(),
+            self.backward_by_vertex[target].tolist(),
+            self.forward_by_vertex[v].tolist(),
+            self.backward_by_vertex[v].tolist(),
+        )
+
+
+def _lower_bound(f_t: List[float], b_t: List[float], f_v: List[float], b_v: List[float]) -> float:
+    """max(0, max_L max(d(L,t) - d(L,v), d(v,L) - d(t,L))); nan (inf - inf) nunca vence a comparação."""
+    best = 0.0
+    for ft, fv, bv, bt in zip(f_t, f_v, b_v, b_t):
+        a = ft - fv
+        if a > best:
+            best = a
+        b = bv - bt
+        if b > best:
+            best = b
+    return best
+
+
+def build_alt_index(
+    successors: Adjacency,
+    predecessors: Adjacency,
+    k: int = 8,
+    strategy: str = "farthest",
+    seed: int = 0,
+) -> ALTIndex:
+    """Escolhe k landmarks e calcula as distâncias de/para cada um.
+
+    strategy="farthest": o primeiro landmark é sorteado; cada seguinte é o
+    vértice mais distante (d(L, v) mínimo sobre os já escolhidos) — vértices
+    inalcançáveis por todos entram primeiro, pois cobrem regiões sem limite.
+    strategy="random": k vértices distintos sorteados com `seed`.
+    """
+    n = len(successors)
+    if not 1 <= k <= n:
+        raise ValueError(f"k deve estar em 1..{n}")
+    if strategy not in LANDMARK_STRATEGIES:
+        raise ValueError(f"estratégia de landmarks desconhecida: {strategy}")
+
+    rng = np.random.default_rng(seed)
+    forward = np.empty((k, n), dtype=float)
+    backward = np.empty((k, n), dtype=float)
+
+    if strategy == "random":
+        landmarks = [int(x) for x in rng.choice(n, size=k, replace=False)]
+    else:
+        landmarks = [int(rng.integers(n))]
+
+    closest = np.full(n, np.inf)
+    for i in range(k):
+        if i == len(landmarks):
+            score = closest.copy()
+            score[landmarks] = -np.inf
+            landmarks.append(int(np.argmax(score)))
+        L = landmarks[i]
+        d_f, _, _ = dijkstra_heap(successors, root=L)
+        d_b, _, _ = dijkstra_heap(predecessors, root=L)
+        forward[i] = d_f
+        backward[i] = d_b
+        closest = np.minimum(closest, forward[i])
+
+    return ALTIndex(landmarks=landmarks, forward=forward, backward=backward)
+
+
+def alt_query(
+    index: ALTIndex,
+    successors: Adjacency,
+    source: int,
+    target: int,
+) -> QueryResult:
+    """A* de source a target guiado pelos limites inferiores do índice."""
+    INF = float("inf")
+    result = QueryResult(source=source, target=target)
+    # h só é calculado para os vértices que a busca toca (O(k) cada), não para todo v
+    f_t = index.forward_by_vertex[target].tolist()
+    b_t = index.backward_by_vertex[target].tolist()
+    fwd, bwd = index.forward_by_vertex, index.backward_by_vertex
+    h: Dict[int, float] = {}
+    neighbors = neighbors_of(successors)
+
+    def bound(v: int) -> float:
+        h_v = h.get(v)
+        if h_v is None:
+            h_v = h[v] = _lower_bound(f_t, b_t, fwd[v].tolist(), bwd[v].tolist())
+        return h_v
+
+    if bound(source) == INF:
+        return result
+
+    dist: Dict[int, float] = {source: 0.0}
+    pred: Dict[int, Optional[int]] = {source: None}
+    settled = set()
+    heap = [(h[source], source)]
+
+    while heap:
+        _, u = heapq.heappop(heap)
+        if u in settled:
+            continue
+        settled.add(u)
+        d_u = dist[u]
+        if u == target:
+            result.distance = d_u
+            result.path = _walk(pred, target)[::-1]
+            break
+        for v, w in neighbors(u):
+            if w < 0:
+                raise ValueError("Dijkstra requer pesos não-negativos")
+            h_v = bound(v)
+            if h_v == INF:
+                continue
+            nd = d_u + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd + h_v, v))
+                result.relaxations += 1
+
+    result.settled = len(settled)
+    return result
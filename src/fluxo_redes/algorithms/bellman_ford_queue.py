@@ -0,0 +1,81 @@
+"""Bellman-Ford com fila (SPFA) para uma única origem.
+
+Alternativa à simulação 3 quando só interessa a primeira linha da matriz
+de Floyd (caminhos mínimos a partir de X1):
+- Grafo direcionado com circuitos e custos negativos
+- Representação: lista de sucessores
+- Complexidade O(n*m) no pior caso e memória O(n + m), em vez de O(n^3) / O(n^2)
+
+Só vértices cuja distância melhorou entram na fila, e o algoritmo termina
+assim que a fila esvazia (terminação antecipada). Ciclos negativos alcançáveis
+a partir da raiz são detectados pelo número de arcos do caminho corrente: um
+caminho mínimo simples tem no máximo n-1 arcos.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ..representations import Adjacency, neighbors_of
+
+
+@dataclass
+class SPFAStats:
+    relaxations: int = 0
+    queue_push: int = 0
+    queue_pop: int = 0
+    negative_cycle: bool = False
+
+
+def bellman_ford_spfa(
+    successors: Adjacency,
+    root: int = 0,
+) -> tuple[list[float], list[Optional[int]], SPFAStats]:
+    """Retorna distâncias e predecessores do caminho mínimo a partir de root.
+
+    successors[u] = lista de (v, w(u,v)); aceita também um CSRGraph (`to_csr`).
+
+    Se v for inalcançável, d(v)=inf e pred[v]=None. Se existir ciclo negativo
+    alcançável a partir de root, stats.negative_cycle=True e a busca é
+    interrompida (as distâncias devolvidas não são caminhos mínimos).
+    """
+    n = len(successors)
+    INF = float("inf")
+    neighbors = neighbors_of(successors)
+
+    dist = [INF] * n
+    pred: List[Optional[int]] = [None] * n
+    hops = [0] * n
+    in_queue = [False] * n
+    dist[root] = 0.0
+
+    stats = SPFAStats()
+
+    queue = deque([root])
+    in_queue[root] = True
+    stats.queue_push += 1
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        stats.queue_pop += 1
+        d_u = dist[u]
+
+        for v, w in neighbors(u):
+            nd = d_u + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                hops[v] = hops[u] + 1
+                stats.relaxations += 1
+                if hops[v] >= n:
+                    stats.negative_cycle = True
+                    return dist, pred, stats
+                if not in_queue[v]:
+                    queue.append(v)
+                    in_queue[v] = True
+                    stats.queue_push += 1
+
+    return dist, pred, stats
@@ -0,0 +1,317 @@
+"""Contraction hierarchies (CH) para consultas repetidas em grafos estáticos.
+
+Pré-processamento (offline, uma vez por grafo com custos não-negativos):
+- os vértices são contraídos um a um na ordem dada por uma prioridade
+  (diferença de arestas + vizinhos já contraídos, atualizada preguiçosamente);
+- ao contrair v, para cada par u -> v -> w ainda não contraído, uma busca de
+  testemunha (Dijkstra local a partir de u, sem passar por v) decide se o
+  atalho u -> w com custo w(u,v) + w(v,w) é necessário;
+- rank[v] é a posição de v na ordem de contração.
+
+O índice guarda dois grafos "para cima" em CSR:
+- up[u]: arcos u -> v (originais ou atalhos) com rank[v] > rank[u];
+- down[v]: arcos u -> v com rank[u] > rank[v], armazenados em v (busca reversa).
+mid[e] é o vértice contraído que o atalho e substitui (-1 para arcos originais),
+usado para desempacotar o caminho.
+
+Consulta s -> t: Dijkstra bidirecional só sobre up (a partir de s) e down
+(a partir de t). O caminho mínimo sobe até o vértice de maior rank e desce,
+então d(s,t) = min_v df(v) + db(v).
+
+A busca de testemunha é limitada (`witness_settle_limit`); quando o limite é
+atingido o atalho é criado mesmo que talvez seja redundante, o que nunca
+compromete a correção.
+
+`save_ch` / `load_ch` gravam e leem o índice em um .npz, sem recomputação.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import heapq
+
+import numpy as np
+
+from ..representations import Adjacency, CSRGraph, neighbors_of
+from .point_to_point import QueryResult, _walk
+
+
+@dataclass
+class CHStats:
+    shortcuts: int = 0
+    witness_searches: int = 0
+    witness_settled: int = 0
+    priority_updates: int = 0
+
+
+@dataclass
+class CHIndex:
+    rank: np.ndarray
+    up: CSRGraph
+    up_mid: np.ndarray
+    down: CSRGraph
+    down_mid: np.ndarray
+    shortcuts: int = 0
+    _mids: Optional[Dict[Tuple[int, int], int]] = field(default=None, repr=False, compare=False)
+    _lists: Optional[tuple] = field(default=None, repr=False, compare=False)
+
+    @property
+    def n(self) -> int:
+        return int(self.rank.size)
+
+    def adjacency_lists(self) -> tuple[List[List[Tuple[int, float]]], List[List[Tuple[int, float]]]]:
+        """(up, down) como listas Python, montadas uma vez para as consultas."""
+        if self._lists is None:
+            self._lists = (list(self.up), list(self.down))
+        return self._lists
+
+    def _mid_lookup(self) -> Dict[Tuple[int, int], int]:
+        """(u, v) -> vértice do meio do arco u -> v no índice (-1 se original)."""
+        if self._mids is None:
+            mids: Dict[Tuple[int, int], int] = {}
+            for g, mid, upward in ((self.up, self.up_mid, True), (self.down, self.down_mid, False)):
+                rows = np.repeat(np.arange(g.n), g.degrees())
+                for a, b, x in zip(rows.tolist(), g.indices.tolist(), mid.tolist()):
+                    mids[(a, b) if upward else (b, a)] = x
+            self._mids = mids
+        return self._mids
+
+    def unpack(self, path: List[int]) -> List[int]:
+        """Substitui recursivamente cada atalho do caminho pelos dois arcos que ele representa."""
+        mids = self._mid_lookup()
+        out = [path[0]]
+        stack = [(a, b) for a, b in zip(path[::-1][1:], path[::-1][:-1])]
+        while stack:
+            a, b = stack.pop()
+            x = mids[(a, b)]
+            if x < 0:
+                out.append(b)
+            else:
+                stack.append((x, b))
+                stack.append((a, x))
+        return out
+
+
+class _Contractor:
+    """Grafo de trabalho da contração: out/in como dicionários v -> (custo, meio)."""
+
+    def __init__(self, successors: Adjacency, witness_settle_limit: int, stats: CHStats):
+        n = len(successors)
+        self.n = n
+        self.out: List[Dict[int, Tuple[float, int]]] = [dict() for _ in range(n)]
+        self.inc: List[Dict[int, Tuple[float, int]]] = [dict() for _ in range(n)]
+        neighbors = neighbors_of(successors)
+        for u in range(n):
+            for v, w in neighbors(u):
+                if w < 0:
+                    raise ValueError("Contraction hierarchies requer custos não-negativos")
+                if u == v:
+                    continue
+                w = float(w)
+                if w < self.out[u].get(v, (float("inf"), -1))[0]:
+                    self.out[u][v] = (w, -1)
+                    self.inc[v][u] = (w, -1)
+        self.contracted = [False] * n
+        self.contracted_neighbours = [0] * n
+        self.limit = witness_settle_limit
+        self.stats = stats
+
+    def _witness(self, u: int, skip: int, targets: Dict[int, float], max_cost: float) -> Dict[int, float]:
+        """Dijkstra local a partir de u, sem passar por skip, até max_cost ou o limite de fechados."""
+        self.stats.witness_searches += 1
+        dist = {u: 0.0}
+        heap = [(0.0, u)]
+        done = set()
+        remaining = len(targets)
+        while heap and len(done) < self.limit:
+            d_x, x = heapq.heappop(heap)
+            if x in done:
+                continue
+            if d_x > max_cost:
+                break
+            done.add(x)
+            if x in targets:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            for y, (w, _) in self.out[x].items():
+                if y == skip or self.contracted[y]:
+                    continue
+                nd = d_x + w
+                if nd < dist.get(y, float("inf")):
+                    dist[y] = nd
+                    heapq.heappush(heap, (nd, y))
+        self.stats.witness_settled += len(done)
+        return dist
+
+    def shortcuts_for(self, v: int) -> List[Tuple[int, int, float]]:
+        """Atalhos (u, w, custo) necessários para contrair v."""
+        result = []
+        outs = {w: c for w, (c, _) in self.out[v].items() if not self.contracted[w]}
+        if not outs:
+            return result
+        for u, (c_uv, _) in self.inc[v].items():
+            if self.contracted[u]:
+                continue
+            targets = {w: c_uv + c_vw for w, c_vw in outs.items() if w != u}
+            if not targets:
+                continue
+            dist = self._witness(u, v, targets, max(targets.values()))
+            for w, cost in targets.items():
+                if dist.get(w, float("inf")) > cost:
+                    result.append((u, w, cost))
+        return result
+
+    def priority(self, v: int) -> tuple[int, List[Tuple[int, int, float]]]:
+        """Diferença de arestas + vizinhos contraídos, e os atalhos calculados para obtê-la."""
+        shortcuts = self.shortcuts_for(v)
+        degree = sum(1 for u in self.inc[v] if not self.contracted[u]) + sum(
+            1 for w in self.out[v] if not self.contracted[w]
+        )
+        return len(shortcuts) - degree + self.contracted_neighbours[v], shortcuts
+
+    def contract(self, v: int, shortcuts: List[Tuple[int, int, float]]) -> None:
+        for u, w, cost in shortcuts:
+            if cost < self.out[u].get(w, (float("inf"), -1))[0]:
+                if w not in self.out[u]:
+                    self.stats.shortcuts += 1
+                self.out[u][w] = (cost, v)
+                self.inc[w][u] = (cost, v)
+        self.contracted[v] = True
+        for x in set(self.out[v]) | set(self.inc[v]):
+            self.contracted_neighbours[x] += 1
+
+
+def _csr_from_rows(rows: List[List[Tuple[int, float, int]]]) -> tuple[CSRGraph, np.ndarray]:
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(r) for r in rows], out=indptr[1:])
+    flat = [e for r in rows for e in r]
+    indices = np.array([e[0] for e in flat], dtype=np.int32)
+    weights = np.array([e[1] for e in flat], dtype=np.float64)
+    mid = np.array([e[2] for e in flat], dtype=np.int32)
+    return CSRGraph(indptr=indptr, indices=indices, weights=weights), mid
+
+
+def build_ch(
+    successors: Adjacency,
+    witness_settle_limit: int = 64,
+) -> tuple[CHIndex, CHStats]:
+    """Contrai todos os vértices e devolve o índice CH e as estatísticas da construção.
+
+    successors[u] = lista de (v, w(u,v)); aceita também um CSRGraph (`to_csr`).
+    """
+    stats = CHStats()
+    g = _Contractor(successors, witness_settle_limit, stats)
+    n = g.n
+
+    heap = [(g.priority(v)[0], v) for v in range(n)]
+    heapq.heapify(heap)
+
+    rank = np.empty(n, dtype=np.int64)
+    up_rows: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+    down_rows: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+
+    order = 0
+    while heap:
+        _, v = heapq.heappop(heap)
+        # atualização preguiçosa: recalcula e só contrai se continuar o mínimo
+        p, shortcuts = g.priority(v)
+        stats.priority_updates += 1
+        if heap and p > heap[0][0]:
+            heapq.heappush(heap, (p, v))
+            continue
+
+        # arcos restantes de v ligam vértices de rank maior: vão para o índice
+        for w, (c, mid) in g.out[v].items():
+            if not g.contracted[w]:
+                up_rows[v].append((w, c, mid))
+        for u, (c, mid) in g.inc[v].items():
+            if not g.contracted[u]:
+                down_rows[v].append((u, c, mid))
+
+        g.contract(v, shortcuts)
+        rank[v] = order
+        order += 1
+
+    up, up_mid = _csr_from_rows(up_rows)
+    down, down_mid = _csr_from_rows(down_rows)
+    index = CHIndex(rank=rank, up=up, up_mid=up_mid, down=down, down_mid=down_mid, shortcuts=stats.shortcuts)
+    return index, stats
+
+
+def ch_query(index: CHIndex, source: int, target: int) -> QueryResult:
+    """Consulta s -> t por busca bidirecional para cima no índice CH."""
+    INF = float("inf")
+    result = QueryResult(source=source, target=target)
+
+    dist = ({source: 0.0}, {target: 0.0})
+    pred: tuple[Dict[int, Optional[int]], Dict[int, Optional[int]]] = ({source: None}, {target: None})
+    settled = (set(), set())
+    heaps = ([(0.0, source)], [(0.0, target)])
+    graphs = index.adjacency_lists()
+
+    mu = INF if source != target else 0.0
+    meet: Optional[int] = source if source == target else None
+
+    while heaps[0] or heaps[1]:
+        # cada lado para quando seu topo já não melhora mu
+        tops = [h[0][0] if h else INF for h in heaps]
+        if min(tops) >= mu:
+            break
+        side = 0 if tops[0] <= tops[1] else 1
+        d_u, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        d_o = dist[1 - side].get(u)
+        if d_o is not None and d_u + d_o < mu:
+            mu = d_u + d_o
+            meet = u
+
+        dist_s, pred_s = dist[side], pred[side]
+        for v, w in graphs[side][u]:
+            nd = d_u + w
+            if nd < dist_s.get(v, INF):
+                dist_s[v] = nd
+                pred_s[v] = u
+                heapq.heappush(heaps[side], (nd, v))
+                result.relaxations += 1
+
+    result.settled = len(settled[0]) + len(settled[1])
+    if meet is not None:
+        result.distance = mu
+        path = _walk(pred[0], meet)[::-1] + _walk(pred[1], meet)[1:]
+        result.path = index.unpack(path)
+    return result
+
+
+def save_ch(index: CHIndex, path: str) -> None:
+    """Grava o índice em um arquivo .npz."""
+    np.savez_compressed(
+        path,
+        rank=index.rank,
+        up_indptr=index.up.indptr,
+        up_indices=index.up.indices,
+        up_weights=index.up.weights,
+        up_mid=index.up_mid,
+        down_indptr=index.down.indptr,
+        down_indices=index.down.indices,
+        down_weights=index.down.weights,
+        down_mid=index.down_mid,
+        shortcuts=np.array(index.shortcuts),
+    )
+
+
+def load_ch(path: str) -> CHIndex:
+    """Lê um índice gravado por `save_ch`."""
+    with np.load(path) as z:
+        return CHIndex(
+            rank=z["rank"],
+            up=CSRGraph(indptr=z["up_indptr"], indices=z["up_indices"], weights=z["up_weights"]),
+            up_mid=z["up_mid"],
+            down=CSRGraph(indptr=z["down_indptr"], indices=z["down_indices"], weights=z["down_weights"]),
+            down_mid=z["down_mid"],
+            shortcuts=int(z["shortcuts"]),
+        )
@@ -0,0 +1,194 @@
+"""Delta-stepping para caminhos mínimos de uma origem com custos não-negativos.
+
+Alternativa paralelizável ao `dijkstra_heap` na simulação 2 (Meyer & Sanders):
+- o balde i contém os vértices com distância provisória em [i*Δ, (i+1)*Δ);
+- arcos leves (w <= Δ) podem reinserir vértices no balde corrente, então são
+  relaxados em fases até o balde esvaziar;
+- arcos pesados (w > Δ) só alcançam baldes seguintes e são relaxados uma vez,
+  a partir de todos os vértices que passaram pelo balde.
+
+Cada fase relaxa de uma vez todos os arcos (leves ou pesados) de um conjunto
+de vértices sobre um CSR: os candidatos dist[u] + w são reduzidos por destino
+com `np.minimum.at` (menor candidato por vértice). Com workers > 1, os arcos
+da fase são divididos em fatias reduzidas em paralelo por um
+ThreadPoolExecutor e os mínimos parciais são combinados. O conjunto de
+vértices em aberto e os vetores auxiliares são atualizados só nas posições
+tocadas, então cada balde custa O(vértices em aberto + arcos relaxados), e
+não O(n).
+
+Δ = custo máximo dividido pelo grau médio (heurística clássica para custos
+uniformes), limitado inferiormente pelo menor custo positivo. Δ pequeno
+aproxima Dijkstra (muitos baldes, pouco trabalho extra); Δ grande aproxima
+Bellman-Ford (poucas fases, mais relaxações repetidas).
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from ..representations import Adjacency, CSRGraph, as_csr
+from .bellman_divide_conquer import _segment_positions
+
+
+# abaixo deste número de arcos uma fase não é dividida entre workers
+PARALLEL_MIN_ARCS = 1 << 15
+
+
+@dataclass
+class DeltaSteppingStats:
+    delta: float = 0.0
+    buckets: int = 0
+    phases: int = 0
+    light_relaxations: int = 0
+    heavy_relaxations: int = 0
+
+
+def default_delta(g: CSRGraph) -> float:
+    """Δ = w_max / grau médio, no mínimo o menor custo positivo."""
+    w = g.weights
+    positive = w[w > 0]
+    if positive.size == 0:
+        return 1.0
+    avg_degree = max(g.m / max(g.n, 1), 1.0)
+    return float(max(positive.max() / avg_degree, positive.min()))
+
+
+def _relax(
+    g: CSRGraph,
+    mask: np.ndarray,
+    dist: np.ndarray,
+    pred: np.ndarray,
+    nodes: np.ndarray,
+    scratch: List[np.ndarray],
+    pool: Optional[ThreadPoolExecutor],
+) -> tuple[np.ndarray, int]:
+    """Relaxa os arcos de nodes selecionados por mask; devolve (vértices melhorados, arcos relaxados).
+
+    scratch: um vetor de n posições (todo inf) por worker, onde o menor candidato
+    de cada destino é reduzido com `np.minimum.at`; só as posições tocadas são
+    lidas e voltam a inf, então a fase custa O(arcos) e não O(n).
+    """
+    pos, lens = _segment_positions(g.indptr, nodes)
+    keep = mask[pos]
+    pos = pos[keep]
+    if pos.size == 0:
+        return pos, 0
+    src = np.repeat(nodes, lens)[keep]
+    tgt = g.indices[pos]
+    cand = dist[src] + g.weights[pos]
+    touched = np.unique(tgt)
+
+    best = scratch[0]
+    if pool is not None and pos.size >= PARALLEL_MIN_ARCS:
+        bounds = np.linspace(0, pos.size, len(scratch) + 1).astype(np.int64)
+        list(pool.map(
+            lambda i: np.minimum.at(scratch[i], tgt[bounds[i]:bounds[i + 1]], cand[bounds[i]:bounds[i + 1]]),
+            range(len(scratch)),
+        ))
+        best[touched] = np.minimum.reduce([part[touched] for part in scratch])
+        for part in scratch[1:]:
+            part[touched] = np.inf
+    else:
+        np.minimum.at(best, tgt, cand)
+
+    # arcos vencedores: atingem o mínimo do destino e melhoram dist
+    win = (cand == best[tgt]) & (cand < dist[tgt])
+    pred[tgt[win]] = src[win]
+    best_t = best[touched]
+    best[touched] = np.inf
+    better = best_t < dist[touched]
+    improved = touched[better]
+    dist[improved] = best_t[better]
+    return improved, int(pos.size)
+
+
+def delta_stepping(
+    successors: Adjacency,
+    root: int = 0,
+    delta: Optional[float] = None,
+    workers: int = 1,
+) -> tuple[list[float], list[Optional[int]], DeltaSteppingStats]:
+    """Mesmo contrato de `dijkstra_heap`: (dist, pred, stats).
+
+    successors[u] = lista de (v, w(u,v)) ou CSRGraph (`to_csr`); listas são
+    convertidas com `as_csr`. delta=None usa `default_delta`.
+    As distâncias coincidem com as do Dijkstra; em empates, o predecessor pode
+    ser outro vértice que atinge a mesma distância.
+    """
+    if workers < 1:
+        raise ValueError("workers deve ser >= 1")
+    g = as_csr(successors)
+    if np.any(g.weights < 0):
+        raise ValueError("Dijkstra requer pesos não-negativos")
+    if delta is None:
+        delta = default_delta(g)
+    if delta <= 0:
+        raise ValueError("delta deve ser > 0")
+
+    n = g.n
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    settled = np.zeros(n, dtype=bool)
+    dist[root] = 0.0
+
+    stats = DeltaSteppingStats(delta=float(delta))
+    light = g.weights <= delta
+    heavy = ~light
+
+    # vértices em aberto (dist finita, não fechados), mantidos incrementalmente:
+    # cada balde filtra os fechados e acrescenta os alcançados pela primeira vez
+    open_ = np.array([root], dtype=np.int64)
+    in_open = np.zeros(n, dtype=bool)
+    in_open[root] = True
+    removed = np.zeros(n, dtype=bool)
+    scratch = [np.full(n, np.inf) for _ in range(workers)]
+
+    def reached(improved: np.ndarray, new: List[np.ndarray]) -> None:
+        fresh = improved[~in_open[improved]]
+        in_open[fresh] = True
+        new.append(fresh)
+
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while open_.size:
+            # pula baldes vazios: o próximo é o da menor distância em aberto
+            d_min = dist[open_].min()
+            upper = (np.floor(d_min / delta) + 1) * delta
+            if upper <= d_min:  # arredondamento de ponto flutuante
+                upper = np.nextafter(d_min, np.inf)
+            stats.buckets += 1
+
+            # em ordem de vértice, como antes: o desempate do predecessor não muda
+            frontier = np.sort(open_[dist[open_] < upper])
+            new: List[np.ndarray] = []
+            done_parts: List[np.ndarray] = []
+            while frontier.size:
+                stats.phases += 1
+                fresh = frontier[~removed[frontier]]
+                removed[fresh] = True
+                done_parts.append(fresh)
+                improved, k = _relax(g, light, dist, pred, frontier, scratch, pool)
+                stats.light_relaxations += k
+                reached(improved, new)
+                # arcos leves podem reinserir vértices no balde corrente
+                frontier = improved[dist[improved] < upper]
+
+            done = np.sort(np.concatenate(done_parts))
+            improved, k = _relax(g, heavy, dist, pred, done, scratch, pool)
+            stats.heavy_relaxations += k
+            reached(improved, new)
+            removed[done] = False
+            settled[done] = True
+            in_open[done] = False
+            open_ = np.concatenate([open_] + new)
+            open_ = open_[~settled[open_]]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    pred_list: List[Optional[int]] = [int(p) if p >= 0 else None for p in pred]
+    return dist.tolist(), pred_list, stats
@@ -0,0 +1,204 @@
+"""Dijkstra com filas de baldes para custos inteiros não-negativos.
+
+Os geradores de `graph_generators` sorteiam custos inteiros pequenos
+(1..30 em `generate_cyclic_nonnegative`). Com custos inteiros em [0, C],
+filas monótonas de baldes evitam as comparações do heap:
+
+- `dijkstra_dial`: algoritmo de Dial, C+1 baldes circulares indexados por
+  distância; O(m + n*C).
+- `dijkstra_radix`: radix heap; o balde de uma chave k é o bit mais alto em
+  que k difere da última chave removida. Cada entrada só desce de balde, então
+  o custo é O(m + n*log(n*C)).
+
+`dijkstra_integer` escolhe automaticamente: Dial se todos os custos forem
+inteiros não-negativos com C <= DIAL_MAX_WEIGHT, radix heap se forem inteiros
+com C maior e `dijkstra_heap` caso contrário.
+
+Ambas usam remoção preguiçosa: entradas obsoletas ficam no balde e são
+descartadas no pop (contadas em stats.stale_pops).
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import List, Optional
+
+import numpy as np
+
+from ..representations import Adjacency, CSRGraph, neighbors_of
+from .dijkstra_heap import DijkstraStats, dijkstra_heap
+
+
+DIAL_MAX_WEIGHT = 1024
+
+
+def integer_weight_bound(successors: Adjacency) -> Optional[int]:
+    """C = maior custo se todos os custos forem inteiros não-negativos; None caso contrário."""
+    if isinstance(successors, CSRGraph):
+        w = successors.weights
+    else:
+        flat = np.fromiter(chain.from_iterable(chain.from_iterable(successors)), dtype=np.float64)
+        w = flat[1::2]
+    if w.size == 0:
+        return 0
+    if np.any(w < 0) or np.any(w != np.floor(w)):
+        return None
+    return int(w.max())
+
+
+def dijkstra_dial(
+    successors: Adjacency,
+    root: int = 0,
+    max_weight: Optional[int] = None,
+) -> tuple[list[float], list[Optional[int]], DijkstraStats]:
+    """Dijkstra com os C+1 baldes circulares de Dial.
+
+    max_weight é o maior custo C; se omitido, é calculado (e validado) a partir do grafo.
+    """
+    if max_weight is None:
+        max_weight = integer_weight_bound(successors)
+        if max_weight is None:
+            raise ValueError("Dial requer custos inteiros não-negativos")
+
+    n = len(successors)
+    INF = float("inf")
+    n_buckets = max_weight + 1
+    neighbors = neighbors_of(successors)
+
+    dist = [INF] * n
+    prev: List[Optional[int]] = [None] * n
+    visited = [False] * n
+    dist[root] = 0.0
+
+    stats = DijkstraStats()
+
+    buckets: List[List[int]] = [[] for _ in range(n_buckets)]
+    buckets[0].append(root)
+    stats.heap_push += 1
+    pending = 1
+    cur = 0
+
+    while pending:
+        bucket = buckets[cur % n_buckets]
+        while not bucket:
+            cur += 1
+            stats.bucket_scans += 1
+            bucket = buckets[cur % n_buckets]
+        u = bucket.pop()
+        pending -= 1
+        stats.heap_pop += 1
+
+        # chaves pendentes estão em [cur, cur + C]: o balde só contém a chave cur
+        if visited[u] or dist[u] != cur:
+            stats.stale_pops += 1
+            continue
+        visited[u] = True
+        d_u = dist[u]
+
+        for v, w in neighbors(u):
+            if w < 0:
+                raise ValueError("Dijkstra requer pesos não-negativos")
+            nd = d_u + w
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                buckets[int(nd) % n_buckets].append(v)
+                pending += 1
+                stats.heap_push += 1
+                stats.relaxations += 1
+
+    return dist, prev, stats
+
+
+def dijkstra_radix(
+    successors: Adjacency,
+    root: int = 0,
+) -> tuple[list[float], list[Optional[int]], DijkstraStats]:
+    """Dijkstra com radix heap (chaves inteiras monótonas)."""
+    if integer_weight_bound(successors) is None:
+        raise ValueError("Radix heap requer custos inteiros não-negativos")
+
+    n = len(successors)
+    INF = float("inf")
+    neighbors = neighbors_of(successors)
+
+    dist = [INF] * n
+    prev: List[Optional[int]] = [None] * n
+    visited = [False] * n
+    dist[root] = 0.0
+
+    stats = DijkstraStats()
+
+    # balde 0: chave == last; balde i: bit mais alto de (chave ^ last) é i-1
+    buckets: List[List[tuple[int, int]]] = [[(0, root)]]
+    stats.heap_push += 1
+    pending = 1
+    last = 0
+
+    while pending:
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+                stats.bucket_scans += 1
+            items = buckets[i]
+            buckets[i] = []
+            last = min(k for (k, _) in items)
+            for (k, v) in items:
+                buckets[(k ^ last).bit_length()].append((k, v))
+            stats.bucket_moves += len(items)
+
+        k_u, u = buckets[0].pop()
+        pending -= 1
+        stats.heap_pop += 1
+
+        if visited[u] or dist[u] != k_u:
+            stats.stale_pops += 1
+            continue
+        visited[u] = True
+
+        for v, w in neighbors(u):
+            if w < 0:
+                raise ValueError("Dijkstra requer pesos não-negativos")
+            nd = k_u + w
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                k_v = int(nd)
+                b = (k_v ^ last).bit_length()
+                while len(buckets) <= b:
+                    buckets.append([])
+                buckets[b].append((k_v, v))
+                pending += 1
+                stats.heap_push += 1
+                stats.relaxations += 1
+
+    dist = [float(d) for d in dist]
+    return dist, prev, stats
+
+
+def _engine_for_bound(c: Optional[int]) -> str:
+    if c is None:
+        return "heap"
+    if c <= DIAL_MAX_WEIGHT:
+        return "dial"
+    return "radix"
+
+
+def select_integer_engine(successors: Adjacency) -> str:
+    """"dial", "radix" ou "heap", conforme os custos do grafo."""
+    return _engine_for_bound(integer_weight_bound(successors))
+
+
+def dijkstra_integer(
+    successors: Adjacency,
+    root: int = 0,
+) -> tuple[list[float], list[Optional[int]], DijkstraStats]:
+    """Escolhe Dial, radix heap ou `dijkstra_heap` conforme os custos (ver `select_integer_engine`)."""
+    c = integer_weight_bound(successors)
+    engine = _engine_for_bound(c)
+    if engine == "dial":
+        return dijkstra_dial(successors, root=root, max_weight=c)
+    if engine == "radix":
+        return dijkstra_radix(successors, root=root)
+    return dijkstra_heap(successors, root=root)
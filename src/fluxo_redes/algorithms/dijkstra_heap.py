@@ -6,6 +6,12 @@ Enunciado da simulação 2:
 - Implementação: Best-First / busca ordenada com Heap
 
 Esta implementação é a forma canônica do Dijkstra com fila de prioridade.
+
+A fila é selecionável (`queue`):
+- "lazy": `heapq` sem decrease-key, com entradas duplicadas descartadas no pop (padrão)
+- "binary" / "dary": heap binário / d-ário indexado com decrease-key
+- "pairing": pairing heap com decrease-key
+(ver `priority_queues`).
 """
 
 from __future__ import annotations
@@ -14,20 +20,42 @@ from dataclasses import dataclass
 from typing import List, Tuple, Optional
 import heapq
 
+from ..representations import Adjacency, neighbors_of
+from .priority_queues import make_queue
+
 
 @dataclass
 class DijkstraStats:
     relaxations: int = 0
     heap_push: int = 0
     heap_pop: int = 0
+    decrease_key: int = 0
+    stale_pops: int = 0
+    sift_steps: int = 0
+    links: int = 0
+    bucket_scans: int = 0
+    bucket_moves: int = 0
 
 
 def dijkstra_heap(
-    successors: List[List[Tuple[int, float]]],
+    successors: Adjacency,
     root: int = 0,
+    queue: str = "lazy",
+    arity: int = 4,
 ) -> tuple[list[float], list[Optional[int]], DijkstraStats]:
+    """successors[u] = lista de (v, w(u,v)); aceita também um CSRGraph (`to_csr`).
+
+    queue escolhe a fila de prioridade; arity é o grau do heap "dary".
+    DijkstraStats reporta as operações da fila usada: heap_push/heap_pop,
+    decrease_key, stale_pops (entradas obsoletas, só "lazy"), sift_steps
+    (heaps indexados) e links (pairing heap).
+    """
+    if queue != "lazy":
+        return _dijkstra_indexed(successors, root, queue, arity)
+
     n = len(successors)
     INF = float("inf")
+    neighbors = neighbors_of(successors)
 
     dist = [INF] * n
     prev: List[Optional[int]] = [None] * n
@@ -45,13 +73,14 @@ def dijkstra_heap(
         stats.heap_pop += 1
 
         if visited[u]:
+            stats.stale_pops += 1
             continue
         visited[u] = True
 
         if d_u > dist[u]:
             continue
 
-        for v, w in successors[u]:
+        for v, w in neighbors(u):
             if w < 0:
                 raise ValueError("Dijkstra requer pesos não-negativos")
             nd = d_u + w
@@ -63,3 +92,48 @@ def dijkstra_heap(
                 stats.relaxations += 1
 
     return dist, prev, stats
+
+
+def _dijkstra_indexed(
+    successors: Adjacency,
+    root: int,
+    queue: str,
+    arity: int,
+) -> tuple[list[float], list[Optional[int]], DijkstraStats]:
+    """Dijkstra com fila indexada: no máximo uma entrada por vértice."""
+    n = len(successors)
+    INF = float("inf")
+    neighbors = neighbors_of(successors)
+
+    dist = [INF] * n
+    prev: List[Optional[int]] = [None] * n
+    dist[root] = 0.0
+
+    stats = DijkstraStats()
+
+    pq = make_queue(queue, n, arity=arity)
+    pq.push(root, 0.0)
+
+    while len(pq):
+        d_u, u = pq.pop()
+        for v, w in neighbors(u):
+            if w < 0:
+                raise ValueError("Dijkstra requer pesos não-negativos")
+            nd = d_u + w
+            # vértices já fechados nunca melhoram (pesos não-negativos)
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = u
+                stats.relaxations += 1
+                if pq.contains(v):
+                    pq.decrease_key(v, nd)
+                else:
+                    pq.push(v, nd)
+
+    stats.heap_push = pq.pushes
+    stats.heap_pop = pq.pops
+    stats.decrease_key = pq.decrease_keys
+    stats.sift_steps = getattr(pq, "sift_steps", 0)
+    stats.links = getattr(pq, "links", 0)
+
+    return dist, prev, stats
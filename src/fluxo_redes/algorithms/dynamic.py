@@ -0,0 +1,222 @@
+"""Atualização incremental de caminhos mínimos após mudanças em arcos.
+
+Em vez de recalcular tudo a cada arco inserido, removido ou com custo
+alterado, os resultados existentes são reparados (no estilo de Ramalingam &
+Reps):
+
+`DynamicSSSP` mantém (dist, pred) de uma raiz, vindos de `dijkstra_heap`
+(simulação 2) ou de `shortest_paths_bellman_dag_iterative` (simulação 1):
+- inserção / redução de custo de u -> v: se dist[u] + w < dist[v], v melhora e
+  a melhora é propagada por uma busca a partir de v (só vértices que melhoram
+  entram na fila);
+- remoção / aumento de custo de u -> v: só importa se u -> v é arco da árvore
+  (pred[v] == u). A subárvore de v perde o rótulo; cada vértice dela recebe o
+  melhor candidato vindo de antecessores fora da subárvore e a busca é
+  refeita apenas dentro da subárvore.
+A fila é de correção de rótulos (um vértice pode voltar a ela), então custos
+negativos sem ciclo negativo (DAG da simulação 1) também são aceitos.
+
+`floyd_update_edge` atualiza (dist, nxt) do Floyd-Warshall (simulação 3) em
+O(n²) para um arco inserido ou com custo reduzido:
+
+    dist[i, j] = min(dist[i, j], dist[i, u] + w + dist[v, j])
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import heapq
+
+import numpy as np
+
+from ..representations import Adjacency, neighbors_of
+from .floyd_warshall import FloydStats
+
+
+@dataclass
+class DynamicStats:
+    updates: int = 0
+    affected: int = 0
+    relaxations: int = 0
+    heap_push: int = 0
+
+
+# (u, v, w): insere o arco ou troca seu custo; w=None remove o arco
+EdgeUpdate = Tuple[int, int, Optional[float]]
+
+
+class DynamicSSSP:
+    """(dist, pred) de uma raiz mantidos sob atualizações de arcos.
+
+    successors[u] = lista de (v, w(u,v)) (ou CSRGraph) do grafo em que dist e
+    pred foram calculados; arcos paralelos são reduzidos ao de menor custo.
+    dist e pred são copiados; o estado atual fica em `dist` e `pred`.
+    """
+
+    def __init__(
+        self,
+        successors: Adjacency,
+        dist: List[float],
+        pred: List[Optional[int]],
+        root: int = 0,
+    ):
+        n = len(successors)
+        self.n = n
+        self.root = root
+        self.dist = list(dist)
+        self.pred = list(pred)
+        self.out: List[Dict[int, float]] = [dict() for _ in range(n)]
+        self.inc: List[Dict[int, float]] = [dict() for _ in range(n)]
+        neighbors = neighbors_of(successors)
+        for u in range(n):
+            for v, w in neighbors(u):
+                w = float(w)
+                if w < self.out[u].get(v, float("inf")):
+                    self.out[u][v] = w
+                    self.inc[v][u] = w
+        self.children: List[Set[int]] = [set() for _ in range(n)]
+        for v, p in enumerate(self.pred):
+            if p is not None:
+                self.children[p].add(v)
+        self.stats = DynamicStats()
+
+    def _set_pred(self, v: int, p: Optional[int]) -> None:
+        old = self.pred[v]
+        if old is not None:
+            self.children[old].discard(v)
+        if p is not None:
+            self.children[p].add(v)
+        self.pred[v] = p
+
+    def _propagate(self, heap: List[Tuple[float, int]], allowed: Optional[Set[int]] = None) -> None:
+        """Busca com correção de rótulos a partir da fila; com allowed, só relaxa arcos para esses vértices."""
+        pops: Dict[int, int] = {}
+        while heap:
+            d_u, u = heapq.heappop(heap)
+            if d_u > self.dist[u]:
+                continue
+            # sem ciclo negativo, um vértice melhora no máximo n vezes
+            pops[u] = pops.get(u, 0) + 1
+            if pops[u] > self.n:
+                raise ValueError("atualização criou um ciclo negativo")
+            for v, w in self.out[u].items():
+                if allowed is not None and v not in allowed:
+                    continue
+                nd = d_u + w
+                if nd < self.dist[v]:
+                    self.dist[v] = nd
+                    self._set_pred(v, u)
+                    heapq.heappush(heap, (nd, v))
+                    self.stats.heap_push += 1
+                    self.stats.relaxations += 1
+
+    def _decrease(self, u: int, v: int, w: float) -> None:
+        nd = self.dist[u] + w
+        if nd < self.dist[v]:
+            self.dist[v] = nd
+            self._set_pred(v, u)
+            self.stats.affected += 1
+            self.stats.relaxations += 1
+            self._propagate([(nd, v)])
+
+    def _increase(self, v: int) -> None:
+        """Recalcula a subárvore de v depois que o arco pred[v] -> v piorou ou sumiu."""
+        INF = float("inf")
+        subtree = {v}
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            for c in self.children[x]:
+                if c not in subtree:
+                    subtree.add(c)
+                    stack.append(c)
+        self.stats.affected += len(subtree)
+
+        heap: List[Tuple[float, int]] = []
+        for x in subtree:
+            best, arg = INF, None
+            for p, w in self.inc[x].items():
+                if p not in subtree and self.dist[p] + w < best:
+                    best, arg = self.dist[p] + w, p
+            self.dist[x] = best
+            self._set_pred(x, arg)
+            if arg is not None:
+                heap.append((best, x))
+        heapq.heapify(heap)
+        self.stats.heap_push += len(heap)
+        self._propagate(heap, allowed=subtree)
+
+    def update(self, u: int, v: int, w: Optional[float]) -> None:
+        """Insere u -> v com custo w, troca o custo existente, ou remove o arco (w=None).
+
+        Se a atualização criar um ciclo negativo alcançável, levanta ValueError;
+        nesse caso dist/pred ficam inconsistentes e devem ser recalculados.
+        """
+        if not (0 <= u < self.n and 0 <= v < self.n):
+            raise ValueError(f"arco fora do intervalo 0..{self.n - 1}: {u} -> {v}")
+        self.stats.updates += 1
+        old = self.out[u].get(v)
+        if w is None:
+            if old is None:
+                return
+            del self.out[u][v]
+            del self.inc[v][u]
+        else:
+            w = float(w)
+            self.out[u][v] = w
+            self.inc[v][u] = w
+
+        if u == v:
+            if w is not None and w < 0:
+                raise ValueError("atualização criou um ciclo negativo")
+            return
+        if old is not None and self.pred[v] == u and (w is None or w > old):
+            self._increase(v)
+        elif w is not None and (old is None or w < old):
+            self._decrease(u, v, w)
+
+    def apply(self, updates: Iterable[EdgeUpdate]) -> DynamicStats:
+        """Aplica as atualizações em ordem; devolve as estatísticas acumuladas."""
+        for u, v, w in updates:
+            self.update(u, v, w)
+        return self.stats
+
+    def successors(self) -> List[List[Tuple[int, float]]]:
+        """Grafo atual como lista de sucessores (para conferir com um recálculo)."""
+        return [list(d.items()) for d in self.out]
+
+
+def floyd_update_edge(
+    dist: np.ndarray,
+    nxt: np.ndarray,
+    u: int,
+    v: int,
+    w: float,
+) -> FloydStats:
+    """Atualiza (dist, nxt) de `floyd_warshall` no lugar após inserir u -> v ou reduzir seu custo para w.
+
+    Aumentos de custo e remoções não são tratados (exigem recalcular).
+    Se o arco fecha um ciclo negativo (dist[v, u] + w < 0), stats.negative_cycle=True.
+    """
+    n = dist.shape[0]
+    stats = FloydStats(iterations=n * n)
+    if u == v:
+        if w < dist[u, u]:
+            dist[u, u] = w
+            stats.relaxations = 1
+        stats.negative_cycle = bool(np.any(np.diag(dist) < 0))
+        return stats
+
+    cand = dist[:, u, None] + w + dist[None, v, :]
+    improved = cand < dist
+    count = int(np.count_nonzero(improved))
+    if count:
+        # primeiro arco de i -> j passa a ser o primeiro arco de i -> u (u -> v quando i == u)
+        first = nxt[:, u].copy()
+        first[u] = v
+        np.copyto(dist, cand, where=improved)
+        np.copyto(nxt, np.broadcast_to(first[:, None], nxt.shape), where=improved)
+    stats.relaxations = count
+    stats.negative_cycle = bool(np.any(np.diag(dist) < 0))
+    return stats
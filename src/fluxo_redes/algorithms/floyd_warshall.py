@@ -6,15 +6,31 @@ Enunciado da simulação 3:
 - Computar caminho mínimo de X1 para todos os outros pela primeira linha da matriz final
 
 Aqui implementamos a forma clássica O(n^3) com matriz de predecessores para reconstrução.
+
+Engines disponíveis:
+- `floyd_warshall`: laços explícitos em Python (referência)
+- `floyd_warshall_numpy`: relaxa uma fatia k inteira por broadcasting do NumPy
+- `floyd_warshall_batched`: a mesma relaxação por fatia k sobre um tensor
+  (B, n, n) com B grafos de uma vez (varreduras de seeds com n pequeno)
+- `floyd_warshall_blocked`: versão em blocos (tiles), com as fases de cada bloco
+  distribuídas em um pool de threads
+- `floyd_warshall_memmap`: versão em blocos out-of-core, com dist/nxt em
+  arquivos np.memmap e checkpoint por bloco pivô
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 
+from ..representations import CSRGraph, csr_to_cost_matrix
+
 
 @dataclass
 class FloydStats:
@@ -23,14 +39,25 @@ class FloydStats:
     negative_cycle: bool = False
 
 
-def floyd_warshall(cost_matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray, FloydStats]:
+CostInput = Union[np.ndarray, CSRGraph]
+
+
+def _as_cost_matrix(cost_matrix: CostInput) -> np.ndarray:
+    if isinstance(cost_matrix, CSRGraph):
+        return csr_to_cost_matrix(cost_matrix)
+    return cost_matrix
+
+
+def floyd_warshall(cost_matrix: CostInput) -> tuple[np.ndarray, np.ndarray, FloydStats]:
     """Retorna (dist, nxt, stats).
 
     - dist: matriz de distâncias mínimas
     - nxt: matriz de próximos nós para reconstrução de caminho (i->j)
 
     Se não existe caminho i->j, nxt[i,j] = -1.
+    Aceita também os sucessores em CSRGraph (`to_csr`), convertidos para matriz.
     """
+    cost_matrix = _as_cost_matrix(cost_matrix)
     n = cost_matrix.shape[0]
     dist = cost_matrix.astype(float).copy()
 
@@ -64,6 +91,389 @@ def floyd_warshall(cost_matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray, Flo
     return dist, nxt, stats
 
 
+def _init_next_matrix(dist: np.ndarray) -> np.ndarray:
+    """nxt[i,j] = j para todo arco i->j existente (i != j); -1 caso contrário."""
+    n = dist.shape[0]
+    nxt = np.where(np.isfinite(dist), np.arange(n), -1).astype(int)
+    np.fill_diagonal(nxt, -1)
+    return nxt
+
+
+def floyd_warshall_numpy(
+    cost_matrix: CostInput,
+    pivots: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray, FloydStats]:
+    """Mesmo contrato de `floyd_warshall`, vetorizado por fatia k.
+
+    Para cada k, todas as entradas são relaxadas de uma vez:
+
+        cand = dist[:, k, None] + dist[k, None, :]
+
+    Sem ciclos negativos, dist[k,k] = 0, logo a linha e a coluna k não mudam
+    durante a iteração k e a atualização simultânea equivale à dos laços.
+    Os contadores de `FloydStats` seguem a mesma definição da versão com laços.
+
+    pivots restringe os k usados como vértices intermediários (em ordem
+    crescente). Omitir um k sem arcos de entrada ou sem arcos de saída não
+    altera o resultado, pois sua iteração não relaxa nada.
+    """
+    cost_matrix = _as_cost_matrix(cost_matrix)
+    n = cost_matrix.shape[0]
+    dist = cost_matrix.astype(float).copy()
+    nxt = _init_next_matrix(dist)
+
+    stats = FloydStats()
+
+    for k in (range(n) if pivots is None else pivots.tolist()):
+        col_k = dist[:, k].copy()
+        row_k = dist[k, :].copy()
+        stats.iterations += int(np.count_nonzero(np.isfinite(col_k))) * n
+
+        cand = col_k[:, None] + row_k[None, :]
+        improved = cand < dist
+        count = int(np.count_nonzero(improved))
+        if count == 0:
+            continue
+        dist[improved] = cand[improved]
+        # nxt[i,j] <- nxt[i,k] nas posições melhoradas
+        nxt_col_k = nxt[:, k].copy()
+        nxt[improved] = np.broadcast_to(nxt_col_k[:, None], (n, n))[improved]
+        stats.relaxations += count
+
+    stats.negative_cycle = bool(np.any(np.diag(dist) < 0))
+
+    return dist, nxt, stats
+
+
+@dataclass
+class FloydBatchStats:
+    """Contadores de `FloydStats` por grafo do lote (arrays de tamanho B)."""
+
+    iterations: np.ndarray
+    relaxations: np.ndarray
+    negative_cycle: np.ndarray
+
+
+def _floyd_batch_inplace(dist: np.ndarray, nxt: np.ndarray, iterations: np.ndarray, relaxations: np.ndarray) -> None:
+    """Iterações k sobre um sub-lote contíguo, com buffers reaproveitados entre os k."""
+    b, n, _ = dist.shape
+    cand = np.empty_like(dist)
+    improved = np.empty(dist.shape, dtype=bool)
+    for k in range(n):
+        col_k = dist[:, :, k].copy()
+        row_k = dist[:, k, :].copy()
+        iterations += np.count_nonzero(np.isfinite(col_k), axis=1) * n
+
+        np.add(col_k[:, :, None], row_k[:, None, :], out=cand)
+        np.less(cand, dist, out=improved)
+        counts = np.count_nonzero(improved, axis=(1, 2))
+        if not counts.any():
+            continue
+        np.copyto(dist, cand, where=improved)
+        np.copyto(nxt, nxt[:, :, k, None].copy(), where=improved)
+        relaxations += counts
+
+
+def floyd_warshall_batched(
+    cost_matrices: np.ndarray,
+    chunk_bytes: int = 1 << 22,
+) -> tuple[np.ndarray, np.ndarray, FloydBatchStats]:
+    """`floyd_warshall_numpy` aplicado a um lote (B, n, n) de matrizes de custos.
+
+    Cada iteração k relaxa vários grafos em uma única operação:
+
+        cand = dist[:, :, k, None] + dist[:, None, k, :]
+
+    O lote é percorrido em sub-lotes de até chunk_bytes por matriz de
+    distâncias, para que os temporários de cada k caibam em cache.
+
+    dist[b] e nxt[b] são idênticos aos de `floyd_warshall_numpy(cost_matrices[b])`,
+    e stats.negative_cycle[b] indica ciclo negativo no grafo b (diagonal < 0).
+    Use `to_cost_matrices` para montar o tensor a partir das listas de arestas.
+    """
+    if cost_matrices.ndim != 3 or cost_matrices.shape[1] != cost_matrices.shape[2]:
+        raise ValueError("cost_matrices deve ter forma (B, n, n)")
+    B, n, _ = cost_matrices.shape
+    dist = cost_matrices.astype(float).copy()
+    nxt = np.where(np.isfinite(dist), np.arange(n), -1).astype(int)
+    idx = np.arange(n)
+    nxt[:, idx, idx] = -1
+
+    iterations = np.zeros(B, dtype=np.int64)
+    relaxations = np.zeros(B, dtype=np.int64)
+
+    step = max(1, chunk_bytes // max(n * n * dist.itemsize, 1))
+    for lo in range(0, B, step):
+        hi = min(lo + step, B)
+        _floyd_batch_inplace(dist[lo:hi], nxt[lo:hi], iterations[lo:hi], relaxations[lo:hi])
+
+    negative_cycle = np.any(dist[:, idx, idx] < 0, axis=1)
+    return dist, nxt, FloydBatchStats(iterations=iterations, relaxations=relaxations, negative_cycle=negative_cycle)
+
+
+def _relax_tile(
+    d_tile: np.ndarray,
+    n_tile: np.ndarray,
+    col_src: np.ndarray,
+    row_src: np.ndarray,
+    nxt_col_src: np.ndarray,
+) -> tuple[int, int]:
+    """Relaxa d_tile com os intermediários k do bloco pivô.
+
+    - col_src: dist[I, K] (colunas do pivô para as linhas do tile)
+    - row_src: dist[K, J] (linhas do pivô para as colunas do tile)
+    - nxt_col_src: nxt[I, K]
+
+    Nas fases 1 e 2, col_src/row_src podem ser o próprio d_tile (mesmo objeto),
+    e a leitura enxerga as atualizações dos k anteriores, como na versão clássica.
+    Atualiza d_tile/n_tile in-place e devolve (iterations, relaxations).
+    """
+    iterations = 0
+    relaxations = 0
+    n_cols = d_tile.shape[1]
+    for k in range(col_src.shape[1]):
+        col_k = col_src[:, k].copy()
+        row_k = row_src[k, :].copy()
+        iterations += int(np.count_nonzero(np.isfinite(col_k))) * n_cols
+        cand = col_k[:, None] + row_k[None, :]
+        improved = cand < d_tile
+        count = int(np.count_nonzero(improved))
+        if count == 0:
+            continue
+        d_tile[improved] = cand[improved]
+        nxt_col_k = nxt_col_src[:, k].copy()
+        n_tile[improved] = np.broadcast_to(nxt_col_k[:, None], d_tile.shape)[improved]
+        relaxations += count
+    return iterations, relaxations
+
+
+def _tile_task(
+    dist: np.ndarray,
+    nxt: np.ndarray,
+    rows: slice,
+    cols: slice,
+    piv: slice,
+    copy: bool,
+) -> tuple[int, int]:
+    """Processa o tile (rows, cols) com o bloco pivô piv.
+
+    Com copy=False o tile é uma view das matrizes (engine em memória).
+    Com copy=True o tile é carregado em RAM e escrito de volta ao final
+    (engine out-of-core sobre np.memmap). nxt é escrito antes de dist: se o
+    processo morrer entre as duas escritas, a retomada refaz a relaxação.
+    """
+
+    def get(a: np.ndarray, r: slice, c: slice) -> np.ndarray:
+        return np.array(a[r, c]) if copy else a[r, c]
+
+    d_tile = get(dist, rows, cols)
+    n_tile = get(nxt, rows, cols)
+    col_src = d_tile if cols == piv else get(dist, rows, piv)
+    nxt_col_src = n_tile if cols == piv else get(nxt, rows, piv)
+    row_src = d_tile if rows == piv else get(dist, piv, cols)
+
+    result = _relax_tile(d_tile, n_tile, col_src, row_src, nxt_col_src)
+
+    if copy:
+        nxt[rows, cols] = n_tile
+        dist[rows, cols] = d_tile
+    return result
+
+
+def _run_blocked(
+    dist: np.ndarray,
+    nxt: np.ndarray,
+    stats: FloydStats,
+    block_size: int,
+    workers: int,
+    copy: bool = False,
+    start_block: int = 0,
+    on_block_done=None,
+) -> None:
+    """Executa as três fases do Floyd-Warshall em blocos sobre dist/nxt.
+
+    on_block_done(b) é chamado após cada bloco pivô b (usado para checkpoint).
+    """
+    if block_size < 1:
+        raise ValueError("block_size deve ser >= 1")
+    if workers < 1:
+        raise ValueError("workers deve ser >= 1")
+
+    n = dist.shape[0]
+    blocks = [slice(b, min(b + block_size, n)) for b in range(0, n, block_size)]
+
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def run_phase(tasks: list[tuple[slice, slice, slice]]) -> None:
+        if pool is None:
+            results = [_tile_task(dist, nxt, r, c, p, copy) for (r, c, p) in tasks]
+        else:
+            results = list(pool.map(lambda t: _tile_task(dist, nxt, *t, copy), tasks))
+        for it, rel in results:
+            stats.iterations += it
+            stats.relaxations += rel
+
+    try:
+        for b in range(start_block, len(blocks)):
+            kb = blocks[b]
+            # Fase 1: tile diagonal
+            run_phase([(kb, kb, kb)])
+            # Fase 2: linha e coluna do pivô
+            others = [blk for blk in blocks if blk.start != kb.start]
+            run_phase([(kb, jb, kb) for jb in others] + [(ib, kb, kb) for ib in others])
+            # Fase 3: demais tiles
+            run_phase([(ib, jb, kb) for ib in others for jb in others])
+            if on_block_done is not None:
+                on_block_done(b)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def floyd_warshall_blocked(
+    cost_matrix: CostInput,
+    block_size: int = 256,
+    workers: int = 1,
+) -> tuple[np.ndarray, np.ndarray, FloydStats]:
+    """Floyd-Warshall em blocos (tiles) de tamanho block_size.
+
+    Para cada bloco pivô K, executa as três fases clássicas:
+    1) tile diagonal (K, K);
+    2) tiles da linha (K, J) e da coluna (I, K) do pivô, que só dependem do tile diagonal;
+    3) demais tiles (I, J), que só dependem dos tiles da linha e da coluna do pivô.
+
+    Os tiles de uma mesma fase escrevem em regiões disjuntas e são distribuídos
+    em um pool de `workers` threads. As matrizes ficam na memória compartilhada
+    do processo e as operações do NumPy liberam o GIL, então não há cópia entre workers.
+
+    Mesmo contrato de `floyd_warshall`: (dist, nxt, stats).
+    """
+    dist = _as_cost_matrix(cost_matrix).astype(float).copy()
+    nxt = _init_next_matrix(dist)
+
+    stats = FloydStats()
+    _run_blocked(dist, nxt, stats, block_size=block_size, workers=workers)
+
+    stats.negative_cycle = bool(np.any(np.diag(dist) < 0))
+
+    return dist, nxt, stats
+
+
+def _matrix_fingerprint(cost_matrix: np.ndarray, block_size: int) -> str:
+    """Hash da matriz de custos lida por faixas de linhas (identifica a entrada do checkpoint)."""
+    h = hashlib.blake2b(digest_size=16)
+    n = cost_matrix.shape[0]
+    for r0 in range(0, n, block_size):
+        h.update(np.ascontiguousarray(cost_matrix[r0 : r0 + block_size], dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+def _has_size(path: str, nbytes: int) -> bool:
+    return os.path.isfile(path) and os.path.getsize(path) == nbytes
+
+
+def floyd_warshall_memmap(
+    cost_matrix: CostInput,
+    workdir: str,
+    block_size: int = 1024,
+    workers: int = 1,
+    resume: bool = True,
+) -> tuple[np.ndarray, np.ndarray, FloydStats]:
+    """Floyd-Warshall out-of-core: dist e nxt ficam em arquivos np.memmap.
+
+    Arquivos em workdir:
+    - dist.f64: matriz de distâncias (float64, n x n)
+    - nxt.i64: matriz de próximos nós (int64, n x n)
+    - checkpoint.json: próximo bloco pivô e contadores acumulados
+
+    O algoritmo é o mesmo de `floyd_warshall_blocked`, mas cada tile é lido
+    do disco, processado em RAM e escrito de volta, então a memória usada é
+    O(block_size^2). cost_matrix pode ser ela mesma um np.memmap; é lida por faixas de linhas.
+
+    Após cada bloco pivô os arquivos recebem flush e o checkpoint é gravado.
+    Com resume=True, uma execução interrompida (mesma matriz de entrada e
+    mesmo block_size) continua do último bloco concluído em vez de recomeçar;
+    se dist.f64 ou nxt.i64 faltarem ou não tiverem n x n entradas, recomeça.
+    """
+    cost_matrix = _as_cost_matrix(cost_matrix)
+    n = cost_matrix.shape[0]
+    os.makedirs(workdir, exist_ok=True)
+    dist_path = os.path.join(workdir, "dist.f64")
+    nxt_path = os.path.join(workdir, "nxt.i64")
+    ckpt_path = os.path.join(workdir, "checkpoint.json")
+
+    fingerprint = _matrix_fingerprint(cost_matrix, block_size)
+
+    ckpt = None
+    if resume and os.path.exists(ckpt_path):
+        with open(ckpt_path, "r", encoding="utf-8") as f:
+            ckpt = json.load(f)
+        if (
+            ckpt.get("n") != n
+            or ckpt.get("block_size") != block_size
+            or ckpt.get("fingerprint") != fingerprint
+            or not _has_size(dist_path, n * n * np.dtype(np.float64).itemsize)
+            or not _has_size(nxt_path, n * n * np.dtype(np.int64).itemsize)
+        ):
+            ckpt = None
+
+    stats = FloydStats()
+    if ckpt is not None:
+        dist = np.memmap(dist_path, dtype=np.float64, mode="r+", shape=(n, n))
+        nxt = np.memmap(nxt_path, dtype=np.int64, mode="r+", shape=(n, n))
+        stats.iterations = int(ckpt["iterations"])
+        stats.relaxations = int(ckpt["relaxations"])
+        start_block = int(ckpt["next_block"])
+    else:
+        dist = np.memmap(dist_path, dtype=np.float64, mode="w+", shape=(n, n))
+        nxt = np.memmap(nxt_path, dtype=np.int64, mode="w+", shape=(n, n))
+        cols = np.arange(n)
+        for r0 in range(0, n, block_size):
+            r1 = min(r0 + block_size, n)
+            rows = np.asarray(cost_matrix[r0:r1], dtype=np.float64)
+            dist[r0:r1] = rows
+            nxt_rows = np.where(np.isfinite(rows), cols, -1)
+            nxt_rows[np.arange(r1 - r0), np.arange(r0, r1)] = -1
+            nxt[r0:r1] = nxt_rows
+        start_block = 0
+
+    def save_checkpoint(next_block: int) -> None:
+        dist.flush()
+        nxt.flush()
+        tmp = ckpt_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "n": n,
+                    "block_size": block_size,
+                    "fingerprint": fingerprint,
+                    "next_block": next_block,
+                    "iterations": stats.iterations,
+                    "relaxations": stats.relaxations,
+                },
+                f,
+            )
+        os.replace(tmp, ckpt_path)
+
+    if ckpt is None:
+        save_checkpoint(0)
+
+    _run_blocked(
+        dist,
+        nxt,
+        stats,
+        block_size=block_size,
+        workers=workers,
+        copy=True,
+        start_block=start_block,
+        on_block_done=lambda b: save_checkpoint(b + 1),
+    )
+
+    stats.negative_cycle = bool(np.any(np.diagonal(dist) < 0))
+
+    return dist, nxt, stats
+
+
 def reconstruct_path(nxt: np.ndarray, i: int, j: int) -> list[int]:
     """Reconstrói o caminho i->j usando a matriz nxt."""
     # Caso base: caminho trivial do nó para ele mesmo.
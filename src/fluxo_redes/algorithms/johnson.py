@@ -0,0 +1,182 @@
+"""Algoritmo de Johnson para todos os pares em grafos esparsos com custos negativos.
+
+Alternativa ao Floyd-Warshall na simulação 3:
+1) Bellman-Ford (com fila) a partir de um vértice virtual ligado a todos com
+   custo 0 fornece potenciais h(v);
+2) os custos são reponderados como w'(u,v) = w(u,v) + h(u) - h(v) >= 0;
+3) `dijkstra_heap` roda a partir de cada origem s sobre os custos reponderados,
+   e d(s,v) = d'(s,v) - h(s) + h(v).
+
+Complexidade O(n*m*log n), contra Theta(n^3) do Floyd. As n execuções de
+Dijkstra são independentes e podem ser distribuídas em um pool de processos.
+
+A saída segue o contrato de `floyd_warshall`: matrizes dist e nxt, com
+nxt[i,j] = próximo vértice no caminho i->j e -1 quando não há caminho.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Tuple, Optional
+
+import numpy as np
+
+from ..representations import Adjacency, CSRGraph
+from .bellman_ford_queue import bellman_ford_spfa
+from .dijkstra_heap import dijkstra_heap
+
+
+@dataclass
+class JohnsonStats:
+    potential_relaxations: int = 0
+    dijkstra_runs: int = 0
+    relaxations: int = 0
+    heap_push: int = 0
+    heap_pop: int = 0
+
+
+def _first_hops(pred: List[Optional[int]], root: int) -> list[int]:
+    """first[v] = vértice seguinte a root no caminho root->v da árvore pred (-1 se não houver)."""
+    n = len(pred)
+    UNKNOWN = -2
+    first = [UNKNOWN] * n
+    first[root] = -1
+    for v in range(n):
+        path = []
+        x = v
+        reached_known = True
+        while first[x] == UNKNOWN:
+            path.append(x)
+            p = pred[x]
+            if p is None:
+                reached_known = False
+                break
+            x = p
+        if not reached_known:
+            # cadeia termina sem chegar à raiz: vértices inalcançáveis
+            for y in path:
+                first[y] = -1
+            continue
+        for y in reversed(path):
+            p = pred[y]
+            first[y] = y if p == root else first[p]
+    return first
+
+
+def _augment_with_virtual_source(successors: Adjacency) -> Adjacency:
+    """Acrescenta o vértice virtual n com arcos n->v de custo 0 para todo v."""
+    n = len(successors)
+    if isinstance(successors, CSRGraph):
+        g = successors
+        return CSRGraph(
+            indptr=np.append(g.indptr, g.indptr[-1] + n),
+            indices=np.concatenate([g.indices, np.arange(n, dtype=g.indices.dtype)]),
+            weights=np.concatenate([g.weights, np.zeros(n, dtype=g.weights.dtype)]),
+        )
+    return list(successors) + [[(v, 0.0) for v in range(n)]]
+
+
+def _reweight(successors: Adjacency, h: List[float]) -> Adjacency:
+    """w'(u,v) = w(u,v) + h(u) - h(v), >= 0 pela desigualdade triangular dos potenciais.
+
+    O max(0, .) só absorve arredondamento de ponto flutuante.
+    """
+    if isinstance(successors, CSRGraph):
+        g = successors
+        hh = np.asarray(h, dtype=np.float64)
+        rows = np.repeat(np.arange(g.n), g.degrees())
+        w = np.maximum(0.0, g.weights + hh[rows] - hh[g.indices]).astype(g.weights.dtype)
+        return CSRGraph(indptr=g.indptr, indices=g.indices, weights=w)
+
+    reweighted: List[List[Tuple[int, float]]] = []
+    for u in range(len(successors)):
+        row = []
+        for v, w in successors[u]:
+            row.append((v, max(0.0, w + h[u] - h[v])))
+        reweighted.append(row)
+    return reweighted
+
+
+def _johnson_row(
+    reweighted: Adjacency,
+    h: List[float],
+    s: int,
+) -> tuple[np.ndarray, np.ndarray, tuple[int, int, int]]:
+    d_rw, pred, st = dijkstra_heap(reweighted, root=s)
+    row = np.array(d_rw, dtype=float) + np.array(h, dtype=float) - h[s]
+    nxt_row = np.array(_first_hops(pred, s), dtype=int)
+    return row, nxt_row, (st.relaxations, st.heap_push, st.heap_pop)
+
+
+_WORKER_GRAPH: Optional[Adjacency] = None
+_WORKER_H: Optional[List[float]] = None
+
+
+def _init_worker(reweighted: Adjacency, h: List[float]) -> None:
+    global _WORKER_GRAPH, _WORKER_H
+    _WORKER_GRAPH = reweighted
+    _WORKER_H = h
+
+
+def _worker_rows(sources: List[int]):
+    return sources, [_johnson_row(_WORKER_GRAPH, _WORKER_H, s) for s in sources]
+
+
+def johnson(
+    successors: Adjacency,
+    workers: int = 1,
+) -> tuple[np.ndarray, np.ndarray, JohnsonStats]:
+    """Retorna (dist, nxt, stats) para todos os pares, como `floyd_warshall`.
+
+    successors[u] = lista de (v, w(u,v)); aceita também um CSRGraph (`to_csr`),
+    caso em que a reponderação é vetorizada e os workers recebem só os arrays.
+
+    Com workers > 1, as execuções de Dijkstra por origem são distribuídas em
+    um ProcessPoolExecutor; o grafo reponderado é enviado uma vez por processo.
+
+    Levanta ValueError se o grafo tiver ciclo negativo (não há potenciais válidos).
+    """
+    if workers < 1:
+        raise ValueError("workers deve ser >= 1")
+
+    n = len(successors)
+    stats = JohnsonStats()
+
+    # Vértice virtual n ligado a todos com custo 0.
+    h_full, _, st_bf = bellman_ford_spfa(_augment_with_virtual_source(successors), root=n)
+    stats.potential_relaxations = st_bf.relaxations
+    if st_bf.negative_cycle:
+        raise ValueError("Ciclo negativo detectado; Johnson requer ausência de ciclos negativos")
+    h = h_full[:n]
+
+    reweighted = _reweight(successors, h)
+
+    dist = np.full((n, n), float("inf"), dtype=float)
+    nxt = np.full((n, n), -1, dtype=int)
+
+    def store(s: int, result) -> None:
+        row, nxt_row, (relax, push, pop) = result
+        dist[s, :] = row
+        nxt[s, :] = nxt_row
+        stats.dijkstra_runs += 1
+        stats.relaxations += relax
+        stats.heap_push += push
+        stats.heap_pop += pop
+
+    if workers == 1:
+        for s in range(n):
+            store(s, _johnson_row(reweighted, h, s))
+    else:
+        n_chunks = min(n, 4 * workers)
+        chunks = [list(range(c, n, n_chunks)) for c in range(n_chunks)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(reweighted, h),
+        ) as pool:
+            for sources, results in pool.map(_worker_rows, chunks):
+                for s, result in zip(sources, results):
+                    store(s, result)
+
+    return dist, nxt, stats
@@ -0,0 +1,123 @@
+"""Produto min-plus (tropical) e caminhos mínimos por quadrados sucessivos.
+
+Alternativa ao Floyd-Warshall na simulação 3. No semianel (min, +):
+
+    (A ⊗ B)[i, j] = min_k A[i, k] + B[k, j]
+
+Se D é a matriz de custos (diagonal 0), D^h[i, j] é o menor custo de um
+caminho i -> j com no máximo h arcos. Elevando ao quadrado repetidamente,
+D, D^2, D^4, ... chegam a D^(2^p) com 2^p >= n após ⌈log₂ n⌉ produtos, o que
+cobre todo caminho simples e todo ciclo: sem ciclos negativos, D^(2^p) é a
+matriz de distâncias; com ciclo negativo, algum elemento da diagonal fica < 0
+(a mesma verificação do `floyd_warshall`).
+
+`min_plus_product` é feito em blocos (bi x bk x bj): o temporário de cada
+passo tem block_size³ elementos, em vez do n³ de um broadcasting direto.
+
+Modo limitado por arcos: com max_products=h, para após h produtos e devolve
+os menores custos com no máximo 2^h arcos.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .floyd_warshall import CostInput, _as_cost_matrix, _init_next_matrix
+
+
+@dataclass
+class MinPlusStats:
+    products: int = 0
+    iterations: int = 0
+    relaxations: int = 0
+    converged: bool = False
+    negative_cycle: bool = False
+
+
+def min_plus_product(
+    A: np.ndarray,
+    B: np.ndarray,
+    block_size: int = 64,
+    return_argmin: bool = False,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """C = A ⊗ B no semianel (min, +); com return_argmin, também o k que atinge cada mínimo (-1 se inf)."""
+    n, m = A.shape
+    m2, p = B.shape
+    if m != m2:
+        raise ValueError("dimensões incompatíveis para o produto min-plus")
+    if block_size < 1:
+        raise ValueError("block_size deve ser >= 1")
+
+    C = np.full((n, p), np.inf)
+    K = np.full((n, p), -1, dtype=np.int64) if return_argmin else None
+
+    for i0 in range(0, n, block_size):
+        i1 = min(i0 + block_size, n)
+        for j0 in range(0, p, block_size):
+            j1 = min(j0 + block_size, p)
+            c_tile = C[i0:i1, j0:j1]
+            k_tile = K[i0:i1, j0:j1] if K is not None else None
+            for k0 in range(0, m, block_size):
+                k1 = min(k0 + block_size, m)
+                tmp = A[i0:i1, k0:k1, None] + B[None, k0:k1, j0:j1]
+                if k_tile is None:
+                    np.minimum(c_tile, tmp.min(axis=1), out=c_tile)
+                    continue
+                arg = tmp.argmin(axis=1)
+                best = np.take_along_axis(tmp, arg[:, None, :], axis=1)[:, 0, :]
+                better = best < c_tile
+                c_tile[better] = best[better]
+                k_tile[better] = arg[better] + k0
+    return C, K
+
+
+def min_plus_apsp(
+    cost_matrix: CostInput,
+    max_products: Optional[int] = None,
+    block_size: int = 64,
+) -> tuple[np.ndarray, np.ndarray, MinPlusStats]:
+    """Retorna (dist, nxt, stats) por quadrados sucessivos, como `floyd_warshall`.
+
+    Para antes de ⌈log₂ n⌉ produtos se um quadrado não mudar a matriz
+    (stats.converged). nxt[i, j] é o próximo vértice do caminho i -> j
+    (-1 sem caminho); `reconstruct_path` vale quando o resultado convergiu.
+    Com max_products=h, no máximo h produtos (caminhos de até 2^h arcos).
+    """
+    cost_matrix = _as_cost_matrix(cost_matrix)
+    n = cost_matrix.shape[0]
+    if max_products is not None and max_products < 0:
+        raise ValueError("max_products deve ser >= 0")
+
+    dist = cost_matrix.astype(float).copy()
+    np.fill_diagonal(dist, np.minimum(np.diag(dist), 0.0))
+    nxt = _init_next_matrix(dist)
+
+    stats = MinPlusStats()
+    needed = int(np.ceil(np.log2(n))) if n > 1 else 0
+    limit = needed if max_products is None else min(needed, max_products)
+
+    rows = np.arange(n)[:, None]
+    while stats.products < limit:
+        new, arg = min_plus_product(dist, dist, block_size=block_size, return_argmin=True)
+        stats.products += 1
+        stats.iterations += n * n * n
+
+        improved = new < dist
+        count = int(np.count_nonzero(improved))
+        if count == 0:
+            stats.converged = True
+            break
+        stats.relaxations += count
+        # primeiro arco de i -> j passa a ser o primeiro arco de i -> k*
+        nxt = np.where(improved, nxt[rows, np.maximum(arg, 0)], nxt)
+        dist = np.where(improved, new, dist)
+    else:
+        stats.converged = stats.products >= needed
+
+    stats.negative_cycle = bool(np.any(np.diag(dist) < 0))
+    if stats.negative_cycle:
+        stats.converged = False
+    return dist, nxt, stats
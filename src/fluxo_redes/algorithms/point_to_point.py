@@ -0,0 +1,137 @@
+"""Consultas ponto a ponto (origem -> destino) de caminho mínimo.
+
+`dijkstra_heap` sempre fecha todos os vértices alcançáveis. Quando só interessa
+a distância de uma origem s a um destino t (ex.: X1 -> Xk), basta:
+
+- `dijkstra_query`: Dijkstra com parada antecipada assim que t é fechado;
+- `bidirectional_dijkstra`: buscas simultâneas a partir de s (lista de
+  sucessores) e de t (lista de antecessores), encerradas quando
+  topo_frente + topo_trás >= melhor caminho já encontrado.
+
+Distâncias e predecessores ficam em dicionários, então a consulta só toca os
+vértices efetivamente alcançados pela busca. O resultado traz o caminho e o
+número de vértices fechados, para comparar com o Dijkstra completo.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import heapq
+
+from ..representations import Adjacency, neighbors_of
+
+
+@dataclass
+class QueryResult:
+    source: int
+    target: int
+    distance: float = float("inf")
+    path: List[int] = field(default_factory=list)
+    settled: int = 0
+    relaxations: int = 0
+
+
+def _walk(pred: Dict[int, Optional[int]], start: int) -> List[int]:
+    path = []
+    cur: Optional[int] = start
+    while cur is not None:
+        path.append(cur)
+        cur = pred[cur]
+    return path
+
+
+def dijkstra_query(successors: Adjacency, source: int, target: int) -> QueryResult:
+    """Dijkstra a partir de source que para assim que target é fechado."""
+    INF = float("inf")
+    result = QueryResult(source=source, target=target)
+    neighbors = neighbors_of(successors)
+
+    dist: Dict[int, float] = {source: 0.0}
+    pred: Dict[int, Optional[int]] = {source: None}
+    settled = set()
+    heap = [(0.0, source)]
+
+    while heap:
+        d_u, u = heapq.heappop(heap)
+        if u in settled:
+            continue
+        settled.add(u)
+        if u == target:
+            result.distance = d_u
+            result.path = _walk(pred, target)[::-1]
+            break
+        for v, w in neighbors(u):
+            if w < 0:
+                raise ValueError("Dijkstra requer pesos não-negativos")
+            nd = d_u + w
+            if nd < dist.get(v, INF):
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd, v))
+                result.relaxations += 1
+
+    result.settled = len(settled)
+    return result
+
+
+def bidirectional_dijkstra(
+    successors: Adjacency,
+    predecessors: Adjacency,
+    source: int,
+    target: int,
+) -> QueryResult:
+    """Dijkstra bidirecional: frente sobre successors, trás sobre predecessors.
+
+    A cada passo expande o lado com menor topo de heap. mu guarda o melhor
+    caminho s->t visto (dist_f[v] + dist_b[v]); a busca para quando a soma dos
+    topos alcança mu, pois nenhum caminho ainda não visto pode ser menor.
+    """
+    INF = float("inf")
+    result = QueryResult(source=source, target=target)
+    if source == target:
+        result.distance = 0.0
+        result.path = [source]
+        return result
+
+    dist = ({source: 0.0}, {target: 0.0})
+    pred: tuple[Dict[int, Optional[int]], Dict[int, Optional[int]]] = ({source: None}, {target: None})
+    settled = (set(), set())
+    heaps = ([(0.0, source)], [(0.0, target)])
+    adjs = (neighbors_of(successors), neighbors_of(predecessors))
+
+    mu = INF
+    meet: Optional[int] = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        other = 1 - side
+
+        d_u, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        dist_s, dist_o, pred_s = dist[side], dist[other], pred[side]
+        for v, w in adjs[side](u):
+            if w < 0:
+                raise ValueError("Dijkstra requer pesos não-negativos")
+            nd = d_u + w
+            if nd < dist_s.get(v, INF):
+                dist_s[v] = nd
+                pred_s[v] = u
+                heapq.heappush(heaps[side], (nd, v))
+                result.relaxations += 1
+            d_o = dist_o.get(v)
+            if d_o is not None and dist_s[v] + d_o < mu:
+                mu = dist_s[v] + d_o
+                meet = v
+
+    result.settled = len(settled[0]) + len(settled[1])
+    if meet is not None:
+        result.distance = mu
+        # s -> meet pela árvore da frente, meet -> t pela árvore de trás
+        result.path = _walk(pred[0], meet)[::-1] + _walk(pred[1], meet)[1:]
+    return result
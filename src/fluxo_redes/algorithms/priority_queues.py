@@ -0,0 +1,220 @@
+"""Filas de prioridade com decrease-key para o Dijkstra.
+
+O `dijkstra_heap` original usa `heapq` em modo "preguiçoso": cada melhoria
+de distância empilha uma nova entrada e as obsoletas são descartadas no pop.
+As filas deste módulo mantêm no máximo uma entrada por vértice e implementam
+decrease-key de verdade:
+
+- `IndexedDaryHeap`: heap d-ário indexado (d=2 é o heap binário clássico)
+- `PairingHeap`: pairing heap com decrease-key por corte e fusão em duas passadas
+
+Interface comum (itens são vértices 0..n-1, chaves são distâncias):
+    push(item, key), decrease_key(item, key), pop() -> (key, item),
+    contains(item), len(q)
+
+Cada fila conta suas operações (pushes, pops, decrease_keys) e o trabalho
+estrutural: sift_steps (trocas de nível no heap d-ário) ou links (fusões no
+pairing heap).
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+
+class IndexedDaryHeap:
+    """Heap d-ário mínimo com posição de cada item (decrease-key em O(log_d n))."""
+
+    def __init__(self, n: int, arity: int = 2):
+        if arity < 2:
+            raise ValueError("arity deve ser >= 2")
+        self.arity = arity
+        self._items: List[int] = []
+        self._keys: List[float] = []
+        self._pos: List[int] = [-1] * n
+
+        self.pushes = 0
+        self.pops = 0
+        self.decrease_keys = 0
+        self.sift_steps = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def contains(self, item: int) -> bool:
+        return self._pos[item] >= 0
+
+    def push(self, item: int, key: float) -> None:
+        self.pushes += 1
+        self._items.append(item)
+        self._keys.append(key)
+        i = len(self._items) - 1
+        self._pos[item] = i
+        self._sift_up(i)
+
+    def decrease_key(self, item: int, key: float) -> None:
+        self.decrease_keys += 1
+        i = self._pos[item]
+        self._keys[i] = key
+        self._sift_up(i)
+
+    def pop(self) -> tuple[float, int]:
+        self.pops += 1
+        items, keys = self._items, self._keys
+        top_item, top_key = items[0], keys[0]
+        self._pos[top_item] = -1
+        last_item, last_key = items.pop(), keys.pop()
+        if items:
+            items[0], keys[0] = last_item, last_key
+            self._pos[last_item] = 0
+            self._sift_down(0)
+        return top_key, top_item
+
+    def _sift_up(self, i: int) -> None:
+        items, keys, pos, d = self._items, self._keys, self._pos, self.arity
+        item, key = items[i], keys[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if keys[parent] <= key:
+                break
+            items[i], keys[i] = items[parent], keys[parent]
+            pos[items[i]] = i
+            i = parent
+            self.sift_steps += 1
+        items[i], keys[i] = item, key
+        pos[item] = i
+
+    def _sift_down(self, i: int) -> None:
+        items, keys, pos, d = self._items, self._keys, self._pos, self.arity
+        size = len(items)
+        item, key = items[i], keys[i]
+        while True:
+            first = d * i + 1
+            if first >= size:
+                break
+            last = min(first + d, size)
+            best = first
+            best_key = keys[first]
+            for c in range(first + 1, last):
+                if keys[c] < best_key:
+                    best, best_key = c, keys[c]
+            if best_key >= key:
+                break
+            items[i], keys[i] = items[best], best_key
+            pos[items[i]] = i
+            i = best
+            self.sift_steps += 1
+        items[i], keys[i] = item, key
+        pos[item] = i
+
+
+class _PairingNode:
+    __slots__ = ("key", "item", "child", "sibling", "prev")
+
+    def __init__(self, key: float, item: int):
+        self.key = key
+        self.item = item
+        self.child: Optional[_PairingNode] = None
+        self.sibling: Optional[_PairingNode] = None
+        # pai (se for o primeiro filho) ou irmão anterior
+        self.prev: Optional[_PairingNode] = None
+
+
+class PairingHeap:
+    """Pairing heap mínimo (push/decrease-key O(1), pop O(log n) amortizado)."""
+
+    def __init__(self, n: int):
+        self._root: Optional[_PairingNode] = None
+        self._nodes: List[Optional[_PairingNode]] = [None] * n
+        self._size = 0
+
+        self.pushes = 0
+        self.pops = 0
+        self.decrease_keys = 0
+        self.links = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def contains(self, item: int) -> bool:
+        return self._nodes[item] is not None
+
+    def _link(self, a: _PairingNode, b: _PairingNode) -> _PairingNode:
+        """Funde duas raízes; a de maior chave vira primeiro filho da outra."""
+        self.links += 1
+        if b.key < a.key:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        a.prev = None
+        return a
+
+    def push(self, item: int, key: float) -> None:
+        self.pushes += 1
+        node = _PairingNode(key, item)
+        self._nodes[item] = node
+        self._size += 1
+        self._root = node if self._root is None else self._link(self._root, node)
+
+    def decrease_key(self, item: int, key: float) -> None:
+        self.decrease_keys += 1
+        node = self._nodes[item]
+        node.key = key
+        if node is self._root:
+            return
+        # corta a subárvore de node e a funde com a raiz
+        prev = node.prev
+        if prev.child is node:
+            prev.child = node.sibling
+        else:
+            prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = prev
+        node.sibling = None
+        node.prev = None
+        self._root = self._link(self._root, node)
+
+    def pop(self) -> tuple[float, int]:
+        self.pops += 1
+        root = self._root
+        self._nodes[root.item] = None
+        self._size -= 1
+
+        # fusão em duas passadas: pares da esquerda para a direita,
+        # depois acumulação da direita para a esquerda
+        pairs: List[_PairingNode] = []
+        cur = root.child
+        while cur is not None:
+            a = cur
+            b = cur.sibling
+            cur = b.sibling if b is not None else None
+            a.sibling = a.prev = None
+            if b is not None:
+                b.sibling = b.prev = None
+                a = self._link(a, b)
+            pairs.append(a)
+
+        new_root: Optional[_PairingNode] = None
+        for node in reversed(pairs):
+            new_root = node if new_root is None else self._link(new_root, node)
+        self._root = new_root
+
+        return root.key, root.item
+
+
+QUEUE_BACKENDS = ["lazy", "binary", "dary", "pairing"]
+
+
+def make_queue(queue: str, n: int, arity: int = 4):
+    """Cria a fila indexada pelo nome ("binary", "dary" ou "pairing")."""
+    if queue == "binary":
+        return IndexedDaryHeap(n, arity=2)
+    if queue == "dary":
+        return IndexedDaryHeap(n, arity=arity)
+    if queue == "pairing":
+        return PairingHeap(n)
+    raise ValueError(f"fila desconhecida: {queue}")
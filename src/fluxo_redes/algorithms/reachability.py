@@ -0,0 +1,111 @@
+"""Poda por alcançabilidade antes do Floyd-Warshall.
+
+O Floyd-Warshall percorre todos os n vértices como intermediários, mesmo
+quando boa parte das linhas/colunas da matriz é inalcançável ou toda inf.
+Quando só interessam os caminhos que saem de algumas raízes (simulação 3:
+a primeira linha, X1) e/ou chegam a alguns alvos, um vértice x só pode estar
+em um desses caminhos se:
+
+- x é alcançável a partir de alguma raiz (BFS para frente no CSR), e
+- algum alvo é alcançável a partir de x (BFS para trás, no CSR transposto).
+
+Todo vértice intermediário de um caminho entre dois vértices desse conjunto R
+também está em R, então o Floyd restrito à submatriz R x R dá as mesmas
+distâncias. Dentro de R, só vértices com arcos de entrada e de saída são
+usados como k (os demais não relaxam nada). Os resultados são mapeados de
+volta para os índices originais.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..representations import CSRGraph, csr_from_arrays, csr_to_cost_matrix, csr_transpose
+from .bellman_divide_conquer import _segment_positions
+from .floyd_warshall import CostInput, floyd_warshall_numpy
+
+
+@dataclass
+class PrunedFloydStats:
+    kept: int = 0
+    pivots: int = 0
+    iterations: int = 0
+    relaxations: int = 0
+    negative_cycle: bool = False
+
+
+def reachable_mask(g: CSRGraph, sources: Sequence[int]) -> np.ndarray:
+    """BFS por fronteiras sobre o CSR: mask[v] = True se v é alcançável de alguma origem."""
+    seen = np.zeros(g.n, dtype=bool)
+    frontier = np.unique(np.asarray(sources, dtype=np.int64))
+    seen[frontier] = True
+    while frontier.size:
+        pos, _ = _segment_positions(g.indptr, frontier)
+        nb = g.indices[pos]
+        nb = np.unique(nb[~seen[nb]])
+        seen[nb] = True
+        frontier = nb
+    return seen
+
+
+def _matrix_to_csr(mat: np.ndarray) -> CSRGraph:
+    """Arcos finitos fora da diagonal da matriz de custos, em CSR."""
+    finite = np.isfinite(mat)
+    np.fill_diagonal(finite, False)
+    rows, cols = np.nonzero(finite)
+    return csr_from_arrays(mat.shape[0], rows, cols, mat[rows, cols], index_dtype=np.int64)
+
+
+def floyd_warshall_pruned(
+    cost_matrix: CostInput,
+    roots: Optional[Sequence[int]] = None,
+    targets: Optional[Sequence[int]] = None,
+) -> tuple[np.ndarray, np.ndarray, PrunedFloydStats]:
+    """Retorna (dist, nxt, stats) como `floyd_warshall`, calculados só sobre R x R.
+
+    roots=None / targets=None dispensam a BFS correspondente (todos os vértices).
+    Entradas fora de R x R não são calculadas: ficam inf em dist e -1 em nxt
+    (a diagonal fica 0). As linhas das raízes são exatas para todo destino, e as
+    colunas dos alvos para toda origem. Ciclos negativos fora de R não afetam
+    esses caminhos e não são detectados.
+    """
+    if isinstance(cost_matrix, CSRGraph):
+        g = cost_matrix
+        mat = csr_to_cost_matrix(g)
+    else:
+        mat = np.asarray(cost_matrix, dtype=float)
+        g = _matrix_to_csr(mat)
+    n = g.n
+
+    relevant = np.ones(n, dtype=bool)
+    if roots is not None:
+        relevant &= reachable_mask(g, roots)
+    if targets is not None:
+        relevant &= reachable_mask(csr_transpose(g), targets)
+    keep = np.flatnonzero(relevant)
+
+    sub = mat[np.ix_(keep, keep)]
+
+    # k sem arco de entrada ou sem arco de saída (fora a diagonal) não relaxa nada
+    off = np.isfinite(sub)
+    np.fill_diagonal(off, False)
+    pivots = np.flatnonzero(off.any(axis=0) & off.any(axis=1))
+
+    sub_dist, sub_nxt, fw = floyd_warshall_numpy(sub, pivots=pivots)
+    stats = PrunedFloydStats(
+        kept=int(keep.size),
+        pivots=int(pivots.size),
+        iterations=fw.iterations,
+        relaxations=fw.relaxations,
+        negative_cycle=fw.negative_cycle,
+    )
+
+    dist = np.full((n, n), np.inf)
+    np.fill_diagonal(dist, 0.0)
+    nxt = np.full((n, n), -1, dtype=sub_nxt.dtype)
+    dist[np.ix_(keep, keep)] = sub_dist
+    nxt[np.ix_(keep, keep)] = np.where(sub_nxt >= 0, keep[np.maximum(sub_nxt, 0)], -1)
+    return dist, nxt, stats
@@ -0,0 +1,251 @@
+"""Caminhos mínimos a partir de uma raiz via condensação em componentes fortemente conexas.
+
+Grafos com circuitos (simulações 2 e 3) costumam ter várias componentes
+fortemente conexas (SCCs), ligadas por um DAG (a condensação). Em vez de rodar
+um único algoritmo sobre o grafo todo:
+
+1) Tarjan iterativo a partir da raiz: só visita vértices alcançáveis, então os
+   inalcançáveis são descartados antes de qualquer relaxação (d = inf);
+2) as SCCs saem do Tarjan em ordem topológica reversa da condensação; são
+   processadas na ordem topológica;
+3) dentro de cada SCC, com rótulos iniciais vindos das componentes anteriores,
+   roda a engine mais barata válida:
+   - "single": um vértice sem laço, nada a fazer;
+   - "dijkstra": sem arcos internos negativos, Dijkstra com várias origens;
+   - "spfa": com arcos internos negativos, Bellman-Ford com fila, detectando
+     ciclo negativo (caminho interno com >= |C| arcos);
+4) os arcos que saem da SCC aplicam a recorrência da simulação 1,
+   d(v) = min_u d(u) + w(u, v), sobre as componentes seguintes do DAG.
+
+O tempo e a engine de cada componente ficam em stats.components.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import heapq
+
+from ..representations import Adjacency, neighbors_of
+
+
+@dataclass
+class ComponentRun:
+    size: int
+    internal_edges: int
+    engine: str
+    runtime_s: float
+
+
+@dataclass
+class SCCStats:
+    reachable: int = 0
+    pruned: int = 0
+    relaxations: int = 0
+    negative_cycle: bool = False
+    components: List[ComponentRun] = field(default_factory=list)
+
+    def engine_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for c in self.components:
+            counts[c.engine] = counts.get(c.engine, 0) + 1
+        return counts
+
+
+def tarjan_scc(successors: Adjacency, root: int = 0) -> tuple[list[int], list[list[int]]]:
+    """Tarjan iterativo a partir de root.
+
+    Retorna (comp, components): comp[v] é o índice da SCC de v (-1 se v não é
+    alcançável) e components lista as SCCs em ordem topológica reversa da
+    condensação (a ordem em que o Tarjan as fecha).
+    """
+    return _tarjan(neighbors_of(successors), len(successors), root)
+
+
+def _tarjan(
+    neighbors: Callable[[int], Iterable[Tuple[int, float]]], n: int, root: int
+) -> tuple[list[int], list[list[int]]]:
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    comp = [-1] * n
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    index[root] = low[root] = counter
+    counter += 1
+    stack.append(root)
+    on_stack[root] = True
+    # pilha de chamadas: (vértice, iterador de sucessores)
+    work = [(root, iter(neighbors(root)))]
+
+    while work:
+        u, it = work[-1]
+        advanced = False
+        for v, _ in it:
+            if index[v] == -1:
+                index[v] = low[v] = counter
+                counter += 1
+                stack.append(v)
+                on_stack[v] = True
+                work.append((v, iter(neighbors(v))))
+                advanced = True
+                break
+            if on_stack[v] and index[v] < low[u]:
+                low[u] = index[v]
+        if advanced:
+            continue
+
+        work.pop()
+        if work:
+            parent = work[-1][0]
+            if low[u] < low[parent]:
+                low[parent] = low[u]
+        if low[u] == index[u]:
+            members = []
+            while True:
+                x = stack.pop()
+                on_stack[x] = False
+                comp[x] = len(components)
+                members.append(x)
+                if x == u:
+                    break
+            components.append(members)
+
+    return comp, components
+
+
+def _dijkstra_in_component(
+    neighbors: Callable[[int], Iterable[Tuple[int, float]]],
+    members: List[int],
+    cid: int,
+    comp: List[int],
+    dist: List[float],
+    pred: List[Optional[int]],
+    visited: List[bool],
+    stats: SCCStats,
+) -> None:
+    heap = [(dist[v], v) for v in members if dist[v] < float("inf")]
+    heapq.heapify(heap)
+    while heap:
+        d_u, u = heapq.heappop(heap)
+        if visited[u]:
+            continue
+        visited[u] = True
+        for v, w in neighbors(u):
+            if comp[v] != cid:
+                continue
+            nd = d_u + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd, v))
+                stats.relaxations += 1
+
+
+def _spfa_in_component(
+    neighbors: Callable[[int], Iterable[Tuple[int, float]]],
+    members: List[int],
+    cid: int,
+    comp: List[int],
+    dist: List[float],
+    pred: List[Optional[int]],
+    hops: List[int],
+    in_queue: List[bool],
+    stats: SCCStats,
+) -> bool:
+    """Bellman-Ford com fila restrito à SCC; retorna True se achar ciclo negativo.
+
+    hops[v] conta os arcos internos do caminho corrente (0 nos rótulos iniciais).
+    """
+    size = len(members)
+    queue = deque(v for v in members if dist[v] < float("inf"))
+    for v in queue:
+        in_queue[v] = True
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        d_u = dist[u]
+        for v, w in neighbors(u):
+            if comp[v] != cid:
+                continue
+            nd = d_u + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                hops[v] = hops[u] + 1
+                stats.relaxations += 1
+                if hops[v] >= size:
+                    return True
+                if not in_queue[v]:
+                    queue.append(v)
+                    in_queue[v] = True
+    return False
+
+
+def shortest_paths_scc(
+    successors: Adjacency,
+    root: int = 0,
+) -> tuple[list[float], list[Optional[int]], SCCStats]:
+    """Retorna (dist, pred, stats), como `bellman_ford_spfa`.
+
+    successors[u] = lista de (v, w(u,v)); aceita também um CSRGraph (`to_csr`).
+    Custos negativos são permitidos; se houver ciclo negativo alcançável,
+    stats.negative_cycle=True e a busca é interrompida.
+    """
+    n = len(successors)
+    INF = float("inf")
+    dist = [INF] * n
+    pred: List[Optional[int]] = [None] * n
+    dist[root] = 0.0
+    # estado das engines internas, compartilhado entre componentes (cada vértice está em uma só)
+    visited = [False] * n
+    hops = [0] * n
+    in_queue = [False] * n
+
+    stats = SCCStats()
+    neighbors = neighbors_of(successors)
+    comp, components = _tarjan(neighbors, n, root)
+    stats.reachable = sum(len(c) for c in components)
+    stats.pruned = n - stats.reachable
+
+    for cid in range(len(components) - 1, -1, -1):
+        members = components[cid]
+        t0 = perf_counter()
+        internal = 0
+        negative = False
+        for u in members:
+            for v, w in neighbors(u):
+                if comp[v] == cid:
+                    internal += 1
+                    if w < 0:
+                        negative = True
+
+        if internal == 0:
+            engine = "single"
+        elif not negative:
+            engine = "dijkstra"
+            _dijkstra_in_component(neighbors, members, cid, comp, dist, pred, visited, stats)
+        else:
+            engine = "spfa"
+            if _spfa_in_component(neighbors, members, cid, comp, dist, pred, hops, in_queue, stats):
+                stats.negative_cycle = True
+
+        # recorrência do DAG: arcos para componentes seguintes na ordem topológica
+        if not stats.negative_cycle:
+            for u in members:
+                d_u = dist[u]
+                for v, w in neighbors(u):
+                    if comp[v] != cid and d_u + w < dist[v]:
+                        dist[v] = d_u + w
+                        pred[v] = u
+                        stats.relaxations += 1
+
+        stats.components.append(ComponentRun(len(members), internal, engine, perf_counter() - t0))
+        if stats.negative_cycle:
+            break
+
+    return dist, pred, stats
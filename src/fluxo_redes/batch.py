@@ -0,0 +1,131 @@
+"""Caminhos mínimos a partir de várias raízes (lote multi-origem).
+
+As simulações calculam a árvore de caminhos mínimos a partir de X1 (root=0).
+`batch_shortest_paths` roda o mesmo solver a partir de várias raízes e devolve
+os resultados à medida que ficam prontos:
+
+- "dag": `shortest_paths_bellman_dag_iterative` (lista de antecessores, simulação 1)
+- "dijkstra": `dijkstra_heap` (lista de sucessores, simulação 2)
+- "spfa": `bellman_ford_spfa` (lista de sucessores, custos negativos, simulação 3)
+
+Com workers > 1, as raízes são distribuídas em um ProcessPoolExecutor. O grafo
+é copiado uma única vez para blocos de `multiprocessing.shared_memory` (arrays
+indptr/indices/weights de um CSRGraph); cada processo mapeia esses blocos no
+initializer e as tarefas só carregam o índice da raiz, em vez de serializar
+o grafo por tarefa.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .representations import Adjacency, CSRGraph, as_csr
+from .algorithms.bellman_divide_conquer import shortest_paths_bellman_dag_iterative
+from .algorithms.bellman_ford_queue import bellman_ford_spfa
+from .algorithms.dijkstra_heap import dijkstra_heap
+
+
+# solver -> função (adjacency, root) -> (dist, pred, stats)
+BATCH_SOLVERS: Dict[str, Callable[..., tuple]] = {
+    "dag": shortest_paths_bellman_dag_iterative,
+    "dijkstra": dijkstra_heap,
+    "spfa": bellman_ford_spfa,
+}
+
+# (nome do bloco, forma, dtype) de cada array do CSR
+_ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+class SharedCSR:
+    """Copia um CSRGraph para memória compartilhada; `spec` permite remapeá-lo em outro processo.
+
+    Uso como gerenciador de contexto: os blocos são liberados (unlink) na saída.
+    """
+
+    def __init__(self, g: CSRGraph):
+        self._blocks: List[shared_memory.SharedMemory] = []
+        specs = []
+        for arr in (g.indptr, g.indices, g.weights):
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+            self._blocks.append(shm)
+            specs.append((shm.name, arr.shape, arr.dtype.str))
+        self.spec: Tuple[_ArraySpec, ...] = tuple(specs)
+
+    def close(self) -> None:
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "SharedCSR":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def attach_csr(spec: Tuple[_ArraySpec, ...]) -> tuple[CSRGraph, List[shared_memory.SharedMemory]]:
+    """Mapeia os blocos de `SharedCSR.spec` sem cópia; os blocos devem ficar vivos enquanto o grafo for usado."""
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in spec]
+    arrays = [np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf) for shm, (_, shape, dtype) in zip(blocks, spec)]
+    return CSRGraph(indptr=arrays[0], indices=arrays[1], weights=arrays[2]), blocks
+
+
+_WORKER_GRAPH: Optional[CSRGraph] = None
+_WORKER_BLOCKS: List[shared_memory.SharedMemory] = []
+_WORKER_SOLVER: Optional[str] = None
+
+
+def _init_worker(spec: Tuple[_ArraySpec, ...], solver: str) -> None:
+    global _WORKER_GRAPH, _WORKER_BLOCKS, _WORKER_SOLVER
+    _WORKER_GRAPH, _WORKER_BLOCKS = attach_csr(spec)
+    _WORKER_SOLVER = solver
+
+
+def _worker_root(root: int) -> tuple[int, list[float], list[Optional[int]], Any]:
+    dist, pred, stats = BATCH_SOLVERS[_WORKER_SOLVER](_WORKER_GRAPH, root=root)
+    return root, dist, pred, stats
+
+
+def batch_shortest_paths(
+    graph: Adjacency,
+    roots: List[int],
+    solver: str = "dijkstra",
+    workers: int = 1,
+) -> Iterator[tuple[int, list[float], list[Optional[int]], Any]]:
+    """Gera (root, dist, pred, stats) para cada raiz, na ordem de conclusão.
+
+    graph é a representação que o solver espera: lista de antecessores para
+    "dag", de sucessores para "dijkstra" e "spfa" (listas ou CSRGraph).
+    Com workers == 1 as raízes são processadas em ordem, no próprio processo.
+    """
+    if solver not in BATCH_SOLVERS:
+        raise ValueError(f"solver desconhecido: {solver}")
+    if workers < 1:
+        raise ValueError("workers deve ser >= 1")
+    n = len(graph)
+    for r in roots:
+        if not 0 <= r < n:
+            raise ValueError(f"raiz fora do intervalo 0..{n - 1}: {r}")
+
+    if workers == 1:
+        solve = BATCH_SOLVERS[solver]
+        for r in roots:
+            dist, pred, stats = solve(graph, root=r)
+            yield r, dist, pred, stats
+        return
+
+    with SharedCSR(as_csr(graph)) as shared:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shared.spec, solver),
+        ) as pool:
+            futures = [pool.submit(_worker_root, r) for r in roots]
+            for fut in as_completed(futures):
+                yield fut.result()
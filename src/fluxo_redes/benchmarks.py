@@ -0,0 +1,454 @@
+"""Benchmarks das engines alternativas (fora das 3 simulações do enunciado).
+
+Uso:
+    python -m fluxo_redes.benchmarks alt --sizes 1000 5000 --queries 200 --landmarks 4 8 16
+    python -m fluxo_redes.benchmarks ch --sizes 200 1000 --density 0.005 --queries 200
+    python -m fluxo_redes.benchmarks delta --sizes 1000 5000 --densities 0.01 0.25 --workers 1 4
+    python -m fluxo_redes.benchmarks floyd-batch --sizes 10 50 200 --graphs 1000
+    python -m fluxo_redes.benchmarks dynamic --sizes 1000 5000 --updates 200
+
+Cada subcomando gera os grafos com os mesmos geradores e seeds das simulações,
+confere os resultados contra a engine de referência e grava um CSV em --out:
+- alt: consultas ponto a ponto com A* + landmarks vs. Dijkstra com parada
+  antecipada (results/bench_alt.csv)
+- ch: contraction hierarchies — construção, atalhos, gravação/leitura do
+  índice e tempo médio de consulta vs. Dijkstra (results/bench_ch.csv)
+- delta: delta-stepping vs. `dijkstra_heap` por n, densidade, Δ e número de
+  workers (results/bench_delta.csv)
+- floyd-batch: varredura de seeds da simulação 3 com `floyd_warshall_batched`
+  vs. um `floyd_warshall_numpy` por grafo (results/bench_floyd-batch.csv)
+- dynamic: reparo incremental após atualizações de arcos vs. recálculo
+  completo, para `dijkstra_heap`, o DAG da simulação 1 e o Floyd
+  (results/bench_dynamic.csv)
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from time import perf_counter
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .graph_generators import (
+    generate_cyclic_nonnegative,
+    generate_cyclic_with_negative_no_neg_cycles,
+    generate_dag_negative_costs,
+)
+from .representations import to_predecessor_list, to_successor_list, to_csr, to_cost_matrices
+from .algorithms.dijkstra_heap import dijkstra_heap
+from .algorithms.point_to_point import dijkstra_query
+from .algorithms.alt import build_alt_index, alt_query
+from .algorithms.contraction_hierarchies import build_ch, ch_query, save_ch, load_ch
+from .algorithms.delta_stepping import delta_stepping, default_delta
+from .algorithms.floyd_warshall import floyd_warshall_numpy, floyd_warshall_batched
+from .algorithms.bellman_divide_conquer import shortest_paths_bellman_dag_iterative
+from .algorithms.dynamic import DynamicSSSP, floyd_update_edge
+
+
+def _sim_seed(seed: int, sim_id: int, n: int) -> int:
+    # mesma convenção de `simulations.main`
+    return int(seed + 1000 * sim_id + n)
+
+
+def bench_alt(
+    sizes: List[int],
+    density: float,
+    seed: int,
+    queries: int,
+    landmarks: List[int],
+) -> pd.DataFrame:
+    """Mesmo conjunto de pares (s, t) para Dijkstra com parada antecipada e ALT com cada k."""
+    rows = []
+    for n in sizes:
+        g_seed = _sim_seed(seed, 2, n)
+        edges = generate_cyclic_nonnegative(n=n, density=density, seed=g_seed)
+        succs = to_successor_list(n, edges)
+        preds = to_predecessor_list(n, edges)
+
+        rng = np.random.default_rng(g_seed)
+        pairs = rng.integers(n, size=(queries, 2)).tolist()
+
+        t0 = perf_counter()
+        base = [dijkstra_query(succs, s, t) for s, t in pairs]
+        base_time = perf_counter() - t0
+        base_settled = float(np.mean([q.settled for q in base]))
+
+        for k in landmarks:
+            if k > n:
+                continue
+            t0 = perf_counter()
+            index = build_alt_index(succs, preds, k=k, seed=g_seed)
+            build_time = perf_counter() - t0
+
+            t0 = perf_counter()
+            res = [alt_query(index, succs, s, t) for s, t in pairs]
+            alt_time = perf_counter() - t0
+            for q, r in zip(base, res):
+                if q.distance != r.distance:
+                    raise AssertionError(f"ALT divergiu de Dijkstra em {q.source}->{q.target}")
+            alt_settled = float(np.mean([q.settled for q in res]))
+
+            rows.append(
+                {
+                    "n": n,
+                    "m": len(edges),
+                    "queries": queries,
+                    "landmarks": k,
+                    "build_s": build_time,
+                    "dijkstra_query_ms": 1000 * base_time / queries,
+                    "alt_query_ms": 1000 * alt_time / queries,
+                    "dijkstra_settled": base_settled,
+                    "alt_settled": alt_settled,
+                    "settled_speedup": base_settled / alt_settled if alt_settled else float("inf"),
+                    "time_speedup": base_time / alt_time if alt_time else float("inf"),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def bench_ch(
+    sizes: List[int],
+    density: float,
+    seed: int,
+    queries: int,
+    out_dir: str,
+    witness_settle_limit: int = 64,
+) -> pd.DataFrame:
+    """Constrói, grava e relê o índice CH; as consultas usam o índice relido e são conferidas com `dijkstra_heap`."""
+    rows = []
+    for n in sizes:
+        g_seed = _sim_seed(seed, 2, n)
+        edges = generate_cyclic_nonnegative(n=n, density=density, seed=g_seed)
+        succs = to_successor_list(n, edges)
+
+        t0 = perf_counter()
+        index, st = build_ch(succs, witness_settle_limit=witness_settle_limit)
+        build_time = perf_counter() - t0
+
+        index_path = os.path.join(out_dir, f"ch_n{n}.npz")
+        save_ch(index, index_path)
+        t0 = perf_counter()
+        index = load_ch(index_path)
+        index.adjacency_lists()
+        load_time = perf_counter() - t0
+
+        rng = np.random.default_rng(g_seed)
+        pairs = rng.integers(n, size=(queries, 2)).tolist()
+
+        t0 = perf_counter()
+        res = [ch_query(index, s, t) for s, t in pairs]
+        ch_time = perf_counter() - t0
+
+        t0 = perf_counter()
+        base = [dijkstra_query(succs, s, t) for s, t in pairs]
+        base_time = perf_counter() - t0
+
+        trees = {}
+        for q in res:
+            if q.source not in trees:
+                trees[q.source] = dijkstra_heap(succs, root=q.source)[0]
+            if q.distance != trees[q.source][q.target]:
+                raise AssertionError(f"CH divergiu de dijkstra_heap em {q.source}->{q.target}")
+
+        rows.append(
+            {
+                "n": n,
+                "m": len(edges),
+                "queries": queries,
+                "build_s": build_time,
+                "shortcuts": st.shortcuts,
+                "witness_searches": st.witness_searches,
+                "index_arcs": index.up.m + index.down.m,
+                "index_bytes": os.path.getsize(index_path),
+                "load_s": load_time,
+                "ch_query_ms": 1000 * ch_time / queries,
+                "dijkstra_query_ms": 1000 * base_time / queries,
+                "ch_settled": float(np.mean([q.settled for q in res])),
+                "dijkstra_settled": float(np.mean([q.settled for q in base])),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def bench_delta(
+    sizes: List[int],
+    densities: List[float],
+    seed: int,
+    deltas: List[Optional[float]],
+    workers: List[int],
+) -> pd.DataFrame:
+    """Delta-stepping (sobre CSR) vs. `dijkstra_heap` (listas) a partir de X1; distâncias conferidas."""
+    rows = []
+    for n in sizes:
+        for density in densities:
+            g_seed = _sim_seed(seed, 2, n)
+            edges = generate_cyclic_nonnegative(n=n, density=density, seed=g_seed)
+            succs = to_successor_list(n, edges)
+            csr = to_csr(n, edges)
+
+            t0 = perf_counter()
+            ref, _, _ = dijkstra_heap(succs, root=0)
+            base_time = perf_counter() - t0
+
+            for delta in deltas:
+                for w in workers:
+                    t0 = perf_counter()
+                    dist, _, st = delta_stepping(csr, root=0, delta=delta, workers=w)
+                    run_time = perf_counter() - t0
+                    if dist != ref:
+                        raise AssertionError(f"delta-stepping divergiu de dijkstra_heap (n={n}, Δ={st.delta})")
+                    rows.append(
+                        {
+                            "n": n,
+                            "density": density,
+                            "m": len(edges),
+                            "delta": st.delta,
+                            "delta_default": default_delta(csr),
+                            "workers": w,
+                            "buckets": st.buckets,
+                            "phases": st.phases,
+                            "relaxations": st.light_relaxations + st.heavy_relaxations,
+                            "delta_s": run_time,
+                            "dijkstra_s": base_time,
+                            "speedup": base_time / run_time if run_time else float("inf"),
+                        }
+                    )
+    return pd.DataFrame(rows)
+
+
+def bench_floyd_batch(
+    sizes: List[int],
+    density: float,
+    seed: int,
+    graphs: int,
+) -> pd.DataFrame:
+    """B grafos da simulação 3 (seeds seed..seed+B-1) por n: lote (B, n, n) vs. um Floyd por grafo."""
+    rows = []
+    for n in sizes:
+        edge_lists = [
+            generate_cyclic_with_negative_no_neg_cycles(n=n, density=density, seed=_sim_seed(seed + b, 3, n))
+            for b in range(graphs)
+        ]
+        t0 = perf_counter()
+        mats = to_cost_matrices(n, edge_lists)
+        build_time = perf_counter() - t0
+
+        t0 = perf_counter()
+        dist, nxt, st = floyd_warshall_batched(mats)
+        batch_time = perf_counter() - t0
+
+        t0 = perf_counter()
+        for b in range(graphs):
+            d_b, nxt_b, _ = floyd_warshall_numpy(mats[b])
+            if not (np.array_equal(d_b, dist[b]) and np.array_equal(nxt_b, nxt[b])):
+                raise AssertionError(f"lote divergiu de floyd_warshall_numpy (n={n}, grafo {b})")
+        single_time = perf_counter() - t0
+
+        rows.append(
+            {
+                "n": n,
+                "graphs": graphs,
+                "tensor_bytes": int(mats.nbytes),
+                "build_s": build_time,
+                "batched_s": batch_time,
+                "per_graph_s": single_time,
+                "speedup": single_time / batch_time if batch_time else float("inf"),
+                "negative_cycles": int(st.negative_cycle.sum()),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def _transpose_lists(succs: list) -> list:
+    preds = [[] for _ in succs]
+    for u, items in enumerate(succs):
+        for v, w in items:
+            preds[v].append((u, w))
+    return preds
+
+
+def _random_updates(
+    ds: DynamicSSSP,
+    count: int,
+    rng: np.random.Generator,
+    w_low: int,
+    w_high: int,
+    acyclic: bool,
+) -> list:
+    """Mistura de inserções, remoções e trocas de custo; com acyclic, só arcos u -> v com u < v."""
+    n = ds.n
+    updates = []
+    out = [dict(d) for d in ds.out]
+    for _ in range(count):
+        u, v = (int(x) for x in rng.choice(n, size=2, replace=False))
+        if acyclic and u > v:
+            u, v = v, u
+        kind = rng.random()
+        if kind < 1 / 3 and out[u]:
+            keys = list(out[u])
+            v = keys[int(rng.integers(len(keys)))]
+            del out[u][v]
+            updates.append((u, v, None))
+        else:
+            w = float(rng.integers(w_low, w_high + 1))
+            out[u][v] = w
+            updates.append((u, v, w))
+    return updates
+
+
+def bench_dynamic(
+    sizes: List[int],
+    density: float,
+    seed: int,
+    updates: int,
+) -> pd.DataFrame:
+    """Tempo médio por atualização: reparo incremental vs. recálculo completo (resultados conferidos no fim)."""
+    rows = []
+    for n in sizes:
+        cases = [
+            ("dijkstra", 2, generate_cyclic_nonnegative, False),
+            ("dag", 1, generate_dag_negative_costs, True),
+        ]
+        for name, sim_id, gen, acyclic in cases:
+            g_seed = _sim_seed(seed, sim_id, n)
+            edges = gen(n=n, density=density, seed=g_seed)
+            succs = to_successor_list(n, edges)
+            if name == "dijkstra":
+                dist, pred, _ = dijkstra_heap(succs, root=0)
+            else:
+                dist, pred, _ = shortest_paths_bellman_dag_iterative(to_predecessor_list(n, edges), root=0)
+            ds = DynamicSSSP(succs, dist, pred, root=0)
+            w_low = 1 if name == "dijkstra" else -10
+            batch = _random_updates(ds, updates, np.random.default_rng(g_seed), w_low, 100, acyclic)
+
+            t0 = perf_counter()
+            st = ds.apply(batch)
+            update_time = perf_counter() - t0
+
+            # recálculo completo medido uma vez, no grafo final; speedup = um recálculo por atualização
+            current = ds.successors()
+            t0 = perf_counter()
+            if name == "dijkstra":
+                ref, _, _ = dijkstra_heap(current, root=0)
+            else:
+                ref, _, _ = shortest_paths_bellman_dag_iterative(_transpose_lists(current), root=0)
+            recompute_time = perf_counter() - t0
+            if not np.allclose(ref, ds.dist):
+                raise AssertionError(f"reparo incremental divergiu do recálculo ({name}, n={n})")
+
+            rows.append(
+                {
+                    "solver": name,
+                    "n": n,
+                    "m": len(edges),
+                    "updates": updates,
+                    "affected_mean": st.affected / updates,
+                    "relaxations_mean": st.relaxations / updates,
+                    "update_ms": 1000 * update_time / updates,
+                    "recompute_ms": 1000 * recompute_time,
+                    "speedup": recompute_time * updates / update_time if update_time else float("inf"),
+                }
+            )
+
+        # Floyd: só inserções / reduções de custo, sem fechar ciclo negativo
+        g_seed = _sim_seed(seed, 3, n)
+        edges = generate_cyclic_with_negative_no_neg_cycles(n=n, density=density, seed=g_seed)
+        mat = to_cost_matrices(n, [edges])[0]
+        dist, nxt, _ = floyd_warshall_numpy(mat)
+        rng = np.random.default_rng(g_seed)
+        floyd_updates = max(1, updates // 10)
+        t_update = 0.0
+        relaxations = 0
+        for _ in range(floyd_updates):
+            u, v = (int(x) for x in rng.choice(n, size=2, replace=False))
+            w = min(float(rng.integers(-10, 101)), mat[u, v])
+            if np.isfinite(dist[v, u]):
+                w = max(w, -dist[v, u])
+            mat[u, v] = w
+            t0 = perf_counter()
+            relaxations += floyd_update_edge(dist, nxt, u, v, w).relaxations
+            t_update += perf_counter() - t0
+        t0 = perf_counter()
+        ref, _, _ = floyd_warshall_numpy(mat)
+        recompute_time = perf_counter() - t0
+        if not np.array_equal(ref, dist):
+            raise AssertionError(f"atualização do Floyd divergiu do recálculo (n={n})")
+        rows.append(
+            {
+                "solver": "floyd",
+                "n": n,
+                "m": len(edges),
+                "updates": floyd_updates,
+                "affected_mean": float("nan"),
+                "relaxations_mean": relaxations / floyd_updates,
+                "update_ms": 1000 * t_update / floyd_updates,
+                "recompute_ms": 1000 * recompute_time,
+                "speedup": recompute_time * floyd_updates / t_update if t_update else float("inf"),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def main() -> int:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--density", type=float, default=0.25, help="Densidade aproximada de arestas")
+    common.add_argument("--seed", type=int, default=42, help="Seed")
+    common.add_argument("--out", type=str, default="results", help="Pasta de resultados")
+
+    ap = argparse.ArgumentParser(description="Benchmarks das engines alternativas")
+    sub = ap.add_subparsers(dest="bench", required=True)
+
+    ap_alt = sub.add_parser("alt", parents=[common], help="A* com landmarks vs. Dijkstra ponto a ponto (simulação 2)")
+    ap_alt.add_argument("--sizes", type=int, nargs="+", default=[100, 1000], help="Tamanhos n")
+    ap_alt.add_argument("--queries", type=int, default=100, help="Consultas (s, t) aleatórias por n")
+    ap_alt.add_argument("--landmarks", type=int, nargs="+", default=[4, 8, 16], help="Valores de k")
+
+    ap_ch = sub.add_parser("ch", parents=[common], help="Contraction hierarchies vs. Dijkstra ponto a ponto (simulação 2)")
+    ap_ch.add_argument("--sizes", type=int, nargs="+", default=[100, 500], help="Tamanhos n")
+    ap_ch.add_argument("--queries", type=int, default=100, help="Consultas (s, t) aleatórias por n")
+    ap_ch.add_argument("--witness-limit", type=int, default=64, help="Vértices fechados por busca de testemunha")
+    # CH só compensa em grafos esparsos
+    ap_ch.set_defaults(density=0.01)
+
+    ap_delta = sub.add_parser("delta", parents=[common], help="Delta-stepping vs. dijkstra_heap (simulação 2)")
+    ap_delta.add_argument("--sizes", type=int, nargs="+", default=[1000, 3000], help="Tamanhos n")
+    ap_delta.add_argument("--densities", type=float, nargs="+", default=[0.01, 0.05, 0.25], help="Densidades")
+    ap_delta.add_argument("--deltas", type=float, nargs="+", help="Valores de Δ (padrão: só a heurística)")
+    ap_delta.add_argument("--workers", type=int, nargs="+", default=[1], help="Números de workers")
+
+    ap_fb = sub.add_parser("floyd-batch", parents=[common], help="Floyd em lote (B, n, n) vs. um Floyd por grafo (simulação 3)")
+    ap_fb.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100], help="Tamanhos n")
+    ap_fb.add_argument("--graphs", type=int, default=200, help="Grafos (seeds) por n")
+
+    ap_dyn = sub.add_parser("dynamic", parents=[common], help="Reparo incremental após atualizações de arcos vs. recálculo")
+    ap_dyn.add_argument("--sizes", type=int, nargs="+", default=[300, 1000], help="Tamanhos n")
+    ap_dyn.add_argument("--updates", type=int, default=100, help="Atualizações por grafo (Floyd: um décimo)")
+    ap_dyn.set_defaults(density=0.01)
+
+    args = ap.parse_args()
+    os.makedirs(args.out, exist_ok=True)
+
+    if args.bench == "alt":
+        df = bench_alt(args.sizes, args.density, args.seed, args.queries, args.landmarks)
+    elif args.bench == "delta":
+        deltas = args.deltas if args.deltas else [None]
+        df = bench_delta(args.sizes, args.densities, args.seed, deltas, args.workers)
+    elif args.bench == "floyd-batch":
+        df = bench_floyd_batch(args.sizes, args.density, args.seed, args.graphs)
+    elif args.bench == "dynamic":
+        df = bench_dynamic(args.sizes, args.density, args.seed, args.updates)
+    elif args.bench == "ch":
+        df = bench_ch(args.sizes, args.density, args.seed, args.queries, args.out, args.witness_limit)
+    else:
+        ap.error(f"benchmark desconhecido: {args.bench}")
+
+    df.to_csv(os.path.join(args.out, f"bench_{args.bench}.csv"), index=False, encoding="utf-8")
+    print(df.to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
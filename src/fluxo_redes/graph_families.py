@@ -0,0 +1,319 @@
+"""Famílias de grafos esparsos para testes de escala.
+
+Os geradores de `graph_generators` produzem grafos densos do tipo
+Erdős–Rényi com a corrente X1 -> ... -> Xn. Os grafos reais (redes viárias,
+redes sociais, pipelines) são esparsos, de grau baixo e diâmetro alto, ou têm
+distribuição de graus assimétrica. Aqui cada família devolve um `EdgeArray`
+com exatamente n vértices, sorteado de forma vetorizada a partir da seed:
+
+- "grid": grade 2D (4-vizinhança) com custos aleatórios; X1 é um canto;
+- "geometric": grafo geométrico aleatório no quadrado unitário (pontos a
+  distância <= raio), custo proporcional ao comprimento (parecido com ruas);
+  os vértices são numerados pela distância ao centro, então X1 é o ponto
+  central (longe da borda, quase sempre na componente gigante);
+- "ba": Barabási–Albert (ligação preferencial) pelo algoritmo de Batagelj &
+  Brandes, com os sorteios resolvidos por saltos de ponteiros; X1 é o
+  vértice mais antigo (um hub);
+- "rmat": R-MAT (quadrantes recursivos com probabilidades a, b, c, d);
+- "layered": DAG em camadas de largura fixa, com arcos só para a camada
+  seguinte (diâmetro ~ n / largura); X1 liga-se à primeira camada.
+
+Cada família tem uma variante por restrição (`CONSTRAINTS`):
+- "dag" (simulação 1): cada aresta orientada pela ordem (nível BFS a partir
+  de X1, índice), o que mantém a componente de X1 alcançável; custos
+  negativos com probabilidade neg_fraction;
+- "nonnegative" (simulação 2): as duas orientações de cada aresta, custos >= 0;
+- "potential" (simulação 3): as duas orientações, w = b + pi[v] - pi[u] com
+  b >= 1, o que permite custos negativos sem ciclo negativo.
+"R-MAT" já é direcionado e, na variante "dag", só é reorientado do menor para
+o maior índice; "layered" é sempre um DAG e a restrição muda apenas os custos.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .graph_generators import EdgeArray
+from .representations import csr_from_arrays
+from .algorithms.bellman_divide_conquer import _segment_positions
+
+
+FAMILIES = ["grid", "geometric", "ba", "rmat", "layered"]
+
+# restrição de cada simulação
+CONSTRAINTS = ["dag", "nonnegative", "potential"]
+
+# pontos por vez na busca de vizinhos do grafo geométrico
+_GEOMETRIC_CHUNK = 1 << 16
+
+
+def _bfs_levels(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Nível BFS de cada vértice a partir de X1 no grafo sem orientação (n se inalcançável)."""
+    g = csr_from_arrays(n, np.concatenate([u, v]), np.concatenate([v, u]), np.zeros(2 * u.size), index_dtype=np.int64)
+    level = np.full(n, n, dtype=np.int64)
+    if n == 0:
+        return level
+    level[0] = 0
+    frontier = np.zeros(1, dtype=np.int64)
+    depth = 0
+    while frontier.size:
+        depth += 1
+        pos, _ = _segment_positions(g.indptr, frontier)
+        nb = g.indices[pos]
+        nb = np.unique(nb[level[nb] == n])
+        level[nb] = depth
+        frontier = nb
+    return level
+
+
+def _undirected_to_arcs(n: int, u: np.ndarray, v: np.ndarray, constraint: str) -> tuple[np.ndarray, np.ndarray]:
+    """Arestas sem orientação -> arcos: as duas orientações, ou uma só na variante "dag".
+
+    No "dag", cada aresta vai do vértice de menor (nível BFS a partir de X1,
+    índice) para o de maior: a ordem é total, então não há ciclos, e todo
+    vértice da componente de X1 tem um arco vindo do nível anterior
+    (continua alcançável a partir de X1).
+    """
+    if constraint == "dag":
+        key = _bfs_levels(n, u, v) * n + np.arange(n, dtype=np.int64)
+        forward = key[u] < key[v]
+        return np.where(forward, u, v), np.where(forward, v, u)
+    return np.concatenate([u, v]), np.concatenate([v, u])
+
+
+def _unique_pairs(u: np.ndarray, v: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Remove laços e pares repetidos (ordem crescente de u * n + v)."""
+    keep = u != v
+    key = np.unique(u[keep] * n + v[keep])
+    return key // n, key % n
+
+
+def _apply_constraint(
+    rng: np.random.Generator,
+    n: int,
+    u: np.ndarray,
+    v: np.ndarray,
+    base: np.ndarray,
+    constraint: str,
+    neg_fraction: float,
+    potential_range: Tuple[int, int],
+) -> EdgeArray:
+    """Custos finais a partir de custos base >= 1, conforme a restrição."""
+    if constraint not in CONSTRAINTS:
+        raise ValueError(f"restrição desconhecida: {constraint}")
+    w = base.astype(np.float64)
+    if constraint == "dag":
+        w[rng.random(w.size) < neg_fraction] *= -1
+    elif constraint == "potential":
+        pi = rng.integers(potential_range[0], potential_range[1] + 1, size=n)
+        w += pi[v] - pi[u]
+    return EdgeArray(u, v, w)
+
+
+def grid_graph(
+    n: int,
+    constraint: str = "nonnegative",
+    seed: Optional[int] = None,
+    cols: Optional[int] = None,
+    weight_range: Tuple[int, int] = (1, 30),
+    neg_fraction: float = 0.35,
+    potential_range: Tuple[int, int] = (-20, 20),
+) -> EdgeArray:
+    """Grade com cols colunas (padrão: ⌈√n⌉), vértice r * cols + c; a última linha pode ficar incompleta."""
+    rng = np.random.default_rng(seed)
+    if cols is None:
+        cols = max(1, math.ceil(math.sqrt(n)))
+    ids = np.arange(n, dtype=np.int64)
+    right = ids[(ids % cols != cols - 1) & (ids + 1 < n)]
+    down = ids[ids + cols < n]
+    u = np.concatenate([right, down])
+    v = np.concatenate([right + 1, down + cols])
+    u, v = _undirected_to_arcs(n, u, v, constraint)
+    base = rng.integers(weight_range[0], weight_range[1] + 1, size=u.size)
+    return _apply_constraint(rng, n, u, v, base, constraint, neg_fraction, potential_range)
+
+
+def random_geometric_graph(
+    n: int,
+    constraint: str = "nonnegative",
+    seed: Optional[int] = None,
+    avg_degree: float = 6.0,
+    radius: Optional[float] = None,
+    max_weight: int = 30,
+    neg_fraction: float = 0.35,
+    potential_range: Tuple[int, int] = (-20, 20),
+) -> EdgeArray:
+    """Pontos uniformes no quadrado unitário, aresta entre pontos a distância <= radius.
+
+    radius=None escolhe o raio que dá grau médio avg_degree (π r² n ≈ avg_degree).
+    O custo base é ⌈max_weight * comprimento / radius⌉ (entre 1 e max_weight).
+    Os vizinhos são buscados em uma grade de células de lado >= radius: cada
+    ponto só é comparado com os pontos da própria célula e de 4 células vizinhas.
+    """
+    rng = np.random.default_rng(seed)
+    if radius is None:
+        radius = math.sqrt(avg_degree / (math.pi * max(n, 1)))
+    if radius <= 0:
+        raise ValueError("radius deve ser > 0")
+    if n < 2:
+        empty = np.zeros(0, dtype=np.int64)
+        return _apply_constraint(rng, n, empty, empty, empty, constraint, neg_fraction, potential_range)
+    pts = rng.random((n, 2))
+    pts = pts[np.argsort(np.hypot(*(pts - 0.5).T), kind="stable")]
+
+    g = max(1, int(1.0 / radius))
+    cell_xy = np.minimum((pts * g).astype(np.int64), g - 1)
+    cell = cell_xy[:, 0] * g + cell_xy[:, 1]
+    # pontos agrupados por célula, como um CSR célula -> pontos
+    order = np.argsort(cell, kind="stable")
+    indptr = np.zeros(g * g + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cell, minlength=g * g), out=indptr[1:])
+
+    us, vs, ds = [], [], []
+    # metade das 8 células vizinhas (+ a própria): cada par de células é visitado uma vez
+    for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        for c0 in range(0, n, _GEOMETRIC_CHUNK):
+            src = np.arange(c0, min(n, c0 + _GEOMETRIC_CHUNK), dtype=np.int64)
+            tx, ty = cell_xy[src, 0] + dx, cell_xy[src, 1] + dy
+            ok = (tx >= 0) & (tx < g) & (ty >= 0) & (ty < g)
+            src = src[ok]
+            pos, lens = _segment_positions(indptr, tx[ok] * g + ty[ok])
+            a = np.repeat(src, lens)
+            b = order[pos]
+            if dx == 0 and dy == 0:
+                keep = a < b
+                a, b = a[keep], b[keep]
+            d = np.hypot(*(pts[a] - pts[b]).T)
+            near = d <= radius
+            us.append(a[near])
+            vs.append(b[near])
+            ds.append(d[near])
+    u, v, d = np.concatenate(us), np.concatenate(vs), np.concatenate(ds)
+
+    base = np.maximum(1, np.ceil(max_weight * d / radius)).astype(np.int64)
+    if constraint != "dag":
+        base = np.concatenate([base, base])
+    u, v = _undirected_to_arcs(n, u, v, constraint)
+    return _apply_constraint(rng, n, u, v, base, constraint, neg_fraction, potential_range)
+
+
+def barabasi_albert_graph(
+    n: int,
+    constraint: str = "nonnegative",
+    seed: Optional[int] = None,
+    m_attach: int = 3,
+    weight_range: Tuple[int, int] = (1, 30),
+    neg_fraction: float = 0.35,
+    potential_range: Tuple[int, int] = (-20, 20),
+) -> EdgeArray:
+    """Ligação preferencial: cada vértice novo liga-se a m_attach vértices, com probabilidade proporcional ao grau.
+
+    Batagelj & Brandes: o array M guarda as extremidades das arestas na ordem de
+    criação (M[2k] = vértice novo da aresta k) e M[2k+1] = M[r], r uniforme em
+    0..2k. As posições ímpares apontam para posições anteriores; elas são
+    resolvidas em lote, seguindo os ponteiros até uma posição par.
+    """
+    rng = np.random.default_rng(seed)
+    if m_attach < 1:
+        raise ValueError("m_attach deve ser >= 1")
+    k = np.arange(n * m_attach, dtype=np.int64)
+    r = rng.integers(0, 2 * k + 1)
+    ptr = r.copy()
+    odd = np.flatnonzero(ptr % 2 == 1)
+    while odd.size:
+        ptr[odd] = r[(ptr[odd] - 1) // 2]
+        odd = odd[ptr[odd] % 2 == 1]
+    src = k // m_attach
+    dst = (ptr // 2) // m_attach
+
+    # laços e arestas repetidas do sorteio são descartados
+    lo, hi = _unique_pairs(np.minimum(src, dst), np.maximum(src, dst), n)
+    u, v = _undirected_to_arcs(n, lo, hi, constraint)
+    base = rng.integers(weight_range[0], weight_range[1] + 1, size=u.size)
+    return _apply_constraint(rng, n, u, v, base, constraint, neg_fraction, potential_range)
+
+
+def rmat_graph(
+    n: int,
+    constraint: str = "nonnegative",
+    seed: Optional[int] = None,
+    edge_factor: int = 8,
+    probs: Tuple[float, float, float, float] = (0.57, 0.19, 0.19, 0.05),
+    weight_range: Tuple[int, int] = (1, 30),
+    neg_fraction: float = 0.35,
+    potential_range: Tuple[int, int] = (-20, 20),
+) -> EdgeArray:
+    """R-MAT com edge_factor * n sorteios sobre a matriz 2^s x 2^s (2^s >= n); pares fora de 0..n-1 são descartados."""
+    rng = np.random.default_rng(seed)
+    a, b, c, d = probs
+    if not math.isclose(a + b + c + d, 1.0):
+        raise ValueError("as probabilidades do R-MAT devem somar 1")
+    scale = max(1, math.ceil(math.log2(max(n, 2))))
+    draws = edge_factor * n
+    u = np.zeros(draws, dtype=np.int64)
+    v = np.zeros(draws, dtype=np.int64)
+    for _ in range(scale):
+        x = rng.random(draws)
+        # quadrantes: a = (0, 0), b = (0, 1), c = (1, 0), d = (1, 1)
+        u = 2 * u + (x >= a + b)
+        v = 2 * v + (((x >= a) & (x < a + b)) | (x >= a + b + c))
+    inside = (u < n) & (v < n)
+    u, v = u[inside], v[inside]
+    if constraint == "dag":
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    u, v = _unique_pairs(u, v, n)
+    base = rng.integers(weight_range[0], weight_range[1] + 1, size=u.size)
+    return _apply_constraint(rng, n, u, v, base, constraint, neg_fraction, potential_range)
+
+
+def layered_dag(
+    n: int,
+    constraint: str = "dag",
+    seed: Optional[int] = None,
+    width: Optional[int] = None,
+    out_degree: int = 3,
+    weight_range: Tuple[int, int] = (1, 30),
+    neg_fraction: float = 0.35,
+    potential_range: Tuple[int, int] = (-20, 20),
+) -> EdgeArray:
+    """X1 -> camada 0 -> camada 1 -> ..., camadas de width vértices (padrão: ⌈√(n-1)⌉).
+
+    Cada vértice liga-se ao vértice na mesma posição da camada seguinte (o que
+    garante alcançabilidade a partir de X1) e a out_degree vértices sorteados dela.
+    """
+    rng = np.random.default_rng(seed)
+    if n < 2:
+        empty = np.zeros(0, dtype=np.int64)
+        return _apply_constraint(rng, n, empty, empty, empty, constraint, neg_fraction, potential_range)
+    if width is None:
+        width = max(1, math.ceil(math.sqrt(n - 1)))
+    first = np.arange(1, min(n, 1 + width), dtype=np.int64)
+    ids = np.arange(1, n, dtype=np.int64)
+    layer = (ids - 1) // width
+    straight = ids[ids + width < n]
+    rand_src = np.repeat(ids, out_degree)
+    rand_dst = 1 + (np.repeat(layer, out_degree) + 1) * width + rng.integers(0, width, size=rand_src.size)
+    ok = rand_dst < n
+    u = np.concatenate([np.zeros(first.size, dtype=np.int64), straight, rand_src[ok]])
+    v = np.concatenate([first, straight + width, rand_dst[ok]])
+    u, v = _unique_pairs(u, v, n)
+    base = rng.integers(weight_range[0], weight_range[1] + 1, size=u.size)
+    return _apply_constraint(rng, n, u, v, base, constraint, neg_fraction, potential_range)
+
+
+def generate_family(family: str, n: int, constraint: str, seed: Optional[int] = None) -> EdgeArray:
+    """Grafo da família com os parâmetros padrão (grau médio baixo, independente de n)."""
+    if family == "grid":
+        return grid_graph(n, constraint, seed)
+    if family == "geometric":
+        return random_geometric_graph(n, constraint, seed)
+    if family == "ba":
+        return barabasi_albert_graph(n, constraint, seed)
+    if family == "rmat":
+        return rmat_graph(n, constraint, seed)
+    if family == "layered":
+        return layered_dag(n, constraint, seed)
+    raise ValueError(f"família desconhecida: {family}")
@@ -6,12 +6,28 @@ as restrições de cada simulação.
 
 Representação interna: lista de arestas (u, v, w) com vértices 0..n-1.
 X1 corresponde ao índice 0.
+
+Os geradores `generate_*` sorteiam cada par (u, v) em laços Python. As
+versões `generate_*_arrays` seguem o mesmo modelo (corrente X1->...->Xn mais
+cada par elegível com probabilidade density), mas devolvem arrays (u, v, w)
+sorteados de forma vetorizada:
+- "block": máscara rng.random < density por blocos de linhas da matriz n x n;
+- "skip": amostragem por saltos geométricos (Batagelj & Brandes): os pares
+  sorteados são percorridos em ordem, com distância entre dois sorteados
+  consecutivos ~ Geométrica(density), em O(n + m) em vez de O(n²);
+- "auto": "skip" se density < SKIP_SAMPLING_MAX_DENSITY, senão "block".
+A sequência aleatória é outra, então a mesma seed gera outro grafo (com a
+mesma distribuição); legacy=True chama o gerador com laços e converte o
+resultado, reproduzindo exatamente os grafos das seeds já usadas.
+
+`EdgeArray` embrulha esses arrays e é aceito no lugar de List[Edge] pelas
+conversões de `representations` e por `edge_stats`.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -25,6 +41,100 @@ class Edge:
     w: float
 
 
+# (u, v, w) como arrays int64, int64, float64
+EdgeArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+SAMPLING_METHODS = ["auto", "block", "skip"]
+
+# abaixo desta densidade os pares são sorteados por saltos geométricos
+SKIP_SAMPLING_MAX_DENSITY = 0.1
+
+# elementos da máscara por bloco de linhas (amostragem "block")
+_BLOCK_ELEMENTS = 1 << 22
+
+# saltos geométricos sorteados por vez (amostragem "skip")
+_SKIP_CHUNK = 1 << 20
+
+
+@dataclass
+class EdgeArray:
+    """Arestas u->v com custo w em arrays paralelos, no lugar de uma List[Edge].
+
+    Aceita pelas funções de `representations` e por `edge_stats` sem criar um
+    objeto Python por aresta. Iterar (ou indexar com um inteiro) devolve
+    `Edge`s, para o código que ainda percorre as arestas uma a uma.
+    """
+
+    u: np.ndarray
+    v: np.ndarray
+    w: np.ndarray
+
+    def __post_init__(self) -> None:
+        self.u = np.asarray(self.u, dtype=np.int64)
+        self.v = np.asarray(self.v, dtype=np.int64)
+        self.w = np.asarray(self.w, dtype=np.float64)
+        if not (self.u.shape == self.v.shape == self.w.shape and self.u.ndim == 1):
+            raise ValueError("u, v e w devem ser arrays 1-D do mesmo tamanho")
+
+    @classmethod
+    def from_edges(cls, edges: List[Edge]) -> "EdgeArray":
+        return cls(*edges_to_arrays(edges))
+
+    def __len__(self) -> int:
+        return int(self.u.size)
+
+    def __getitem__(self, i: int) -> Edge:
+        return Edge(int(self.u[i]), int(self.v[i]), float(self.w[i]))
+
+    def __iter__(self) -> Iterator[Edge]:
+        return iter(arrays_to_edges(self.u, self.v, self.w))
+
+    def arrays(self) -> EdgeArrays:
+        return self.u, self.v, self.w
+
+    def to_edges(self) -> List[Edge]:
+        return arrays_to_edges(self.u, self.v, self.w)
+
+    def dedup(self) -> "EdgeArray":
+        """Mesmo resultado de `_dedup_edges`, vetorizado: sem laços, última ocorrência de cada (u, v).
+
+        Ordenação lexicográfica por (u, v, posição): em cada grupo, o último
+        elemento dá o custo e o primeiro a posição do par na saída (a ordem de
+        primeira inserção, como no dicionário de `_dedup_edges`).
+        """
+        pos = np.flatnonzero(self.u != self.v)
+        u, v = self.u[pos], self.v[pos]
+        order = np.lexsort((pos, v, u))
+        su, sv = u[order], v[order]
+        starts = np.ones(order.size, dtype=bool)
+        starts[1:] = (su[1:] != su[:-1]) | (sv[1:] != sv[:-1])
+        first = np.flatnonzero(starts)
+        last = np.append(first[1:] - 1, order.size - 1).astype(np.int64)
+        out = np.argsort(pos[order[first]], kind="stable")
+        keep = pos[order[last]][out]
+        return EdgeArray(self.u[keep], self.v[keep], self.w[keep])
+
+
+# List[Edge] ou EdgeArray
+EdgeInput = Union[List[Edge], EdgeArray]
+
+
+def edges_to_arrays(edges: EdgeInput) -> EdgeArrays:
+    """Lista de arestas -> arrays (u, v, w); para um EdgeArray, os próprios arrays (sem cópia)."""
+    if isinstance(edges, EdgeArray):
+        return edges.arrays()
+    m = len(edges)
+    u = np.fromiter((e.u for e in edges), dtype=np.int64, count=m)
+    v = np.fromiter((e.v for e in edges), dtype=np.int64, count=m)
+    w = np.fromiter((e.w for e in edges), dtype=np.float64, count=m)
+    return u, v, w
+
+
+def arrays_to_edges(u: np.ndarray, v: np.ndarray, w: np.ndarray) -> List[Edge]:
+    """Arrays (u, v, w) -> lista de arestas, para as funções que recebem List[Edge]."""
+    return [Edge(a, b, c) for a, b, c in zip(u.tolist(), v.tolist(), w.tolist())]
+
+
 def _dedup_edges(edges: List[Edge]) -> List[Edge]:
     """Remove duplicatas (mantendo a última ocorrência) e garante ausência de laços."""
     m = {}
@@ -138,12 +248,170 @@ def generate_cyclic_with_negative_no_neg_cycles(
     return _dedup_edges(edges)
 
 
-def edge_stats(edges: List[Edge]) -> dict:
+def _sample_pairs(
+    rng: np.random.Generator,
+    rows: int,
+    n: int,
+    density: float,
+    method: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Cada par (i, v) de uma faixa rows x n com probabilidade density, em ordem de linha (i relativo à faixa)."""
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"método de amostragem desconhecido: {method}")
+    if method == "auto":
+        method = "skip" if density < SKIP_SAMPLING_MAX_DENSITY else "block"
+    if rows == 0 or n == 0 or density <= 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+
+    if method == "block":
+        rows_per_block = max(1, _BLOCK_ELEMENTS // n)
+        us, vs = [], []
+        for r0 in range(0, rows, rows_per_block):
+            r1 = min(rows, r0 + rows_per_block)
+            bu, bv = np.nonzero(rng.random((r1 - r0, n)) < density)
+            us.append(bu.astype(np.int64) + r0)
+            vs.append(bv.astype(np.int64))
+        return np.concatenate(us), np.concatenate(vs)
+
+    # "skip": índice linear i*n + v do próximo par sorteado = anterior + salto geométrico
+    total = rows * n
+    if density >= 1:
+        linear = np.arange(total, dtype=np.int64)
+    else:
+        expected = total * density
+        chunk = int(min(_SKIP_CHUNK, expected + 4 * np.sqrt(expected) + 16))
+        parts = []
+        last = -1
+        while last < total:
+            idx = last + np.cumsum(rng.geometric(density, size=chunk))
+            parts.append(idx[idx < total])
+            last = int(idx[-1])
+        linear = np.concatenate(parts)
+    return linear // n, linear % n
+
+
+def _chain_and_pairs(
+    rng: np.random.Generator,
+    n: int,
+    r0: int,
+    r1: int,
+    density: float,
+    method: str,
+    acyclic: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Arcos com origem nas linhas r0..r1-1: trecho da corrente X1 -> ... -> Xn e pares sorteados elegíveis."""
+    cu = np.arange(r0, min(r1, n - 1), dtype=np.int64)
+    pu, pv = _sample_pairs(rng, r1 - r0, n, density, method)
+    pu += r0
+    # a corrente já cobre v = u + 1; no DAG, só arcos u -> v com u < v
+    keep = pv > pu + 1 if acyclic else (pu != pv) & (pv != pu + 1)
+    return np.concatenate([cu, pu[keep]]), np.concatenate([cu + 1, pv[keep]])
+
+
+def _dag_negative_rows(
+    rng: np.random.Generator,
+    n: int,
+    r0: int,
+    r1: int,
+    density: float,
+    method: str,
+    neg_fraction: float = 0.35,
+    weight_range: Tuple[int, int] = (1, 20),
+) -> EdgeArrays:
+    u, v = _chain_and_pairs(rng, n, r0, r1, density, method, acyclic=True)
+    w = rng.integers(weight_range[0], weight_range[1] + 1, size=u.size).astype(np.float64)
+    w[rng.random(u.size) < neg_fraction] *= -1
+    return u, v, w
+
+
+def _cyclic_nonnegative_rows(
+    rng: np.random.Generator,
+    n: int,
+    r0: int,
+    r1: int,
+    density: float,
+    method: str,
+    weight_range: Tuple[int, int] = (1, 30),
+) -> EdgeArrays:
+    u, v = _chain_and_pairs(rng, n, r0, r1, density, method, acyclic=False)
+    w = rng.integers(weight_range[0], weight_range[1] + 1, size=u.size).astype(np.float64)
+    return u, v, w
+
+
+def _no_neg_cycles_rows(
+    rng: np.random.Generator,
+    n: int,
+    r0: int,
+    r1: int,
+    density: float,
+    method: str,
+    pi: np.ndarray,
+    base_range: Tuple[int, int] = (1, 25),
+) -> EdgeArrays:
+    """Custos w = b + pi[v] - pi[u]; pi é global (o mesmo para todas as faixas de linhas)."""
+    u, v = _chain_and_pairs(rng, n, r0, r1, density, method, acyclic=False)
+    b = rng.integers(base_range[0], base_range[1] + 1, size=u.size)
+    w = (b + pi[v] - pi[u]).astype(np.float64)
+    return u, v, w
+
+
+def generate_dag_negative_costs_arrays(
+    n: int,
+    density: float,
+    seed: Optional[int] = None,
+    neg_fraction: float = 0.35,
+    weight_range: Tuple[int, int] = (1, 20),
+    method: str = "auto",
+    legacy: bool = False,
+) -> EdgeArrays:
+    """Versão vetorizada de `generate_dag_negative_costs`: arrays (u, v, w), arcos só i -> j com i < j."""
+    if legacy:
+        return edges_to_arrays(generate_dag_negative_costs(n, density, seed, neg_fraction, weight_range))
+    rng = np.random.default_rng(seed)
+    return _dag_negative_rows(rng, n, 0, n, density, method, neg_fraction, weight_range)
+
+
+def generate_cyclic_nonnegative_arrays(
+    n: int,
+    density: float,
+    seed: Optional[int] = None,
+    weight_range: Tuple[int, int] = (1, 30),
+    method: str = "auto",
+    legacy: bool = False,
+) -> EdgeArrays:
+    """Versão vetorizada de `generate_cyclic_nonnegative`: arrays (u, v, w) com pesos não-negativos."""
+    if legacy:
+        return edges_to_arrays(generate_cyclic_nonnegative(n, density, seed, weight_range))
+    rng = np.random.default_rng(seed)
+    return _cyclic_nonnegative_rows(rng, n, 0, n, density, method, weight_range)
+
+
+def generate_cyclic_with_negative_no_neg_cycles_arrays(
+    n: int,
+    density: float,
+    seed: Optional[int] = None,
+    base_range: Tuple[int, int] = (1, 25),
+    potential_range: Tuple[int, int] = (-20, 20),
+    method: str = "auto",
+    legacy: bool = False,
+) -> EdgeArrays:
+    """Versão vetorizada de `generate_cyclic_with_negative_no_neg_cycles` (w = b + pi[v] - pi[u])."""
+    if legacy:
+        return edges_to_arrays(
+            generate_cyclic_with_negative_no_neg_cycles(n, density, seed, base_range, potential_range)
+        )
+    rng = np.random.default_rng(seed)
+    pi = rng.integers(potential_range[0], potential_range[1] + 1, size=n)
+    return _no_neg_cycles_rows(rng, n, 0, n, density, method, pi, base_range)
+
+
+def edge_stats(edges: EdgeInput) -> dict:
     """Resumo simples de estatísticas de arestas."""
-    if not edges:
+    if len(edges) == 0:
         return {"m": 0, "neg_edges": 0, "min_w": None, "max_w": None, "avg_w": None}
 
-    ws = np.array([e.w for e in edges], dtype=float)
+    ws = edges_to_arrays(edges)[2]
     return {
         "m": int(len(edges)),
         "neg_edges": int(np.sum(ws < 0.0)),
@@ -0,0 +1,256 @@
+"""Leitura de grafos externos: DIMACS .gr, Matrix Market .mtx e listas de arestas.
+
+Os leitores devolvem (n, EdgeArray), com vértices 0..n-1 (X1 = primeiro
+vértice do arquivo), prontos para `to_csr`, `to_cost_matrix` etc.
+
+O arquivo é lido em blocos de chunk_bytes (cortados no último fim de linha).
+Em cada bloco, as linhas de dados são separadas das de comentário/cabeçalho
+com operações sobre os bytes (primeiro byte não branco e número de tokens de
+cada linha; linhas em branco são ignoradas e toda linha de dados deve ter o
+mesmo número de colunas da primeira) e os números são convertidos de uma vez
+por `np.loadtxt` sobre esses bytes, sem criar objetos Python por linha. Só as
+linhas que não são dados (poucas) passam pelo Python.
+
+Formatos:
+- DIMACS (9º desafio, caminhos mínimos): "c ..." comentário,
+  "p sp <n> <m>" problema, "a <u> <v> <w>" arco (vértices 1..n);
+- Matrix Market: cabeçalho "%%MatrixMarket matrix coordinate
+  <real|integer|pattern> <general|symmetric>", comentários "%", linha
+  "<linhas> <colunas> <nnz>" e entradas "<i> <j> [valor]" (1..n); "pattern"
+  usa custo 1 e "symmetric" acrescenta o arco j -> i de cada entrada fora da
+  diagonal;
+- lista de arestas: "<u> <v> [w]" separados por espaços, comentários "#" ou
+  "%"; vértices a partir de 0 (ou 1, com one_based=True), sem custo = 1.
+
+Arcos paralelos e laços são mantidos como estão no arquivo; `to_cost_matrix`
+fica com o menor custo de cada par e com min(0, w) na diagonal, e os solvers
+por listas/CSR os tratam naturalmente.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .graph_generators import EdgeArray
+
+
+GRAPH_FORMATS = ["dimacs", "mtx", "edgelist"]
+
+_DEFAULT_CHUNK_BYTES = 1 << 24
+
+_NEWLINE = ord("\n")
+
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[list(b" \t\r\n\v\f")] = True
+
+
+def _chunks(f, chunk_bytes: int) -> Iterator[bytes]:
+    """Blocos do arquivo terminados em fim de linha (o resto vai para o bloco seguinte)."""
+    tail = b""
+    while True:
+        block = f.read(chunk_bytes)
+        if not block:
+            break
+        block = tail + block
+        cut = block.rfind(b"\n")
+        if cut < 0:
+            tail = block
+            continue
+        tail = block[cut + 1:]
+        yield block[: cut + 1]
+    if tail.strip():
+        yield tail + b"\n"
+
+
+def _split_block(
+    block: bytes, is_data: Callable[[np.ndarray], np.ndarray]
+) -> tuple[bytes, int, np.ndarray, List[str]]:
+    """(bytes só das linhas de dados, número dessas linhas, tokens em cada uma, demais linhas não vazias como texto).
+
+    is_data recebe o primeiro byte não branco de cada linha e devolve a máscara
+    das linhas de dados; linhas só com espaços nunca são dados.
+    """
+    buf = np.frombuffer(block, dtype=np.uint8)
+    ends = np.flatnonzero(buf == _NEWLINE)
+    ws = _WHITESPACE[buf]
+    # início de token: byte não branco precedido de branco (ou no início do bloco)
+    tok = np.flatnonzero(~ws & np.concatenate([[True], ws[:-1]]))
+    tok_line = np.searchsorted(ends, tok)
+    counts = np.bincount(tok_line, minlength=ends.size)
+    heads = np.flatnonzero(np.diff(tok_line, prepend=-1))
+    first = np.zeros(ends.size, dtype=np.uint8)
+    first[tok_line[heads]] = buf[tok[heads]]
+    data = (counts > 0) & is_data(first)
+    lines = int(np.count_nonzero(data))
+    if lines == ends.size:
+        return block, lines, counts, []
+
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    rest = ~data & (counts > 0)
+    other = [
+        block[s:e].decode("utf-8", errors="replace").strip()
+        for s, e in zip(starts[rest].tolist(), ends[rest].tolist())
+    ]
+    keep = np.repeat(data, ends - starts + 1)
+    return buf[keep].tobytes(), lines, counts[data], other
+
+
+def _columns(counts: np.ndarray, allowed: Tuple[int, ...], path: str) -> int:
+    """Número de colunas da primeira linha de dados; todas as outras devem ter o mesmo."""
+    if counts.size == 0:
+        return allowed[0]
+    k = int(counts[0])
+    if k not in allowed or np.any(counts != k):
+        raise ValueError(f"número de colunas inválido em {path} (esperado {' ou '.join(map(str, allowed))})")
+    return k
+
+
+def _parse_numbers(data: bytes, lines: int, k: int, path: str) -> np.ndarray:
+    """Números das linhas de dados como matriz (lines, k)."""
+    if lines == 0:
+        return np.zeros((0, k))
+    try:
+        rows = np.loadtxt(io.BytesIO(data), dtype=np.float64, comments=None, ndmin=2)
+    except ValueError as exc:
+        raise ValueError(f"linha de dados inválida em {path}") from exc
+    if rows.shape != (lines, k):
+        raise ValueError(f"linha de dados inválida em {path}")
+    return rows
+
+
+def _starts_with(*chars: str) -> Callable[[np.ndarray], np.ndarray]:
+    codes = np.array([ord(c) for c in chars], dtype=np.uint8)
+    return lambda first: np.isin(first, codes)
+
+
+def _not_comment(*chars: str) -> Callable[[np.ndarray], np.ndarray]:
+    codes = np.array([ord(c) for c in chars], dtype=np.uint8)
+    return lambda first: ~np.isin(first, codes)
+
+
+def _check_range(n: int, u: np.ndarray, v: np.ndarray, path: str) -> None:
+    if u.size and (min(u.min(), v.min()) < 0 or max(u.max(), v.max()) >= n):
+        raise ValueError(f"vértice fora do intervalo (n={n}) em {path}")
+
+
+def read_dimacs_gr(path: str, chunk_bytes: int = _DEFAULT_CHUNK_BYTES) -> tuple[int, EdgeArray]:
+    """Lê um arquivo DIMACS .gr (linhas "p sp n m" e "a u v w")."""
+    n: Optional[int] = None
+    us, vs, ws = [], [], []
+    with open(path, "rb") as f:
+        for block in _chunks(f, chunk_bytes):
+            data, lines, counts, other = _split_block(block, _starts_with("a"))
+            for line in other:
+                parts = line.split()
+                if parts[0] == "p":
+                    if len(parts) != 4 or parts[1] != "sp":
+                        raise ValueError(f"linha de problema inválida em {path}: {line}")
+                    n = int(parts[2])
+                elif parts[0] != "c":
+                    raise ValueError(f"linha inesperada em {path}: {line}")
+            # "a u v w": o "a" conta como coluna e vira espaço
+            _columns(counts, (4,), path)
+            rows = _parse_numbers(data.replace(b"a", b" "), lines, 3, path)
+            us.append(rows[:, 0].astype(np.int64) - 1)
+            vs.append(rows[:, 1].astype(np.int64) - 1)
+            ws.append(rows[:, 2])
+    if n is None:
+        raise ValueError(f"linha 'p sp n m' ausente em {path}")
+    edges = EdgeArray(_concat(us, np.int64), _concat(vs, np.int64), _concat(ws, np.float64))
+    _check_range(n, edges.u, edges.v, path)
+    return n, edges
+
+
+def read_matrix_market(path: str, chunk_bytes: int = _DEFAULT_CHUNK_BYTES) -> tuple[int, EdgeArray]:
+    """Lê um .mtx em formato coordinate; a entrada (i, j) vira o arco i -> j."""
+    with open(path, "rb") as f:
+        banner = f.readline().decode("ascii", errors="replace").split()
+        if len(banner) != 5 or banner[0].lower() != "%%matrixmarket" or banner[1].lower() != "matrix":
+            raise ValueError(f"cabeçalho Matrix Market inválido em {path}")
+        layout, field, symmetry = (x.lower() for x in banner[2:])
+        if layout != "coordinate":
+            raise ValueError(f"só o formato coordinate é suportado ({path}: {layout})")
+        if field not in ("real", "integer", "pattern"):
+            raise ValueError(f"tipo de valor não suportado em {path}: {field}")
+        if symmetry not in ("general", "symmetric"):
+            raise ValueError(f"simetria não suportada em {path}: {symmetry}")
+
+        size = f.readline()
+        while size and (size.startswith(b"%") or not size.strip()):
+            size = f.readline()
+        try:
+            n_rows, n_cols, nnz = (int(x) for x in size.split())
+        except ValueError as exc:
+            raise ValueError(f"linha de tamanho inválida em {path}") from exc
+        n = max(n_rows, n_cols)
+
+        cols = 2 if field == "pattern" else 3
+        us, vs, ws = [], [], []
+        for block in _chunks(f, chunk_bytes):
+            data, lines, counts, _ = _split_block(block, _not_comment("%"))
+            rows = _parse_numbers(data, lines, _columns(counts, (cols,), path), path)
+            us.append(rows[:, 0].astype(np.int64) - 1)
+            vs.append(rows[:, 1].astype(np.int64) - 1)
+            ws.append(rows[:, 2] if field != "pattern" else np.ones(lines))
+
+    u, v, w = _concat(us, np.int64), _concat(vs, np.int64), _concat(ws, np.float64)
+    if u.size != nnz:
+        raise ValueError(f"{path}: {u.size} entradas lidas, {nnz} declaradas")
+    _check_range(n, u, v, path)
+    if symmetry == "symmetric":
+        off = u != v
+        u, v, w = np.concatenate([u, v[off]]), np.concatenate([v, u[off]]), np.concatenate([w, w[off]])
+    return n, EdgeArray(u, v, w)
+
+
+def read_edge_list(
+    path: str,
+    n: Optional[int] = None,
+    one_based: bool = False,
+    default_weight: float = 1.0,
+    chunk_bytes: int = _DEFAULT_CHUNK_BYTES,
+) -> tuple[int, EdgeArray]:
+    """Lê linhas "u v" ou "u v w"; n=None usa o maior vértice + 1."""
+    us, vs, ws = [], [], []
+    columns: Optional[int] = None
+    with open(path, "rb") as f:
+        for block in _chunks(f, chunk_bytes):
+            data, lines, counts, _ = _split_block(block, _not_comment("#", "%"))
+            if lines == 0:
+                continue
+            columns = _columns(counts, (columns,) if columns else (2, 3), path)
+            rows = _parse_numbers(data, lines, columns, path)
+            us.append(rows[:, 0].astype(np.int64))
+            vs.append(rows[:, 1].astype(np.int64))
+            ws.append(rows[:, 2] if columns == 3 else np.full(lines, default_weight))
+
+    u, v, w = _concat(us, np.int64), _concat(vs, np.int64), _concat(ws, np.float64)
+    if one_based:
+        u -= 1
+        v -= 1
+    if n is None:
+        n = int(max(u.max(), v.max()) + 1) if u.size else 0
+    _check_range(n, u, v, path)
+    return n, EdgeArray(u, v, w)
+
+
+def _concat(parts: List[np.ndarray], dtype: type) -> np.ndarray:
+    return np.concatenate(parts).astype(dtype, copy=False) if parts else np.zeros(0, dtype=dtype)
+
+
+def read_graph(path: str, fmt: Optional[str] = None) -> tuple[int, EdgeArray]:
+    """Escolhe o leitor pelo formato (ou pela extensão: .gr, .mtx, demais = lista de arestas)."""
+    if fmt is None:
+        ext = os.path.splitext(path)[1].lower()
+        fmt = {".gr": "dimacs", ".mtx": "mtx"}.get(ext, "edgelist")
+    if fmt == "dimacs":
+        return read_dimacs_gr(path)
+    if fmt == "mtx":
+        return read_matrix_market(path)
+    if fmt == "edgelist":
+        return read_edge_list(path)
+    raise ValueError(f"formato de grafo desconhecido: {fmt}")
@@ -25,7 +25,7 @@ from typing import List, Tuple
 import numpy as np
 
 from .representations import to_predecessor_list, to_successor_list, to_cost_matrix
-from .graph_generators import Edge
+from .graph_generators import EdgeArray
 from .algorithms.bellman_divide_conquer import shortest_paths_bellman_dag_recursive
 from .algorithms.dijkstra_heap import dijkstra_heap
 from .algorithms.floyd_warshall import floyd_warshall
@@ -81,11 +81,17 @@ def prompt_sim3(cost_matrix: np.ndarray) -> str:
     return "\n".join(lines)
 
 
-def _load_graph(graph_json_path: str) -> tuple[int, List[Edge]]:
+def _load_graph(graph_json_path: str) -> tuple[int, EdgeArray]:
     with open(graph_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
     n = int(data["n"])
-    edges = [Edge(int(e["u"]), int(e["v"]), float(e["w"])) for e in data["edges"]]
+    items = data["edges"]
+    m = len(items)
+    edges = EdgeArray(
+        np.fromiter((e["u"] for e in items), dtype=np.int64, count=m),
+        np.fromiter((e["v"] for e in items), dtype=np.int64, count=m),
+        np.fromiter((e["w"] for e in items), dtype=np.float64, count=m),
+    )
     return n, edges
 
 
@@ -6,38 +6,214 @@ O trabalho exige:
 - Simulação 3: matriz de custos
 
 Este módulo converte uma lista de arestas (u,v,w) para cada representação.
+Todas as funções aceitam também um `EdgeArray` (arrays u/v/w), convertido
+sem passar por objetos `Edge`.
+
+Para grafos grandes há também a representação compacta `CSRGraph`
+(arrays NumPy indptr/indices/weights): `to_csr` indexa por origem
+(equivale à lista de sucessores) e `to_csc` por destino (lista de antecessores).
 """
 
 from __future__ import annotations
 
-from typing import List, Tuple
+from dataclasses import dataclass
+from itertools import chain
+from typing import Callable, Iterable, Iterator, List, Tuple, Union
 
 import numpy as np
 
-from .graph_generators import Edge
+from .graph_generators import EdgeArray, EdgeInput, edges_to_arrays
+
+
+@dataclass(frozen=True)
+class CSRGraph:
+    """Adjacência comprimida: vizinhos de x em indices[indptr[x]:indptr[x+1]].
+
+    Cada aresta custa só um índice e um peso (int32/float32 opcionais), em vez
+    de vários objetos Python. A classe também se comporta como a lista de
+    listas de (vizinho, custo): len(g) == n e g[x] devolve os pares de x, então
+    os algoritmos baseados em listas a aceitam diretamente.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+
+    @property
+    def n(self) -> int:
+        return int(self.indptr.shape[0] - 1)
+
+    @property
+    def m(self) -> int:
+        return int(self.indices.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes)
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, x: int) -> List[Tuple[int, float]]:
+        if not 0 <= x < self.n:
+            raise IndexError(x)
+        a, b = int(self.indptr[x]), int(self.indptr[x + 1])
+        return list(zip(self.indices[a:b].tolist(), self.weights[a:b].tolist()))
+
+    def __iter__(self) -> Iterator[List[Tuple[int, float]]]:
+        for x in range(self.n):
+            yield self[x]
+
+
+Adjacency = Union[List[List[Tuple[int, float]]], CSRGraph]
+
+
+def csr_from_arrays(
+    n: int,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    weights: np.ndarray,
+    index_dtype: np.dtype = np.int32,
+    weight_dtype: np.dtype = np.float64,
+) -> CSRGraph:
+    """Monta um CSRGraph a partir de arrays de arestas rows->cols.
+
+    A ordenação é estável: dentro de cada linha, as arestas mantêm a ordem de
+    entrada (a mesma das listas de `to_successor_list`/`to_predecessor_list`).
+    """
+    rows = np.asarray(rows)
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return CSRGraph(
+        indptr=indptr,
+        indices=np.asarray(cols)[order].astype(index_dtype),
+        weights=np.asarray(weights)[order].astype(weight_dtype),
+    )
+
+
+def to_csr(
+    n: int,
+    edges: EdgeInput,
+    index_dtype: np.dtype = np.int32,
+    weight_dtype: np.dtype = np.float64,
+) -> CSRGraph:
+    """Sucessores em CSR: linha u = arcos u->v."""
+    u, v, w = edges_to_arrays(edges)
+    return csr_from_arrays(n, u, v, w, index_dtype=index_dtype, weight_dtype=weight_dtype)
 
 
-def to_predecessor_list(n: int, edges: List[Edge]) -> List[List[Tuple[int, float]]]:
+def to_csc(
+    n: int,
+    edges: EdgeInput,
+    index_dtype: np.dtype = np.int32,
+    weight_dtype: np.dtype = np.float64,
+) -> CSRGraph:
+    """Antecessores em CSC: coluna v = arcos u->v."""
+    u, v, w = edges_to_arrays(edges)
+    return csr_from_arrays(n, v, u, w, index_dtype=index_dtype, weight_dtype=weight_dtype)
+
+
+def neighbors_of(adj: Adjacency) -> Callable[[int], Iterable[Tuple[int, float]]]:
+    """Função x -> pares (vizinho, custo) de x, para os laços em Python das engines.
+
+    Para listas é o próprio adj[x]. Para CSRGraph, indptr/indices/weights são
+    convertidos uma única vez em listas planas e cada chamada só fatia essas
+    listas, em vez de montar a lista de tuplas de `CSRGraph.__getitem__` (com
+    duas conversões NumPy -> Python) a cada visita.
+    """
+    if isinstance(adj, CSRGraph):
+        ptr = adj.indptr.tolist()
+        idx = adj.indices.tolist()
+        wts = adj.weights.tolist()
+        return lambda x: zip(idx[ptr[x]:ptr[x + 1]], wts[ptr[x]:ptr[x + 1]])
+    return adj.__getitem__
+
+
+def as_csr(adj: Adjacency) -> CSRGraph:
+    """Converte uma lista de listas de (vizinho, custo) em CSRGraph (sem cópia se já for)."""
+    if isinstance(adj, CSRGraph):
+        return adj
+    n = len(adj)
+    lens = np.fromiter((len(items) for items in adj), dtype=np.int64, count=n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(lens, out=indptr[1:])
+    m = int(indptr[-1])
+    flat = np.fromiter(chain.from_iterable(chain.from_iterable(adj)), dtype=np.float64, count=2 * m)
+    pairs = flat.reshape(m, 2)
+    return CSRGraph(indptr=indptr, indices=pairs[:, 0].astype(np.int64), weights=pairs[:, 1].copy())
+
+
+def csr_transpose(g: CSRGraph) -> CSRGraph:
+    """Inverte os arcos: o CSR de sucessores vira o de antecessores (e vice-versa)."""
+    rows = np.repeat(np.arange(g.n), g.degrees())
+    return csr_from_arrays(g.n, g.indices, rows, g.weights, index_dtype=g.indices.dtype, weight_dtype=g.weights.dtype)
+
+
+def csr_to_cost_matrix(g: CSRGraph, inf: float = float("inf")) -> np.ndarray:
+    """Matriz de custos a partir dos sucessores em CSR (mesma convenção de `to_cost_matrix`)."""
+    n = g.n
+    mat = np.full((n, n), inf, dtype=float)
+    np.fill_diagonal(mat, 0.0)
+    rows = np.repeat(np.arange(n), g.degrees())
+    np.minimum.at(mat, (rows, g.indices), g.weights)
+    return mat
+
+
+def to_predecessor_list(n: int, edges: EdgeInput) -> List[List[Tuple[int, float]]]:
+    if isinstance(edges, EdgeArray):
+        return list(to_csc(n, edges, index_dtype=np.int64))
     preds: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
     for e in edges:
         preds[e.v].append((e.u, float(e.w)))
     return preds
 
 
-def to_successor_list(n: int, edges: List[Edge]) -> List[List[Tuple[int, float]]]:
+def to_successor_list(n: int, edges: EdgeInput) -> List[List[Tuple[int, float]]]:
+    if isinstance(edges, EdgeArray):
+        return list(to_csr(n, edges, index_dtype=np.int64))
     succs: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
     for e in edges:
         succs[e.u].append((e.v, float(e.w)))
     return succs
 
 
-def to_cost_matrix(n: int, edges: List[Edge], inf: float = float("inf")) -> np.ndarray:
+def to_cost_matrix(n: int, edges: EdgeInput, inf: float = float("inf")) -> np.ndarray:
+    """Matriz de custos n x n (inf sem arco, 0 na diagonal).
+
+    Arcos paralelos ficam com o menor custo e um laço u -> u só entra na
+    diagonal se for negativo (min(0, w)), como nos solvers por listas; os
+    geradores já não produzem nenhum dos dois, mas arquivos importados sim.
+    """
     mat = np.full((n, n), inf, dtype=float)
     np.fill_diagonal(mat, 0.0)
+    if isinstance(edges, EdgeArray):
+        np.minimum.at(mat, (edges.u, edges.v), edges.w)
+        return mat
     for e in edges:
-        mat[e.u, e.v] = float(e.w)
+        mat[e.u, e.v] = min(mat[e.u, e.v], float(e.w))
     return mat
 
 
-def edges_to_jsonable(edges: List[Edge]) -> List[dict]:
-    return [{"u": e.u, "v": e.v, "w": float(e.w)} for e in edges]
+def to_cost_matrices(n: int, edge_lists: List[EdgeInput], inf: float = float("inf")) -> np.ndarray:
+    """Empilha as matrizes de custos de vários grafos em um tensor (B, n, n).
+
+    mats[b] == to_cost_matrix(n, edge_lists[b]). Grafos com menos de n vértices
+    ficam com os vértices excedentes isolados (linhas/colunas inf, diagonal 0),
+    o que não altera as distâncias entre os vértices originais.
+    """
+    mats = np.full((len(edge_lists), n, n), inf, dtype=float)
+    idx = np.arange(n)
+    mats[:, idx, idx] = 0.0
+    for b, edges in enumerate(edge_lists):
+        u, v, w = edges_to_arrays(edges)
+        np.minimum.at(mats[b], (u, v), w)
+    return mats
+
+
+def edges_to_jsonable(edges: EdgeInput) -> List[dict]:
+    u, v, w = edges_to_arrays(edges)
+    return [{"u": a, "v": b, "w": c} for a, b, c in zip(u.tolist(), v.tolist(), w.tolist())]
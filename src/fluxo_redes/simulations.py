@@ -7,13 +7,14 @@ Principais saídas:
 - results/run_manifest.json
 - results/summary.csv
 - results/<sim>_<n>_distances.csv
-- results/<sim>_<n>_graph.json
+- results/<sim>_<n>_graph.json (.npz com u, v, w para n > 2000)
 - figures/<sim>_<n>_<...>.png
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 import os
 from datetime import datetime
@@ -28,18 +29,68 @@ from .graph_generators import (
     generate_dag_negative_costs,
     generate_cyclic_nonnegative,
     generate_cyclic_with_negative_no_neg_cycles,
+    generate_dag_negative_costs_arrays,
+    generate_cyclic_nonnegative_arrays,
+    generate_cyclic_with_negative_no_neg_cycles_arrays,
+    EdgeArray,
+    EdgeInput,
     edge_stats,
+    edges_to_arrays,
 )
+from .graph_families import FAMILIES, generate_family
+from .importers import GRAPH_FORMATS, read_graph
 from .representations import (
     to_predecessor_list,
     to_successor_list,
     to_cost_matrix,
+    to_csr,
+    to_csc,
     edges_to_jsonable,
 )
 from .utils import reconstruct_path_from_predecessor
-from .algorithms.bellman_divide_conquer import shortest_paths_bellman_dag_recursive
+from .batch import batch_shortest_paths
+from .algorithms.bellman_divide_conquer import (
+    shortest_paths_bellman_dag_recursive,
+    shortest_paths_bellman_dag_iterative,
+    shortest_paths_bellman_dag_levels,
+    topological_levels,
+)
 from .algorithms.dijkstra_heap import dijkstra_heap
-from .algorithms.floyd_warshall import floyd_warshall, reconstruct_path
+from .algorithms.priority_queues import QUEUE_BACKENDS
+from .algorithms.point_to_point import dijkstra_query, bidirectional_dijkstra
+from .algorithms.alt import build_alt_index, alt_query
+from .algorithms.dijkstra_buckets import dijkstra_dial, dijkstra_radix, select_integer_engine
+from .algorithms.delta_stepping import delta_stepping
+from .algorithms.bellman_ford_queue import bellman_ford_spfa
+from .algorithms.johnson import johnson
+from .algorithms.floyd_warshall import (
+    floyd_warshall,
+    floyd_warshall_numpy,
+    floyd_warshall_blocked,
+    floyd_warshall_memmap,
+    reconstruct_path,
+)
+from .algorithms.min_plus import min_plus_apsp
+from .algorithms.reachability import floyd_warshall_pruned
+from .algorithms.scc_hybrid import shortest_paths_scc, SCCStats
+
+
+BELLMAN_ENGINES = ["recursive", "iterative", "levels"]
+DIJKSTRA_ENGINES = ["heap", "dial", "radix", "auto", "delta", "scc"]
+FLOYD_ENGINES = ["loop", "numpy", "blocked", "memmap", "spfa", "johnson", "minplus", "scc", "pruned"]
+GENERATORS = ["legacy", "vectorized"] + FAMILIES
+
+# restrição de cada simulação nas famílias de `graph_families`
+SIM_CONSTRAINTS = {1: "dag", 2: "nonnegative", 3: "potential"}
+
+# Acima deste n, o grafo em txt (com a matriz O(n^2)) e a coluna de caminhos
+# da tabela de distâncias não são gerados, e o grafo é salvo em .npz (arrays
+# u, v, w) em vez de JSON com um objeto por arco.
+TEXT_OUTPUT_MAX_N = 2000
+
+# Com --graph-file, a simulação 3 só monta a matriz n x n (todas as engines
+# menos spfa e scc) até este n (20000² floats = 3,2 GB).
+FLOYD_MATRIX_MAX_N = 20000
 
 
 def _vertex_label(i: int) -> str:
@@ -97,6 +148,54 @@ def _save_plot_distance_by_vertex(dist: List[float], outpath: str, title: str) -
     plt.close()
 
 
+def _scc_extra(stats: SCCStats, out_path: str) -> Dict[str, Any]:
+    """Grava o tempo/engine de cada componente e resume o solver por SCC para o summary."""
+    pd.DataFrame(
+        [
+            {"order": i, "size": c.size, "internal_edges": c.internal_edges, "engine": c.engine, "runtime_s": c.runtime_s}
+            for i, c in enumerate(stats.components)
+        ]
+    ).to_csv(out_path, index=False, encoding="utf-8")
+    return {
+        "reachable": stats.reachable,
+        "pruned": stats.pruned,
+        "components": len(stats.components),
+        "largest_component": max((c.size for c in stats.components), default=0),
+        "component_engines": ";".join(f"{k}:{v}" for k, v in sorted(stats.engine_counts().items())),
+        "relaxations": stats.relaxations,
+        "negative_cycle": bool(stats.negative_cycle),
+        "components_file": os.path.basename(out_path),
+    }
+
+
+def _run_floyd(
+    mat: np.ndarray,
+    engine: str,
+    workers: int = 1,
+    block_size: int = 256,
+    workdir: Optional[str] = None,
+    max_products: Optional[int] = None,
+    resume: bool = False,
+):
+    if engine == "loop":
+        return floyd_warshall(mat)
+    if engine == "numpy":
+        return floyd_warshall_numpy(mat)
+    if engine == "blocked":
+        return floyd_warshall_blocked(mat, block_size=block_size, workers=workers)
+    if engine == "memmap":
+        if workdir is None:
+            raise ValueError("engine memmap requer workdir")
+        return floyd_warshall_memmap(mat, workdir, block_size=block_size, workers=workers, resume=resume)
+    if engine == "minplus":
+        # block_size do Floyd (tiles n x n) não se aplica: o temporário aqui é block³
+        return min_plus_apsp(mat, max_products=max_products)
+    if engine == "pruned":
+        # só a primeira linha é usada: Floyd sobre os vértices alcançáveis de X1
+        return floyd_warshall_pruned(mat, roots=[0])
+    raise ValueError(f"engine de Floyd desconhecida: {engine}")
+
+
 def _format_predecessor_list(preds: List[List[tuple[int, float]]]) -> str:
     lines: List[str] = []
     for v, items in enumerate(preds):
@@ -135,7 +234,132 @@ def _format_cost_matrix(mat: np.ndarray) -> str:
     return "\n".join(lines)
 
 
-def run_simulation(sim_id: int, n: int, density: float, seed: int, out_dir: str, fig_dir: str) -> Dict[str, Any]:
+def _write_graph_txt(
+    path: str,
+    sim_id: int,
+    sim_name: str,
+    n: int,
+    density: float,
+    seed: int,
+    preds: List[List[tuple[int, float]]],
+    succs: List[List[tuple[int, float]]],
+    mat: np.ndarray,
+) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"sim_id={sim_id}\n")
+        f.write(f"sim_name={sim_name}\n")
+        f.write(f"n={n}\n")
+        f.write(f"density={density}\n")
+        f.write(f"seed={seed}\n")
+        f.write("\n")
+        f.write("LISTA DE ANTECESSORES\n")
+        f.write("\n")
+        f.write(_format_predecessor_list(preds))
+        f.write("\n\n")
+        f.write("LISTA DE SUCESSORES\n")
+        f.write("\n")
+        f.write(_format_successor_list(succs))
+        f.write("\n\n")
+        f.write("MATRIZ DE CUSTOS\n")
+        f.write("\n")
+        f.write(_format_cost_matrix(mat))
+
+
+def _adjacency(n: int, edges, representation: str):
+    """(antecessores, sucessores) como listas de listas ou como CSRGraph."""
+    if representation == "lists":
+        return to_predecessor_list(n, edges), to_successor_list(n, edges)
+    if representation == "csr":
+        return to_csc(n, edges), to_csr(n, edges)
+    raise ValueError(f"representação desconhecida: {representation}")
+
+
+def _generate_edges(sim_id: int, n: int, density: float, seed: int, generator: str):
+    """Grafo da simulação: geradores com laços ("legacy"), vetorizados ("vectorized") ou uma família de `graph_families`."""
+    if generator == "legacy":
+        gen = {
+            1: generate_dag_negative_costs,
+            2: generate_cyclic_nonnegative,
+            3: generate_cyclic_with_negative_no_neg_cycles,
+        }[sim_id]
+        return gen(n=n, density=density, seed=seed)
+    if generator == "vectorized":
+        gen = {
+            1: generate_dag_negative_costs_arrays,
+            2: generate_cyclic_nonnegative_arrays,
+            3: generate_cyclic_with_negative_no_neg_cycles_arrays,
+        }[sim_id]
+        return EdgeArray(*gen(n=n, density=density, seed=seed))
+    if generator in FAMILIES:
+        # famílias esparsas: a densidade não se aplica (grau médio fixo)
+        return generate_family(generator, n, SIM_CONSTRAINTS[sim_id], seed=seed)
+    raise ValueError(f"gerador desconhecido: {generator}")
+
+
+def _graph_file_issues(n: int, edges: EdgeArray, sims: List[int], floyd_engine: str) -> Dict[int, str]:
+    """Simulações que não podem rodar sobre o grafo importado, com o motivo (restrições do enunciado)."""
+    issues: Dict[int, str] = {}
+    u, v, w = edges.arrays()
+    if 1 in sims:
+        acyclic = not np.any(u == v)
+        # numeração topológica (u < v em todo arco) dispensa a ordenação
+        if acyclic and not np.all(u < v):
+            g = to_csc(n, edges)
+            try:
+                topological_levels(g.indptr, g.indices)
+            except ValueError:
+                acyclic = False
+        if not acyclic:
+            issues[1] = "o grafo tem ciclos (a simulação 1 exige um DAG)"
+    if 2 in sims and np.any(w < 0):
+        issues[2] = f"o grafo tem {int(np.count_nonzero(w < 0))} arcos negativos (Dijkstra exige custos não-negativos)"
+    if 3 in sims and floyd_engine not in ("spfa", "scc") and n > FLOYD_MATRIX_MAX_N:
+        issues[3] = (
+            f"a engine {floyd_engine} monta uma matriz {n} x {n} (limite: n <= {FLOYD_MATRIX_MAX_N}); "
+            "use --floyd-engine spfa ou scc"
+        )
+    return issues
+
+
+def _paths_from_predecessor(pred: List[Optional[int]], n: int) -> List[List[int]]:
+    """Caminhos X1->v para a tabela de distâncias (vazios quando n > TEXT_OUTPUT_MAX_N)."""
+    if n > TEXT_OUTPUT_MAX_N:
+        return [[] for _ in range(n)]
+    return [reconstruct_path_from_predecessor(pred, v, root=0) for v in range(n)]
+
+
+def _paths_from_next(nxt: np.ndarray, n: int) -> List[List[int]]:
+    """Caminhos X1->v pela matriz nxt (vazios quando n > TEXT_OUTPUT_MAX_N)."""
+    if n > TEXT_OUTPUT_MAX_N:
+        return [[] for _ in range(n)]
+    return [reconstruct_path(nxt, 0, v) for v in range(n)]
+
+
+def run_simulation(
+    sim_id: int,
+    n: int,
+    density: float,
+    seed: int,
+    out_dir: str,
+    fig_dir: str,
+    bellman_engine: str = "recursive",
+    dijkstra_engine: str = "heap",
+    dijkstra_queue: str = "lazy",
+    floyd_engine: str = "loop",
+    representation: str = "lists",
+    query_target: Optional[int] = None,
+    query_mode: str = "bidirectional",
+    landmarks: int = 8,
+    delta: Optional[float] = None,
+    roots: Optional[List[int]] = None,
+    max_products: Optional[int] = None,
+    generator: str = "legacy",
+    workers: int = 1,
+    block_size: int = 256,
+    graph: Optional[EdgeInput] = None,
+    floyd_resume: bool = False,
+) -> Dict[str, Any]:
+    """Roda uma simulação; graph (arcos de n vértices, ex.: de `importers.read_graph`) substitui o gerador."""
     os.makedirs(out_dir, exist_ok=True)
     os.makedirs(fig_dir, exist_ok=True)
     graphs_dir = os.path.join(out_dir, "graphs")
@@ -143,94 +367,255 @@ def run_simulation(sim_id: int, n: int, density: float, seed: int, out_dir: str,
     sim_name = _sim_name(sim_id)
 
     if sim_id == 1:
-        edges = generate_dag_negative_costs(n=n, density=density, seed=seed)
-        preds = to_predecessor_list(n, edges)
-        succs = to_successor_list(n, edges)
-        mat = to_cost_matrix(n, edges)
-        t0 = perf_counter()
-        dist, pred, stats_alg = shortest_paths_bellman_dag_recursive(preds, root=0)
-        t1 = perf_counter()
-        alg_extra = {
-            "recursion_calls": stats_alg.recursion_calls,
-            "relax_checks": stats_alg.relax_checks,
-        }
+        edges = graph if graph is not None else _generate_edges(sim_id, n, density, seed, generator)
+        preds, succs = _adjacency(n, edges, representation)
+        mat = None
+        engine = bellman_engine
+        if bellman_engine == "recursive":
+            t0 = perf_counter()
+            dist, pred, stats_alg = shortest_paths_bellman_dag_recursive(preds, root=0)
+            t1 = perf_counter()
+            alg_extra = {
+                "recursion_calls": stats_alg.recursion_calls,
+                "relax_checks": stats_alg.relax_checks,
+            }
+        elif bellman_engine == "iterative":
+            t0 = perf_counter()
+            dist, pred, stats_alg = shortest_paths_bellman_dag_iterative(preds, root=0)
+            t1 = perf_counter()
+            alg_extra = {
+                "topo_visits": stats_alg.topo_visits,
+                "relax_checks": stats_alg.relax_checks,
+            }
+        elif bellman_engine == "levels":
+            t0 = perf_counter()
+            dist, pred, stats_alg = shortest_paths_bellman_dag_levels(preds, root=0)
+            t1 = perf_counter()
+            alg_extra = {
+                "levels": stats_alg.levels,
+                "relax_checks": stats_alg.relax_checks,
+            }
+        else:
+            raise ValueError(f"engine de Bellman desconhecida: {bellman_engine}")
         # path via predecessor
-        paths = [reconstruct_path_from_predecessor(pred, v, root=0) for v in range(n)]
+        paths = _paths_from_predecessor(pred, n)
 
     elif sim_id == 2:
-        edges = generate_cyclic_nonnegative(n=n, density=density, seed=seed)
-        succs = to_successor_list(n, edges)
-        preds = to_predecessor_list(n, edges)
-        mat = to_cost_matrix(n, edges)
+        edges = graph if graph is not None else _generate_edges(sim_id, n, density, seed, generator)
+        preds, succs = _adjacency(n, edges, representation)
+        mat = None
+        engine = dijkstra_engine
+        if dijkstra_engine == "auto":
+            # Dial/radix para custos inteiros não-negativos, heap caso contrário
+            engine = select_integer_engine(succs)
         t0 = perf_counter()
-        dist, pred, stats_alg = dijkstra_heap(succs, root=0)
+        if engine == "heap":
+            dist, pred, stats_alg = dijkstra_heap(succs, root=0, queue=dijkstra_queue)
+        elif engine == "dial":
+            dist, pred, stats_alg = dijkstra_dial(succs, root=0)
+        elif engine == "radix":
+            dist, pred, stats_alg = dijkstra_radix(succs, root=0)
+        elif engine == "delta":
+            dist, pred, stats_alg = delta_stepping(succs, root=0, delta=delta, workers=workers)
+        elif engine == "scc":
+            dist, pred, stats_alg = shortest_paths_scc(succs, root=0)
+        else:
+            raise ValueError(f"engine de Dijkstra desconhecida: {dijkstra_engine}")
         t1 = perf_counter()
-        alg_extra = {
-            "relaxations": stats_alg.relaxations,
-            "heap_push": stats_alg.heap_push,
-            "heap_pop": stats_alg.heap_pop,
-        }
-        paths = [reconstruct_path_from_predecessor(pred, v, root=0) for v in range(n)]
+        if engine == "scc":
+            alg_extra = _scc_extra(stats_alg, os.path.join(out_dir, f"sim{sim_id}_{sim_name}_n{n}_components.csv"))
+        elif engine == "delta":
+            alg_extra = {
+                "delta": stats_alg.delta,
+                "buckets": stats_alg.buckets,
+                "phases": stats_alg.phases,
+                "light_relaxations": stats_alg.light_relaxations,
+                "heavy_relaxations": stats_alg.heavy_relaxations,
+            }
+        else:
+            alg_extra = {
+                "relaxations": stats_alg.relaxations,
+                "heap_push": stats_alg.heap_push,
+                "heap_pop": stats_alg.heap_pop,
+            }
+            if engine != "heap":
+                alg_extra["stale_pops"] = stats_alg.stale_pops
+                alg_extra["bucket_scans"] = stats_alg.bucket_scans
+                if engine == "radix":
+                    alg_extra["bucket_moves"] = stats_alg.bucket_moves
+            elif dijkstra_queue == "lazy":
+                alg_extra["stale_pops"] = stats_alg.stale_pops
+            else:
+                alg_extra["decrease_key"] = stats_alg.decrease_key
+                if dijkstra_queue == "pairing":
+                    alg_extra["links"] = stats_alg.links
+                else:
+                    alg_extra["sift_steps"] = stats_alg.sift_steps
+        if engine == "heap":
+            engine = f"heap:{dijkstra_queue}"
+        if dijkstra_engine == "auto":
+            engine = f"auto:{engine}"
+        paths = _paths_from_predecessor(pred, n)
 
     elif sim_id == 3:
-        edges = generate_cyclic_with_negative_no_neg_cycles(n=n, density=density, seed=seed)
-        mat = to_cost_matrix(n, edges)
-        preds = to_predecessor_list(n, edges)
-        succs = to_successor_list(n, edges)
-        t0 = perf_counter()
-        dist_mat, nxt, stats_alg = floyd_warshall(mat)
-        t1 = perf_counter()
-        dist = dist_mat[0, :].tolist()  # primeira linha
-        pred = [None] * n  # não é predecessor; mantemos None
-        alg_extra = {
-            "iterations": stats_alg.iterations,
-            "relaxations": stats_alg.relaxations,
-            "negative_cycle": bool(stats_alg.negative_cycle),
-        }
-        paths = [reconstruct_path(nxt, 0, v) for v in range(n)]
+        edges = graph if graph is not None else _generate_edges(sim_id, n, density, seed, generator)
+        preds, succs = _adjacency(n, edges, representation)
+        engine = floyd_engine
+        if floyd_engine == "spfa":
+            # só a primeira linha é usada: Bellman-Ford com fila a partir de X1
+            mat = None
+            t0 = perf_counter()
+            dist, pred, stats_alg = bellman_ford_spfa(succs, root=0)
+            t1 = perf_counter()
+            alg_extra = {
+                "relaxations": stats_alg.relaxations,
+                "queue_push": stats_alg.queue_push,
+                "queue_pop": stats_alg.queue_pop,
+                "negative_cycle": bool(stats_alg.negative_cycle),
+            }
+            paths = _paths_from_predecessor(pred, n)
+        elif floyd_engine == "scc":
+            # só a primeira linha: SCCs alcançáveis de X1, em ordem topológica
+            mat = None
+            t0 = perf_counter()
+            dist, pred, stats_alg = shortest_paths_scc(succs, root=0)
+            t1 = perf_counter()
+            alg_extra = _scc_extra(stats_alg, os.path.join(out_dir, f"sim{sim_id}_{sim_name}_n{n}_components.csv"))
+            paths = _paths_from_predecessor(pred, n)
+        elif floyd_engine == "johnson":
+            mat = None
+            t0 = perf_counter()
+            dist_mat, nxt, stats_alg = johnson(succs, workers=workers)
+            t1 = perf_counter()
+            dist = dist_mat[0, :].tolist()  # primeira linha
+            pred = [None] * n
+            alg_extra = {
+                "potential_relaxations": stats_alg.potential_relaxations,
+                "dijkstra_runs": stats_alg.dijkstra_runs,
+                "relaxations": stats_alg.relaxations,
+                "heap_push": stats_alg.heap_push,
+                "heap_pop": stats_alg.heap_pop,
+            }
+            paths = _paths_from_next(nxt, n)
+        else:
+            mat = to_cost_matrix(n, edges)
+            t0 = perf_counter()
+            dist_mat, nxt, stats_alg = _run_floyd(
+                mat,
+                floyd_engine,
+                workers=workers,
+                block_size=block_size,
+                workdir=os.path.join(out_dir, f"sim{sim_id}_{sim_name}_n{n}_memmap"),
+                max_products=max_products,
+                resume=floyd_resume,
+            )
+            t1 = perf_counter()
+            dist = dist_mat[0, :].tolist()  # primeira linha
+            pred = [None] * n  # não é predecessor; mantemos None
+            alg_extra = {
+                "iterations": stats_alg.iterations,
+                "relaxations": stats_alg.relaxations,
+                "negative_cycle": bool(stats_alg.negative_cycle),
+            }
+            if floyd_engine == "minplus":
+                alg_extra["products"] = stats_alg.products
+                alg_extra["converged"] = bool(stats_alg.converged)
+            if floyd_engine == "pruned":
+                alg_extra["kept"] = stats_alg.kept
+                alg_extra["pivots"] = stats_alg.pivots
+            paths = _paths_from_next(nxt, n)
 
     else:
         raise ValueError("sim_id deve ser 1, 2 ou 3")
 
     runtime_s = float(t1 - t0)
 
+    # consulta ponto a ponto X1 -> X(query_target), só na simulação 2 (custos não-negativos)
+    query_extra: Dict[str, Any] = {}
+    if sim_id == 2 and query_target is not None:
+        if not 1 <= query_target <= n:
+            raise ValueError(f"query_target deve estar em 1..{n}")
+        target = query_target - 1
+        query_extra = {"query_mode": query_mode}
+        if query_mode == "alt":
+            tp0 = perf_counter()
+            alt_index = build_alt_index(succs, preds, k=min(landmarks, n), seed=seed)
+            query_extra["query_landmarks"] = len(alt_index.landmarks)
+            query_extra["query_preprocess_s"] = float(perf_counter() - tp0)
+        tq0 = perf_counter()
+        if query_mode == "early":
+            q = dijkstra_query(succs, 0, target)
+        elif query_mode == "bidirectional":
+            q = bidirectional_dijkstra(succs, preds, 0, target)
+        elif query_mode == "alt":
+            q = alt_query(alt_index, succs, 0, target)
+        else:
+            raise ValueError(f"modo de consulta desconhecido: {query_mode}")
+        tq1 = perf_counter()
+        query_extra.update({
+            "query_target": _vertex_label(target),
+            "query_distance": q.distance,
+            "query_settled": q.settled,
+            "query_runtime_s": float(tq1 - tq0),
+            "query_path": " -> ".join(_vertex_label(x) for x in q.path),
+        })
+
+    # árvores a partir de outras raízes (lote multi-origem), só distâncias
+    roots_extra: Dict[str, Any] = {}
+    if roots:
+        if sim_id == 1:
+            solver, adj = "dag", preds
+        elif sim_id == 2:
+            solver, adj = "dijkstra", succs
+        else:
+            solver, adj = "spfa", succs
+        roots_path = os.path.join(out_dir, f"sim{sim_id}_{sim_name}_n{n}_roots.csv")
+        tr0 = perf_counter()
+        # uma linha por raiz, gravada assim que a raiz termina (ordem de conclusão):
+        # a matriz raízes x n nunca fica inteira na memória
+        with open(roots_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["root"] + [_vertex_label(v) for v in range(n)])
+            for r, d, _, _ in batch_shortest_paths(adj, roots, solver=solver, workers=workers):
+                writer.writerow([_vertex_label(r)] + list(d))
+        tr1 = perf_counter()
+        roots_extra = {
+            "roots_solver": solver,
+            "roots_count": len(roots),
+            "roots_runtime_s": float(tr1 - tr0),
+            "roots_file": os.path.basename(roots_path),
+        }
+
     # salva grafo
-    graph_path = os.path.join(out_dir, f"sim{sim_id}_{sim_name}_n{n}_graph.json")
-    with open(graph_path, "w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "sim_id": sim_id,
-                "sim_name": sim_name,
-                "n": n,
-                "density": density,
-                "seed": seed,
-                "edges": edges_to_jsonable(edges),
-            },
-            f,
-            ensure_ascii=False,
-            indent=2,
-        )
+    graph_base = os.path.join(out_dir, f"sim{sim_id}_{sim_name}_n{n}_graph")
+    if n <= TEXT_OUTPUT_MAX_N:
+        graph_path = graph_base + ".json"
+        with open(graph_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "sim_id": sim_id,
+                    "sim_name": sim_name,
+                    "n": n,
+                    "density": density,
+                    "seed": seed,
+                    "edges": edges_to_jsonable(edges),
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+    else:
+        graph_path = graph_base + ".npz"
+        u, v, w = edges_to_arrays(edges)
+        np.savez(graph_path, sim_id=sim_id, n=n, density=density, seed=seed, u=u, v=v, w=w)
 
     # salva grafo em txt descritivo para uso em LLM (todas as representações)
+    # (a matriz de custos é O(n^2); para n grande o txt é omitido)
     graph_txt_path = os.path.join(graphs_dir, f"sim{sim_id}_{sim_name}_n{n}_graph.txt")
-    with open(graph_txt_path, "w", encoding="utf-8") as f:
-        f.write(f"sim_id={sim_id}\n")
-        f.write(f"sim_name={sim_name}\n")
-        f.write(f"n={n}\n")
-        f.write(f"density={density}\n")
-        f.write(f"seed={seed}\n")
-        f.write("\n")
-        f.write("LISTA DE ANTECESSORES\n")
-        f.write("\n")
-        f.write(_format_predecessor_list(preds))
-        f.write("\n\n")
-        f.write("LISTA DE SUCESSORES\n")
-        f.write("\n")
-        f.write(_format_successor_list(succs))
-        f.write("\n\n")
-        f.write("MATRIZ DE CUSTOS\n")
-        f.write("\n")
-        f.write(_format_cost_matrix(mat))
+    if n <= TEXT_OUTPUT_MAX_N:
+        if mat is None:
+            mat = to_cost_matrix(n, edges)
+        _write_graph_txt(graph_txt_path, sim_id, sim_name, n, density, seed, preds, succs, mat)
 
     # tabela de distâncias
     rows = []
@@ -266,9 +651,12 @@ def run_simulation(sim_id: int, n: int, density: float, seed: int, out_dir: str,
         "density": density,
         "seed": seed,
         "runtime_s": runtime_s,
+        "engine": engine,
         **e_stats,
         **{f"dist_{k}": v for k, v in d_stats.items()},
         **{f"alg_{k}": v for k, v in alg_extra.items()},
+        **query_extra,
+        **roots_extra,
         "graph_file": os.path.basename(graph_path),
         "dist_file": os.path.basename(dist_path),
     }
@@ -284,9 +672,88 @@ def main() -> int:
     ap.add_argument("--seed", type=int, default=42, help="Seed")
     ap.add_argument("--out", type=str, default="results", help="Pasta de resultados")
     ap.add_argument("--figures", type=str, default="figures", help="Pasta de figuras")
+    ap.add_argument("--bellman-engine", type=str, default="recursive", choices=BELLMAN_ENGINES, help="Engine da simulação 1")
+    ap.add_argument(
+        "--dijkstra-engine",
+        type=str,
+        default="heap",
+        choices=DIJKSTRA_ENGINES,
+        help="Engine da simulação 2 (auto: Dial/radix heap para custos inteiros; delta: delta-stepping)",
+    )
+    ap.add_argument(
+        "--dijkstra-queue",
+        type=str,
+        default="lazy",
+        choices=QUEUE_BACKENDS,
+        help="Fila de prioridade da simulação 2",
+    )
+    ap.add_argument("--query-target", type=int, help="Simulação 2: consulta ponto a ponto X1 -> Xk (k = 1..n)")
+    ap.add_argument(
+        "--query-mode",
+        type=str,
+        default="bidirectional",
+        choices=["early", "bidirectional", "alt"],
+        help="Consulta ponto a ponto: Dijkstra com parada antecipada, bidirecional ou A* com landmarks (ALT)",
+    )
+    ap.add_argument("--delta", type=float, help="Largura dos baldes do delta-stepping (padrão: heurística pelos custos)")
+    ap.add_argument("--landmarks", type=int, default=8, help="Número de landmarks do modo de consulta alt")
+    ap.add_argument("--floyd-engine", type=str, default="loop", choices=FLOYD_ENGINES, help="Engine da simulação 3")
+    ap.add_argument(
+        "--max-products",
+        type=int,
+        help="Engine minplus da simulação 3: para após h produtos min-plus (caminhos de até 2^h arcos)",
+    )
+    ap.add_argument(
+        "--representation",
+        type=str,
+        default="lists",
+        choices=["lists", "csr"],
+        help="Listas de antecessores/sucessores como listas Python ou arrays CSR/CSC",
+    )
+    ap.add_argument(
+        "--roots",
+        type=str,
+        nargs="+",
+        help="Também calcula as distâncias a partir destas raízes (k = 1..n, ou 'all'), em lote com --workers processos",
+    )
+    ap.add_argument(
+        "--generator",
+        type=str,
+        default="legacy",
+        choices=GENERATORS,
+        help=(
+            "Geradores com laços (reproduzem as seeds já usadas), vetorizados com NumPy (outros grafos, "
+            "mesma distribuição) ou uma família esparsa (grid, geometric, ba, rmat, layered; ignora --density)"
+        ),
+    )
+    ap.add_argument(
+        "--graph-file",
+        type=str,
+        help="Usa o grafo deste arquivo (DIMACS .gr, Matrix Market .mtx ou lista de arestas) em vez do gerador; ignora --sizes",
+    )
+    ap.add_argument(
+        "--graph-format",
+        type=str,
+        choices=GRAPH_FORMATS,
+        help="Formato de --graph-file (padrão: pela extensão; .gr, .mtx, demais = lista de arestas)",
+    )
+    ap.add_argument("--workers", type=int, default=1, help="Número de workers das engines paralelas")
+    ap.add_argument("--block-size", type=int, default=256, help="Tamanho do tile do Floyd em blocos/memmap")
+    ap.add_argument(
+        "--floyd-resume",
+        action="store_true",
+        help="Engine memmap: retoma do checkpoint em results/ em vez de recomeçar do zero",
+    )
 
     args = ap.parse_args()
 
+    root_ks: List[int] = []
+    if args.roots and args.roots != ["all"]:
+        try:
+            root_ks = [int(k) for k in args.roots]
+        except ValueError:
+            ap.error("--roots aceita números de vértices (k = 1..n) ou 'all' sozinho")
+
     sims = []
     if args.all:
         sims = [1, 2, 3]
@@ -300,6 +767,20 @@ def main() -> int:
     os.makedirs(out_dir, exist_ok=True)
     os.makedirs(fig_dir, exist_ok=True)
 
+    graph = None
+    skipped: Dict[int, str] = {}
+    if args.graph_file:
+        n_file, graph = read_graph(args.graph_file, args.graph_format)
+        args.sizes = [n_file]
+        skipped = _graph_file_issues(n_file, graph, sims, args.floyd_engine)
+        if args.sim and skipped:
+            ap.error(f"simulação {args.sim} não pode rodar sobre {args.graph_file}: {skipped[args.sim]}")
+        for sim_id, reason in skipped.items():
+            print(f"simulação {sim_id} ignorada: {reason}")
+        sims = [s for s in sims if s not in skipped]
+        if not sims:
+            ap.error(f"nenhuma simulação pode rodar sobre {args.graph_file}")
+
     manifest = {
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "command": " ".join(os.sys.argv),
@@ -307,6 +788,21 @@ def main() -> int:
         "sizes": args.sizes,
         "density": args.density,
         "seed": args.seed,
+        "bellman_engine": args.bellman_engine,
+        "dijkstra_engine": args.dijkstra_engine,
+        "dijkstra_queue": args.dijkstra_queue,
+        "delta": args.delta,
+        "floyd_engine": args.floyd_engine,
+        "max_products": args.max_products,
+        "representation": args.representation,
+        "generator": args.generator,
+        "graph_file": args.graph_file,
+        "graph_format": args.graph_format,
+        "skipped": {str(k): v for k, v in skipped.items()},
+        "roots": args.roots,
+        "workers": args.workers,
+        "block_size": args.block_size,
+        "floyd_resume": args.floyd_resume,
     }
     with open(os.path.join(out_dir, "run_manifest.json"), "w", encoding="utf-8") as f:
         json.dump(manifest, f, ensure_ascii=False, indent=2)
@@ -316,7 +812,40 @@ def main() -> int:
         for n in args.sizes:
             # usa seed deslocada por sim e n para variar, mantendo reprodutível
             seed = int(args.seed + 1000 * sim_id + n)
-            summaries.append(run_simulation(sim_id, n, args.density, seed, out_dir, fig_dir))
+            roots = None
+            if args.roots == ["all"]:
+                roots = list(range(n))
+            elif root_ks:
+                bad = [k for k in root_ks if not 1 <= k <= n]
+                if bad:
+                    ap.error(f"--roots: vértices fora do intervalo 1..{n}: {bad}")
+                roots = [k - 1 for k in root_ks]
+            summaries.append(
+                run_simulation(
+                    sim_id,
+                    n,
+                    args.density,
+                    seed,
+                    out_dir,
+                    fig_dir,
+                    bellman_engine=args.bellman_engine,
+                    dijkstra_engine=args.dijkstra_engine,
+                    dijkstra_queue=args.dijkstra_queue,
+                    floyd_engine=args.floyd_engine,
+                    representation=args.representation,
+                    query_target=args.query_target,
+                    query_mode=args.query_mode,
+                    landmarks=args.landmarks,
+                    delta=args.delta,
+                    roots=roots,
+                    max_products=args.max_products,
+                    generator=args.generator,
+                    workers=args.workers,
+                    block_size=args.block_size,
+                    graph=graph,
+                    floyd_resume=args.floyd_resume,
+                )
+            )
 
     df_sum = pd.DataFrame(summaries)
     df_sum.to_csv(os.path.join(out_dir, "summary.csv"), index=False, encoding="utf-8")
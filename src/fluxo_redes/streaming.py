@@ -0,0 +1,271 @@
+"""Geração de grafos grandes em faixas de linhas, direto para um arquivo binário.
+
+Para grafos com 10⁸+ arcos a lista de `Edge` (ou mesmo os arrays inteiros)
+não cabe na memória. `generate_edge_file`:
+
+- divide os vértices em faixas de `chunk_rows` linhas (arcos com origem na
+  faixa);
+- cada faixa i recebe o fluxo aleatório `SeedSequence(seed).spawn(...)[i + 1]`
+  (o filho 0 sorteia os potenciais da família "potential"), então o arquivo
+  depende só de (family, n, density, seed, chunk_rows, method), e não do
+  número de workers;
+- as faixas são geradas com os mesmos sorteios vetorizados de
+  `graph_generators` (corrente X1 -> ... -> Xn + pares elegíveis), em um
+  ProcessPoolExecutor com no máximo 2 * workers faixas em andamento, e
+  gravadas em ordem no arquivo assim que ficam prontas.
+
+Famílias (uma por simulação):
+- "dag": DAG com custos negativos (simulação 1);
+- "nonnegative": grafo com circuitos e custos não-negativos (simulação 2);
+- "potential": circuitos e custos negativos sem ciclo negativo, com
+  w = b + pi[v] - pi[u] e pi global, sorteado uma vez por processo a partir
+  do mesmo filho da SeedSequence (simulação 3).
+
+Formato: registros (u, v, w) de um dtype estruturado little-endian, sem
+cabeçalho (u e v int32 se n < 2³¹, senão int64; w float64), e um
+`<arquivo>.json` ao lado com n, m, o dtype e os parâmetros da geração.
+`read_edge_file` devolve u, v, w como visões de um np.memmap.
+
+Uso:
+    python -m fluxo_redes.streaming --family potential --n 100000 --density 0.001 --out results/g.edges --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+
+from .graph_generators import (
+    SAMPLING_METHODS,
+    SKIP_SAMPLING_MAX_DENSITY,
+    EdgeArrays,
+    _BLOCK_ELEMENTS,
+    _cyclic_nonnegative_rows,
+    _dag_negative_rows,
+    _no_neg_cycles_rows,
+)
+
+
+FAMILIES = ["dag", "nonnegative", "potential"]
+
+EDGE_FILE_FORMAT = "fluxo_redes-edges"
+
+# arcos esperados por faixa (~24 MB de registros)
+_CHUNK_ARCS = 1 << 20
+
+# faixa de potenciais da família "potential" (a mesma de generate_cyclic_with_negative_no_neg_cycles)
+_POTENTIAL_RANGE = (-20, 20)
+
+
+def edge_file_dtype(n: int) -> np.dtype:
+    """Registro (u, v, w) do arquivo binário."""
+    index = "<i4" if n < 2**31 else "<i8"
+    return np.dtype([("u", index), ("v", index), ("w", "<f8")])
+
+
+def default_chunk_rows(n: int, density: float, method: str = "auto") -> int:
+    """Linhas por faixa: cerca de _CHUNK_ARCS arcos esperados (rows * n * density) por faixa.
+
+    Com amostragem "block" (que sorteia todos os rows x n pares), a faixa fica
+    limitada a _BLOCK_ELEMENTS pares candidatos.
+    """
+    if n <= 0:
+        return 1
+    per_row = n * density
+    rows = n if per_row <= 0 else int(np.ceil(_CHUNK_ARCS / per_row))
+    if method == "block" or (method == "auto" and density >= SKIP_SAMPLING_MAX_DENSITY):
+        rows = min(rows, _BLOCK_ELEMENTS // n)
+    return int(min(max(rows, 1), n))
+
+
+def _potentials(seed_seq: np.random.SeedSequence, n: int) -> np.ndarray:
+    rng = np.random.default_rng(seed_seq)
+    return rng.integers(_POTENTIAL_RANGE[0], _POTENTIAL_RANGE[1] + 1, size=n)
+
+
+def _chunk_arcs(
+    family: str,
+    n: int,
+    density: float,
+    method: str,
+    r0: int,
+    r1: int,
+    seed_seq: np.random.SeedSequence,
+    pi: Optional[np.ndarray],
+) -> EdgeArrays:
+    rng = np.random.default_rng(seed_seq)
+    if family == "dag":
+        return _dag_negative_rows(rng, n, r0, r1, density, method)
+    if family == "nonnegative":
+        return _cyclic_nonnegative_rows(rng, n, r0, r1, density, method)
+    if family == "potential":
+        return _no_neg_cycles_rows(rng, n, r0, r1, density, method, pi)
+    raise ValueError(f"família desconhecida: {family}")
+
+
+_WORKER_PI: Optional[np.ndarray] = None
+
+
+def _init_worker(pi_seq: Optional[np.random.SeedSequence], n: int) -> None:
+    global _WORKER_PI
+    _WORKER_PI = _potentials(pi_seq, n) if pi_seq is not None else None
+
+
+def _worker_chunk(
+    family: str,
+    n: int,
+    density: float,
+    method: str,
+    r0: int,
+    r1: int,
+    seed_seq: np.random.SeedSequence,
+    dtype: np.dtype,
+) -> bytes:
+    u, v, w = _chunk_arcs(family, n, density, method, r0, r1, seed_seq, _WORKER_PI)
+    return _records(u, v, w, dtype).tobytes()
+
+
+def _records(u: np.ndarray, v: np.ndarray, w: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    rec = np.empty(u.size, dtype=dtype)
+    rec["u"] = u
+    rec["v"] = v
+    rec["w"] = w
+    return rec
+
+
+def generate_edge_file(
+    path: str,
+    family: str,
+    n: int,
+    density: float,
+    seed: int,
+    chunk_rows: Optional[int] = None,
+    method: str = "auto",
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """Gera o grafo faixa a faixa em path (+ path.json); devolve os metadados gravados no .json."""
+    if family not in FAMILIES:
+        raise ValueError(f"família desconhecida: {family}")
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"método de amostragem desconhecido: {method}")
+    if workers < 1:
+        raise ValueError("workers deve ser >= 1")
+    if chunk_rows is None:
+        chunk_rows = default_chunk_rows(n, density, method)
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows deve ser >= 1")
+
+    bounds = [(r0, min(n, r0 + chunk_rows)) for r0 in range(0, n, chunk_rows)]
+    children = np.random.SeedSequence(seed).spawn(len(bounds) + 1)
+    pi_seq = children[0] if family == "potential" else None
+    dtype = edge_file_dtype(n)
+
+    t0 = perf_counter()
+    m = 0
+    with open(path, "wb") as f:
+        for block in _generate_chunks(family, n, density, method, bounds, children[1:], pi_seq, dtype, workers):
+            f.write(block)
+            m += len(block) // dtype.itemsize
+
+    meta = {
+        "format": EDGE_FILE_FORMAT,
+        "family": family,
+        "n": n,
+        "m": m,
+        "density": density,
+        "seed": seed,
+        "chunk_rows": chunk_rows,
+        "chunks": len(bounds),
+        "method": method,
+        "dtype": [[name, dtype[name].str] for name in dtype.names],
+        "workers": workers,
+        "runtime_s": float(perf_counter() - t0),
+    }
+    with open(path + ".json", "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return meta
+
+
+def _generate_chunks(
+    family: str,
+    n: int,
+    density: float,
+    method: str,
+    bounds: list,
+    seqs: list,
+    pi_seq: Optional[np.random.SeedSequence],
+    dtype: np.dtype,
+    workers: int,
+) -> Iterator[bytes]:
+    """Bytes de cada faixa, na ordem das linhas."""
+    if workers == 1:
+        pi = _potentials(pi_seq, n) if pi_seq is not None else None
+        for (r0, r1), seq in zip(bounds, seqs):
+            u, v, w = _chunk_arcs(family, n, density, method, r0, r1, seq, pi)
+            yield _records(u, v, w, dtype).tobytes()
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pi_seq, n)) as pool:
+        # janela limitada: no máximo 2 * workers faixas prontas ou em andamento na memória
+        pending: deque = deque()
+        tasks = iter(zip(bounds, seqs))
+        for (r0, r1), seq in tasks:
+            pending.append(pool.submit(_worker_chunk, family, n, density, method, r0, r1, seq, dtype))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def read_edge_file(path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+    """(u, v, w, meta) de um arquivo de `generate_edge_file`; u, v, w são visões de um np.memmap (sem cópia)."""
+    with open(path + ".json", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("format") != EDGE_FILE_FORMAT:
+        raise ValueError(f"arquivo de arestas desconhecido: {path}")
+    dtype = np.dtype([(name, code) for name, code in meta["dtype"]])
+    if meta["m"] == 0:
+        rec = np.zeros(0, dtype=dtype)
+    else:
+        rec = np.memmap(path, dtype=dtype, mode="r", shape=(meta["m"],))
+    return rec["u"], rec["v"], rec["w"], meta
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Gera um grafo grande em faixas de linhas, direto para um arquivo binário")
+    ap.add_argument("--family", type=str, required=True, choices=FAMILIES, help="Família (dag, nonnegative, potential)")
+    ap.add_argument("--n", type=int, required=True, help="Número de vértices")
+    ap.add_argument("--density", type=float, default=0.001, help="Probabilidade de cada par (u, v)")
+    ap.add_argument("--seed", type=int, default=42, help="Seed")
+    ap.add_argument("--out", type=str, required=True, help="Arquivo de saída (os metadados vão em <out>.json)")
+    ap.add_argument("--chunk-rows", type=int, help="Linhas por faixa (padrão: ~1M arcos esperados por faixa)")
+    ap.add_argument("--method", type=str, default="auto", choices=SAMPLING_METHODS, help="Amostragem dos pares")
+    ap.add_argument("--workers", type=int, default=1, help="Processos geradores")
+    args = ap.parse_args()
+
+    out_dir = os.path.dirname(args.out)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    meta = generate_edge_file(
+        args.out,
+        args.family,
+        args.n,
+        args.density,
+        args.seed,
+        chunk_rows=args.chunk_rows,
+        method=args.method,
+        workers=args.workers,
+    )
+    print(json.dumps(meta, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+"""Floyd-Warshall vetorizado (NumPy) contra a versão com laços nos grafos gerados."""
+
+import os
+
+import numpy as np
+import pytest
+
+from fluxo_redes.algorithms.floyd_warshall import (
+    floyd_warshall,
+    floyd_warshall_memmap,
+    floyd_warshall_numpy,
+    reconstruct_path,
+)
+from fluxo_redes.graph_generators import (
+    generate_cyclic_nonnegative,
+    generate_cyclic_with_negative_no_neg_cycles,
+    generate_dag_negative_costs,
+)
+from fluxo_redes.representations import to_cost_matrix, to_csr
+
+
+GENERATORS = [
+    generate_dag_negative_costs,
+    generate_cyclic_nonnegative,
+    generate_cyclic_with_negative_no_neg_cycles,
+]
+
+
+@pytest.mark.parametrize("gen", GENERATORS)
+@pytest.mark.parametrize("n,density,seed", [(10, 0.25, 1), (40, 0.25, 7), (60, 0.05, 3)])
+def test_numpy_matches_loop(gen, n, density, seed):
+    mat = to_cost_matrix(n, gen(n=n, density=density, seed=seed))
+
+    dist_loop, nxt_loop, stats_loop = floyd_warshall(mat)
+    dist_np, nxt_np, stats_np = floyd_warshall_numpy(mat)
+
+    np.testing.assert_allclose(dist_np, dist_loop)
+    assert stats_np.negative_cycle == stats_loop.negative_cycle is False
+    for i in range(n):
+        for j in range(n):
+            assert reconstruct_path(nxt_np, i, j) == reconstruct_path(nxt_loop, i, j)
+
+
+def test_memmap_accepts_csr_and_restarts_on_damaged_files(tmp_path):
+    n = 30
+    edges = generate_cyclic_with_negative_no_neg_cycles(n=n, density=0.25, seed=5)
+    dist_ref, _, _ = floyd_warshall_numpy(to_cost_matrix(n, edges))
+    workdir = str(tmp_path / "memmap")
+
+    dist, _, _ = floyd_warshall_memmap(to_csr(n, edges), workdir, block_size=8)
+    np.testing.assert_allclose(dist, dist_ref)
+
+    # checkpoint válido, mas dist.f64 truncado: a retomada deve recomeçar do zero
+    del dist
+    with open(os.path.join(workdir, "dist.f64"), "r+b") as f:
+        f.truncate(8)
+    dist, _, _ = floyd_warshall_memmap(to_csr(n, edges), workdir, block_size=8, resume=True)
+    np.testing.assert_allclose(dist, dist_ref)
@@ -0,0 +1,46 @@
+"""Famílias de `graph_families`: forma do grafo e restrição de cada simulação."""
+
+import numpy as np
+import pytest
+
+from fluxo_redes.algorithms.bellman_divide_conquer import topological_levels
+from fluxo_redes.algorithms.bellman_ford_queue import bellman_ford_spfa
+from fluxo_redes.algorithms.floyd_warshall import floyd_warshall_numpy
+from fluxo_redes.graph_families import CONSTRAINTS, FAMILIES, generate_family
+from fluxo_redes.representations import to_cost_matrix, to_csc, to_csr
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("constraint", CONSTRAINTS)
+@pytest.mark.parametrize("n", [0, 1, 2, 50, 300])
+def test_family_shape(family, constraint, n):
+    edges = generate_family(family, n, constraint, seed=11)
+    u, v, w = edges.arrays()
+    assert u.size == v.size == w.size
+    if u.size:
+        assert 0 <= min(u.min(), v.min()) and max(u.max(), v.max()) < n
+    assert not np.any(u == v)
+    assert np.unique(u * max(n, 1) + v).size == u.size
+
+    again = generate_family(family, n, constraint, seed=11)
+    for a, b in zip(edges.arrays(), again.arrays()):
+        np.testing.assert_array_equal(a, b)
+
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("seed", [1, 2])
+def test_family_constraints(family, seed):
+    n = 200
+    dag = generate_family(family, n, "dag", seed=seed)
+    g = to_csc(n, dag)
+    assert sum(level.size for level in topological_levels(g.indptr, g.indices)) == n
+
+    assert np.all(generate_family(family, n, "nonnegative", seed=seed).w >= 0)
+
+    # custos reduzidos por potencial: negativos permitidos, sem ciclo negativo
+    pot = generate_family(family, n, "potential", seed=seed)
+    dist, _, stats = bellman_ford_spfa(to_csr(n, pot), root=0)
+    assert not stats.negative_cycle
+    ref, _, fw_stats = floyd_warshall_numpy(to_cost_matrix(n, pot))
+    assert not fw_stats.negative_cycle
+    np.testing.assert_allclose(dist, ref[0])
@@ -0,0 +1,151 @@
+"""Leitores de `fluxo_redes.importers` sobre pequenos arquivos de exemplo."""
+
+import pytest
+
+from fluxo_redes.algorithms.bellman_ford_queue import bellman_ford_spfa
+from fluxo_redes.algorithms.floyd_warshall import floyd_warshall_numpy
+from fluxo_redes.importers import read_dimacs_gr, read_edge_list, read_graph, read_matrix_market
+from fluxo_redes.representations import csr_to_cost_matrix, to_cost_matrix, to_csr
+
+
+# chunk_bytes minúsculo força linhas cortadas entre blocos
+CHUNKS = [3, 7, 1 << 20]
+
+DIMACS = (
+    "c exemplo\r\n"
+    "p sp 4 5\r\n"
+    "a 1 2 3\r\n"
+    "  c comentário indentado\r\n"
+    "a 2 3 -1.5\r\n"
+    "\r\n"
+    "   \r\n"
+    "a 3 4 2\r\n"
+    "a 4 1 7\r\n"
+    "a 1 3 10"
+)
+DIMACS_ARCS = [(0, 1, 3.0), (1, 2, -1.5), (2, 3, 2.0), (3, 0, 7.0), (0, 2, 10.0)]
+
+MTX_SYMMETRIC = (
+    "%%MatrixMarket matrix coordinate real symmetric\n"
+    "% comentário\n"
+    "\n"
+    "3 3 3\n"
+    "1 1 5\n"
+    "2 1 2.5\n"
+    "\n"
+    "3 2 -1\n"
+)
+
+MTX_PATTERN = (
+    "%%MatrixMarket matrix coordinate pattern general\r\n"
+    "3 3 2\r\n"
+    "1 2\r\n"
+    "  \r\n"
+    "3 1\r\n"
+)
+
+EDGE_LIST = (
+    "# c\n"
+    "0 1 2.5\n"
+    "\n"
+    "1\t2 1\n"
+    "   \n"
+    "  # indentado\n"
+    "% outro\n"
+    "2 0 -1\n"
+)
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+def _arcs(edges):
+    return [(e.u, e.v, e.w) for e in edges]
+
+
+@pytest.mark.parametrize("chunk_bytes", CHUNKS)
+def test_dimacs(tmp_path, chunk_bytes):
+    n, edges = read_dimacs_gr(_write(tmp_path, "g.gr", DIMACS), chunk_bytes=chunk_bytes)
+    assert n == 4
+    assert _arcs(edges) == DIMACS_ARCS
+
+
+@pytest.mark.parametrize("chunk_bytes", CHUNKS)
+def test_matrix_market_symmetric(tmp_path, chunk_bytes):
+    n, edges = read_matrix_market(_write(tmp_path, "g.mtx", MTX_SYMMETRIC), chunk_bytes=chunk_bytes)
+    assert n == 3
+    # diagonal não é espelhada
+    assert _arcs(edges) == [(0, 0, 5.0), (1, 0, 2.5), (2, 1, -1.0), (0, 1, 2.5), (1, 2, -1.0)]
+
+
+@pytest.mark.parametrize("chunk_bytes", CHUNKS)
+def test_matrix_market_pattern(tmp_path, chunk_bytes):
+    n, edges = read_matrix_market(_write(tmp_path, "g.mtx", MTX_PATTERN), chunk_bytes=chunk_bytes)
+    assert n == 3
+    assert _arcs(edges) == [(0, 1, 1.0), (2, 0, 1.0)]
+
+
+@pytest.mark.parametrize("chunk_bytes", CHUNKS)
+def test_edge_list(tmp_path, chunk_bytes):
+    n, edges = read_edge_list(_write(tmp_path, "g.txt", EDGE_LIST), chunk_bytes=chunk_bytes)
+    assert n == 3
+    assert _arcs(edges) == [(0, 1, 2.5), (1, 2, 1.0), (2, 0, -1.0)]
+
+
+def test_edge_list_blank_lines_do_not_shift_columns(tmp_path):
+    path = _write(tmp_path, "g.txt", "# c\n0 1 2.5\n\n1 2 1\n   \n")
+    for chunk_bytes in CHUNKS:
+        _, edges = read_edge_list(path, chunk_bytes=chunk_bytes)
+        assert _arcs(edges) == [(0, 1, 2.5), (1, 2, 1.0)]
+
+
+def test_edge_list_without_weights_one_based(tmp_path):
+    n, edges = read_edge_list(_write(tmp_path, "g.txt", "1 2\n2 6\n"), one_based=True)
+    assert n == 6
+    assert _arcs(edges) == [(0, 1, 1.0), (1, 5, 1.0)]
+
+
+@pytest.mark.parametrize("text", ["0 1 2\n1 2\n3 4 5 6\n", "0 1 2\n1 2 3 4\n", "0 1 x\n", "0 1 é\n", "0\n"])
+def test_edge_list_rejects_inconsistent_columns(tmp_path, text):
+    with pytest.raises(ValueError):
+        read_edge_list(_write(tmp_path, "g.txt", text))
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError):
+        read_dimacs_gr(_write(tmp_path, "a.gr", "a 1 2 3\n"))
+    with pytest.raises(ValueError):
+        read_dimacs_gr(_write(tmp_path, "b.gr", "p sp 2 1\na 1 3 1\n"))
+    with pytest.raises(ValueError):
+        read_matrix_market(_write(tmp_path, "c.mtx", "%%MatrixMarket matrix array real general\n2 2\n1\n2\n3\n4\n"))
+    with pytest.raises(ValueError):
+        read_matrix_market(_write(tmp_path, "d.mtx", "%%MatrixMarket matrix coordinate real general\n2 2 2\n1 2 1\n"))
+
+
+def test_read_graph_by_extension(tmp_path):
+    n, edges = read_graph(_write(tmp_path, "g.gr", DIMACS))
+    g = to_csr(n, edges)
+    assert g.indptr.tolist() == [0, 2, 3, 4, 5]
+    assert read_graph(_write(tmp_path, "g.mtx", MTX_PATTERN))[0] == 3
+    assert read_graph(_write(tmp_path, "g.edges", EDGE_LIST))[0] == 3
+
+
+def test_cost_matrix_of_imported_graph_keeps_cheapest_arc(tmp_path):
+    # arco paralelo mais caro depois do barato e laço positivo em 1
+    text = "p sp 3 4\na 1 2 1\na 1 2 5\na 2 3 1\na 1 1 3\n"
+    n, edges = read_dimacs_gr(_write(tmp_path, "g.gr", text))
+    spfa, _, _ = bellman_ford_spfa(to_csr(n, edges), 0)
+    assert spfa == [0.0, 1.0, 2.0]
+    for mat in (to_cost_matrix(n, edges), to_cost_matrix(n, edges.to_edges()), csr_to_cost_matrix(to_csr(n, edges))):
+        dist, _, stats = floyd_warshall_numpy(mat)
+        assert dist[0].tolist() == spfa
+        assert not stats.negative_cycle
+
+
+def test_cost_matrix_negative_self_loop_is_negative_cycle(tmp_path):
+    n, edges = read_dimacs_gr(_write(tmp_path, "g.gr", "p sp 2 2\na 1 2 1\na 2 2 -1\n"))
+    assert to_cost_matrix(n, edges)[1, 1] == -1.0
+    assert floyd_warshall_numpy(to_cost_matrix(n, edges))[2].negative_cycle
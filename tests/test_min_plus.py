@@ -0,0 +1,59 @@
+"""Caminhos mínimos por produtos min-plus contra `floyd_warshall_numpy`."""
+
+import numpy as np
+import pytest
+
+from fluxo_redes.algorithms.floyd_warshall import floyd_warshall_numpy, reconstruct_path
+from fluxo_redes.algorithms.min_plus import min_plus_apsp
+from fluxo_redes.graph_generators import (
+    generate_cyclic_nonnegative,
+    generate_cyclic_with_negative_no_neg_cycles,
+    generate_dag_negative_costs,
+)
+from fluxo_redes.representations import to_cost_matrix, to_csr
+
+
+GENERATORS = [
+    generate_dag_negative_costs,
+    generate_cyclic_nonnegative,
+    generate_cyclic_with_negative_no_neg_cycles,
+]
+
+
+@pytest.mark.parametrize("gen", GENERATORS)
+@pytest.mark.parametrize("n,density,seed", [(10, 0.25, 1), (40, 0.25, 7), (70, 0.05, 3)])
+@pytest.mark.parametrize("block_size", [8, 64])
+def test_min_plus_matches_floyd(gen, n, density, seed, block_size):
+    edges = gen(n=n, density=density, seed=seed)
+    mat = to_cost_matrix(n, edges)
+    ref, _, _ = floyd_warshall_numpy(mat)
+
+    dist, nxt, stats = min_plus_apsp(mat, block_size=block_size)
+    np.testing.assert_allclose(dist, ref)
+    assert not stats.negative_cycle
+    np.testing.assert_allclose(min_plus_apsp(to_csr(n, edges), block_size=block_size)[0], ref)
+    # em empates o caminho pode diferir do Floyd, mas o custo não
+    for j in range(n):
+        path = reconstruct_path(nxt, 0, j)
+        if np.isfinite(ref[0, j]):
+            assert path[0] == 0 and path[-1] == j
+            assert sum(mat[a, b] for a, b in zip(path, path[1:])) == pytest.approx(ref[0, j])
+        else:
+            assert path == []
+
+
+def test_max_products_limits_arcs():
+    n = 30
+    mat = to_cost_matrix(n, generate_cyclic_with_negative_no_neg_cycles(n=n, density=0.1, seed=2))
+    # D^2: no máximo 2 arcos
+    expected = np.minimum(mat, (mat[:, :, None] + mat[None, :, :]).min(axis=1))
+    dist, _, stats = min_plus_apsp(mat, max_products=1)
+    assert stats.products == 1
+    np.testing.assert_allclose(dist, expected)
+
+
+def test_negative_cycle():
+    mat = np.full((3, 3), np.inf)
+    np.fill_diagonal(mat, 0.0)
+    mat[0, 1], mat[1, 2], mat[2, 1] = 1.0, 1.0, -3.0
+    assert min_plus_apsp(mat)[2].negative_cycle
@@ -0,0 +1,69 @@
+"""Consultas ponto a ponto (bidirecional, ALT, contraction hierarchies) contra `dijkstra_heap`."""
+
+import pytest
+
+from fluxo_redes.algorithms.alt import LANDMARK_STRATEGIES, alt_query, build_alt_index
+from fluxo_redes.algorithms.contraction_hierarchies import build_ch, ch_query, load_ch, save_ch
+from fluxo_redes.algorithms.dijkstra_heap import dijkstra_heap
+from fluxo_redes.algorithms.point_to_point import bidirectional_dijkstra, dijkstra_query
+from fluxo_redes.graph_generators import generate_cyclic_nonnegative
+from fluxo_redes.representations import to_csc, to_csr, to_predecessor_list, to_successor_list
+
+
+CASES = [(10, 0.25, 1), (60, 0.1, 7), (150, 0.03, 3)]
+
+
+def _graphs(n, density, seed):
+    edges = generate_cyclic_nonnegative(n=n, density=density, seed=seed)
+    return [
+        (to_successor_list(n, edges), to_predecessor_list(n, edges)),
+        (to_csr(n, edges), to_csc(n, edges)),
+    ]
+
+
+def _path_cost(succs, path):
+    cost = 0.0
+    for a, b in zip(path, path[1:]):
+        cost += min(w for v, w in succs[a] if v == b)
+    return cost
+
+
+def _check(result, succs, ref, target):
+    assert result.distance == pytest.approx(ref[target])
+    if ref[target] == float("inf"):
+        assert result.path == []
+    else:
+        assert result.path[0] == result.source and result.path[-1] == target
+        assert _path_cost(succs, result.path) == pytest.approx(ref[target])
+
+
+@pytest.mark.parametrize("n,density,seed", CASES)
+def test_dijkstra_query_and_bidirectional(n, density, seed):
+    for succs, preds in _graphs(n, density, seed):
+        ref, _, _ = dijkstra_heap(succs, root=0)
+        for t in range(n):
+            _check(dijkstra_query(succs, 0, t), succs, ref, t)
+            _check(bidirectional_dijkstra(succs, preds, 0, t), succs, ref, t)
+
+
+@pytest.mark.parametrize("n,density,seed", CASES)
+@pytest.mark.parametrize("strategy", LANDMARK_STRATEGIES)
+def test_alt(n, density, seed, strategy):
+    for succs, preds in _graphs(n, density, seed):
+        ref, _, _ = dijkstra_heap(succs, root=0)
+        index = build_alt_index(succs, preds, k=min(4, n), strategy=strategy, seed=seed)
+        for t in range(n):
+            _check(alt_query(index, succs, 0, t), succs, ref, t)
+
+
+@pytest.mark.parametrize("n,density,seed", CASES)
+def test_contraction_hierarchies(n, density, seed, tmp_path):
+    for succs, _ in _graphs(n, density, seed):
+        index, _ = build_ch(succs)
+        save_ch(index, str(tmp_path / "ch.npz"))
+        loaded = load_ch(str(tmp_path / "ch.npz"))
+        for s in (0, n // 2):
+            ref, _, _ = dijkstra_heap(succs, root=s)
+            for t in range(n):
+                _check(ch_query(index, s, t), succs, ref, t)
+                assert ch_query(loaded, s, t).distance == pytest.approx(ref[t])
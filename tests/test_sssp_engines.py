@@ -0,0 +1,128 @@
+"""Engines de origem única contra as referências `dijkstra_heap` e `bellman_ford_spfa`."""
+
+import random
+
+import numpy as np
+import pytest
+
+from fluxo_redes.algorithms.bellman_ford_queue import bellman_ford_spfa
+from fluxo_redes.algorithms.delta_stepping import delta_stepping
+from fluxo_redes.algorithms.dijkstra_buckets import dijkstra_dial, dijkstra_radix
+from fluxo_redes.algorithms.dijkstra_heap import dijkstra_heap
+from fluxo_redes.algorithms.dynamic import DynamicSSSP, floyd_update_edge
+from fluxo_redes.algorithms.floyd_warshall import floyd_warshall, floyd_warshall_numpy
+from fluxo_redes.algorithms.priority_queues import QUEUE_BACKENDS
+from fluxo_redes.algorithms.scc_hybrid import shortest_paths_scc
+from fluxo_redes.graph_generators import (
+    Edge,
+    generate_cyclic_nonnegative,
+    generate_cyclic_with_negative_no_neg_cycles,
+    generate_dag_negative_costs,
+)
+from fluxo_redes.representations import to_cost_matrix, to_csr, to_successor_list
+
+
+CASES = [(10, 0.25, 1), (80, 0.1, 7), (200, 0.03, 3)]
+
+GENERATORS = [
+    generate_dag_negative_costs,
+    generate_cyclic_nonnegative,
+    generate_cyclic_with_negative_no_neg_cycles,
+]
+
+
+def _representations(n, edges):
+    return [to_successor_list(n, edges), to_csr(n, edges)]
+
+
+@pytest.mark.parametrize("n,density,seed", CASES)
+@pytest.mark.parametrize("queue", QUEUE_BACKENDS)
+@pytest.mark.parametrize("arity", [2, 4])
+def test_dijkstra_queues(n, density, seed, queue, arity):
+    edges = generate_cyclic_nonnegative(n=n, density=density, seed=seed)
+    for succs in _representations(n, edges):
+        ref, _, _ = dijkstra_heap(succs, root=0)
+        dist, pred, _ = dijkstra_heap(succs, root=0, queue=queue, arity=arity)
+        assert dist == ref
+        for v in range(1, n):
+            assert (pred[v] is None) == (dist[v] == float("inf"))
+
+
+@pytest.mark.parametrize("n,density,seed", CASES)
+@pytest.mark.parametrize("engine", [dijkstra_dial, dijkstra_radix])
+def test_integer_bucket_engines(n, density, seed, engine):
+    edges = generate_cyclic_nonnegative(n=n, density=density, seed=seed)
+    for succs in _representations(n, edges):
+        ref, _, _ = dijkstra_heap(succs, root=0)
+        dist, _, _ = engine(succs, root=0)
+        assert dist == ref
+
+
+def test_integer_bucket_engines_reject_fractional_costs():
+    succs = [[(1, 0.5)], []]
+    for engine in (dijkstra_dial, dijkstra_radix):
+        with pytest.raises(ValueError):
+            engine(succs, root=0)
+
+
+@pytest.mark.parametrize("n,density,seed", CASES)
+@pytest.mark.parametrize("delta", [None, 1.0, 50.0])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_delta_stepping(n, density, seed, delta, workers):
+    edges = generate_cyclic_nonnegative(n=n, density=density, seed=seed)
+    for succs in _representations(n, edges):
+        ref, _, _ = dijkstra_heap(succs, root=0)
+        dist, _, _ = delta_stepping(succs, root=0, delta=delta, workers=workers)
+        np.testing.assert_allclose(dist, ref)
+
+
+@pytest.mark.parametrize("gen", GENERATORS)
+@pytest.mark.parametrize("n,density,seed", CASES)
+def test_scc_hybrid(gen, n, density, seed):
+    edges = gen(n=n, density=density, seed=seed)
+    for succs in _representations(n, edges):
+        ref, _, ref_stats = bellman_ford_spfa(succs, root=0)
+        dist, _, stats = shortest_paths_scc(succs, root=0)
+        np.testing.assert_allclose(dist, ref)
+        assert stats.negative_cycle == ref_stats.negative_cycle is False
+        assert stats.reachable == sum(d < float("inf") for d in ref)
+
+
+def test_scc_hybrid_detects_negative_cycle():
+    succs = [[(1, 1.0)], [(2, 1.0)], [(1, -3.0), (3, 1.0)], []]
+    assert bellman_ford_spfa(succs, root=0)[2].negative_cycle
+    assert shortest_paths_scc(succs, root=0)[2].negative_cycle
+
+
+@pytest.mark.parametrize("n,density,seed", CASES)
+def test_dynamic_repair_matches_recomputation(n, density, seed):
+    edges = generate_cyclic_nonnegative(n=n, density=density, seed=seed)
+    rnd = random.Random(seed)
+    for succs in _representations(n, edges):
+        dist, pred, _ = dijkstra_heap(succs, root=0)
+        dyn = DynamicSSSP(succs, dist, pred, root=0)
+        for _ in range(60):
+            u, v = rnd.randrange(n), rnd.randrange(n)
+            dyn.update(u, v, None if rnd.random() < 0.3 else rnd.randint(1, 30))
+            ref, _, _ = dijkstra_heap(dyn.successors(), root=0)
+            np.testing.assert_allclose(dyn.dist, ref)
+
+
+@pytest.mark.parametrize("n,density,seed", CASES[:2])
+def test_floyd_update_edge_matches_recomputation(n, density, seed):
+    edges = generate_cyclic_with_negative_no_neg_cycles(n=n, density=density, seed=seed)
+    dist, nxt, _ = floyd_warshall(to_cost_matrix(n, edges))
+    rnd = random.Random(seed)
+    current = {(e.u, e.v): e.w for e in edges}
+    for _ in range(20):
+        u, v = rnd.randrange(n), rnd.randrange(n)
+        if u == v:
+            continue
+        # só reduções/inserções, sem criar ciclo negativo
+        w = max(current.get((u, v), 30.0) - rnd.randint(1, 10), -dist[v, u] + 1)
+        if w >= current.get((u, v), float("inf")):
+            continue
+        current[(u, v)] = w
+        assert not floyd_update_edge(dist, nxt, u, v, w).negative_cycle
+        ref, _, _ = floyd_warshall_numpy(to_cost_matrix(n, [Edge(a, b, c) for (a, b), c in current.items()]))
+        np.testing.assert_allclose(dist, ref)